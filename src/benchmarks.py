@@ -0,0 +1,253 @@
+import io
+import time
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+from urllib.parse import urljoin
+
+from prettytable import PrettyTable
+from requests_cache import CachedSession
+
+from cache_serializer import (
+    COMPRESSION_CHOICES, compressing_serializer, stored_sizes, zstandard
+)
+from configs import configure_benchmark_parser
+from constants import PEP_MAIN_URL
+from mock_server import (
+    MockSiteAdapter, MockSiteConfig, MockSiteServer, pep_number_width
+)
+from outputs import output_rows, pretty_output
+from page_store import PageStore
+from table_renderer import render_table
+from tables import ResultTable
+from utils import get_soup
+
+BENCHMARK_HEADER = (
+    'Вариант', 'Время, с', 'Пиковая память, МБ', 'Первая строка, мс'
+)
+
+
+class FirstWriteBuffer(io.StringIO):
+    """Буфер, запоминающий момент первой записи."""
+
+    def write(self, text: str) -> int:
+        if not hasattr(self, 'first_write'):
+            self.first_write = time.perf_counter()
+        return super().write(text)
+
+
+def measure(
+        name: str, run: Callable[[io.StringIO], None], repeat: int
+) -> tuple:
+    """
+    Измеряет время работы, пиковое потребление памяти и задержку
+    до первой выведенной строки.
+
+    :param name: Название варианта.
+    :param run: Функция, выводящая результат в переданный буфер.
+    :param repeat: Количество повторов; берётся лучшее время.
+
+    :returns: tuple: Строка таблицы с результатами измерений.
+    """
+    best = first_line = float('inf')
+    for _ in range(repeat):
+        buffer = FirstWriteBuffer()
+        started = time.perf_counter()
+        run(buffer)
+        elapsed = time.perf_counter() - started
+        best = min(best, elapsed)
+        first_line = min(first_line, buffer.first_write - started)
+    tracemalloc.start()
+    run(io.StringIO())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (
+        name, f'{best:.3f}', f'{peak / 1_000_000:.1f}',
+        f'{first_line * 1000:.1f}'
+    )
+
+
+def generate_table(rows: int) -> ResultTable:
+    """Генерирует таблицу, похожую на результаты режима whats-new."""
+    return ResultTable(
+        ('Ссылка на статью', 'Заголовок', 'Редактор, Автор'),
+        (
+            (f'https://docs.python.org/3/whatsnew/{number}.html',
+             f'What’s New In Python {number}',
+             'Editor: Jane Doe ' * (number % 4 + 1))
+            for number in range(rows)
+        )
+    )
+
+
+def benchmark_tables(cli_args: Namespace) -> ResultTable:
+    """
+    Сравнивает вывод таблицы через PrettyTable и через потоковый
+    table_renderer.
+
+    :param cli_args: Аргументы командной строки: количество строк
+     и повторов.
+
+    :returns: ResultTable: Результаты измерений для каждого варианта.
+    """
+    table = generate_table(cli_args.rows)
+
+    def prettytable(buffer: io.StringIO) -> None:
+        pretty = PrettyTable()
+        pretty.field_names = table.header
+        pretty.align = 'l'
+        pretty.add_rows(list(table.iter_rows()))
+        buffer.write(pretty.get_string() + '\n')
+
+    def streaming(buffer: io.StringIO) -> None:
+        for line in render_table(table.header, table.iter_rows(), 1000):
+            buffer.write(line + '\n')
+
+    def exact(buffer: io.StringIO) -> None:
+        for line in render_table(table.header, output_rows(table)):
+            buffer.write(line + '\n')
+
+    return ResultTable(BENCHMARK_HEADER, [
+        measure('PrettyTable', prettytable, cli_args.repeat),
+        measure('table_renderer', exact, cli_args.repeat),
+        measure('table_renderer, выборка 1000 строк', streaming,
+                cli_args.repeat),
+    ])
+
+
+def fetch_all(session: CachedSession, urls: list[str]) -> float:
+    """Загружает все страницы и возвращает затраченное время."""
+    started = time.perf_counter()
+    for url in urls:
+        session.get(url).content
+    return time.perf_counter() - started
+
+
+def benchmark_cache(cli_args: Namespace) -> ResultTable:
+    """
+    Сравнивает алгоритмы сжатия кеша: время холодного запуска
+    (страницы загружаются и сжимаются), тёплого запуска (страницы
+    читаются из кеша и распаковываются) и объём файла кеша.
+
+    :param cli_args: Аргументы командной строки: количество и размер
+     страниц и уровень сжатия.
+
+    :returns: ResultTable: Результаты измерений для каждого алгоритма.
+    """
+    config = MockSiteConfig(peps=cli_args.pages, page_size=cli_args.page_size)
+    width = pep_number_width(config)
+    urls = [
+        urljoin(PEP_MAIN_URL, f'pep-{number:0{width}d}/')
+        for number in range(config.peps)
+    ]
+    results = ResultTable((
+        'Сжатие', 'Холодный запуск, с', 'Тёплый запуск, с',
+        'Без сжатия, МБ', 'Файл кеша, МБ'
+    ))
+    with MockSiteServer(config) as server, TemporaryDirectory() as tmp:
+        for codec in COMPRESSION_CHOICES:
+            if codec == 'zstd' and zstandard is None:
+                continue
+            cache_path = Path(tmp) / f'cache_{codec}.sqlite'
+            session = CachedSession(
+                str(cache_path), serializer=compressing_serializer(
+                    codec, cli_args.level
+                )
+            )
+            session.mount('https://', MockSiteAdapter(server.url))
+            cold = fetch_all(session, urls)
+            warm = fetch_all(session, urls)
+            sizes = stored_sizes(session)
+            session.close()
+            results.append((
+                codec, f'{cold:.2f}', f'{warm:.2f}',
+                f'{sizes["raw"] / 1_000_000:.1f}',
+                f'{cache_path.stat().st_size / 1_000_000:.1f}'
+            ))
+    return results
+
+
+def parse_all(session: CachedSession, urls: list[str]) -> float:
+    """Разбирает все страницы и возвращает затраченное время."""
+    started = time.perf_counter()
+    for url in urls:
+        get_soup(session, url).decompose()
+    return time.perf_counter() - started
+
+
+def benchmark_pages(cli_args: Namespace) -> ResultTable:
+    """
+    Сравнивает чтение страниц для разбора из кеша ответов SQLite
+    и из хранилища страниц с адресацией по содержимому: время холодного
+    и тёплого запуска и объём данных на диске — отдельно для кеша
+    ответов и хранилища страниц и суммарно.
+
+    Каждая страница дополнительно запрашивается по --duplicates адресам
+    с другим query-параметром, чтобы показать хранение одинаковых
+    страниц.
+
+    :param cli_args: Аргументы командной строки: количество, размер
+     и число дубликатов страниц.
+
+    :returns: ResultTable: Результаты измерений для каждого варианта.
+    """
+    config = MockSiteConfig(peps=cli_args.pages, page_size=cli_args.page_size)
+    width = pep_number_width(config)
+    urls = [
+        urljoin(PEP_MAIN_URL, f'pep-{number:0{width}d}/{query}')
+        for copy in range(cli_args.duplicates + 1)
+        for query in [f'?copy={copy}' if copy else '']
+        for number in range(config.peps)
+    ]
+    results = ResultTable((
+        'Хранение', 'Холодный запуск, с', 'Тёплый запуск, с', 'Файлов',
+        'Кеш ответов, МБ', 'Хранилище страниц, МБ', 'На диске, МБ'
+    ))
+    with MockSiteServer(config) as server, TemporaryDirectory() as tmp:
+        variants = (
+            ('SQLite', None), ('Хранилище страниц', Path(tmp) / 'pages')
+        )
+        for name, store_dir in variants:
+            cache_path = Path(tmp) / f'cache_{store_dir is None}.sqlite'
+            session = CachedSession(str(cache_path))
+            session.mount('https://', MockSiteAdapter(server.url))
+            session.page_store = store_dir and PageStore(store_dir)
+            cold = parse_all(session, urls)
+            warm = parse_all(session, urls)
+            files, store_size = stored_sizes(session)['entries'], 0
+            if session.page_store is not None:
+                stats = session.page_store.stats()
+                files, store_size = stats['objects'], stats['bytes']
+                session.page_store.close()
+            session.close()
+            cache_size = cache_path.stat().st_size
+            results.append((
+                name, f'{cold:.2f}', f'{warm:.2f}', str(files),
+                *(f'{size / 1_000_000:.1f}' for size in (
+                    cache_size, store_size, cache_size + store_size
+                ))
+            ))
+    return results
+
+
+BENCHMARKS = {
+    'tables': benchmark_tables,
+    'cache': benchmark_cache,
+    'pages': benchmark_pages,
+}
+
+
+def main() -> None:
+    """
+    Запускает указанный бенчмарк и выводит результаты измерений.
+
+    :returns: None
+    """
+    args = configure_benchmark_parser().parse_args()
+    pretty_output(BENCHMARKS[args.benchmark](args), args)
+
+
+if __name__ == '__main__':
+    main()
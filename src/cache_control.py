@@ -0,0 +1,195 @@
+import argparse
+import json
+import logging
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from fnmatch import translate
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from requests_cache import CachedSession, Response
+
+from checkpoints import atomic_write
+from constants import CACHE_SCOPES, Literals
+
+AGE_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days',
+             'w': 'weeks'}
+REGEX_PREFIX = 're:'
+
+
+class CacheUsage:
+    """Потокобезопасный счётчик попаданий и промахов кеша за запуск."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def record(self, response: Response) -> None:
+        """Учитывает ответ, полученный из кеша или из сети."""
+        with self.lock:
+            if getattr(response, 'from_cache', False):
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+CACHE_USAGE = CacheUsage()
+
+
+def parse_age(value: str) -> timedelta:
+    """
+    Преобразует строку вида "30m", "6h" или "2d" в timedelta.
+
+    :param value: Возраст с суффиксом единицы измерения (s, m, h, d, w).
+
+    :returns: timedelta: Соответствующий промежуток времени.
+    :raises ArgumentTypeError: Если строка не распознана.
+    """
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([smhdw])', value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(
+            Literals.INVALID_CACHE_AGE.format(value)
+        )
+    amount, unit = match.groups()
+    return timedelta(**{AGE_UNITS[unit]: float(amount)})
+
+
+def compile_patterns(patterns: Iterable[str]) -> list[re.Pattern]:
+    """
+    Компилирует шаблоны URL для инвалидации кеша.
+
+    Шаблон может быть названием режима парсера, регулярным выражением
+    с префиксом "re:" или glob-шаблоном. Glob-шаблон без схемы
+    сравнивается с URL без "https://".
+
+    :param patterns: Список шаблонов.
+
+    :returns: list[re.Pattern]: Скомпилированные регулярные выражения.
+    """
+    compiled = []
+    for pattern in patterns:
+        if pattern.startswith(REGEX_PREFIX):
+            compiled.append(re.compile(pattern[len(REGEX_PREFIX):]))
+            continue
+        for glob in CACHE_SCOPES.get(pattern, (pattern,)):
+            if '://' not in glob:
+                glob = '*://' + glob
+            compiled.append(re.compile(translate(glob)))
+    return compiled
+
+
+def is_older(created_at: datetime, older_than: timedelta) -> bool:
+    """Проверяет, что запись кеша старше указанного возраста."""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - created_at > older_than
+
+
+def invalidate_cache(
+        session: CachedSession,
+        patterns: Optional[list[str]] = None,
+        older_than: Optional[timedelta] = None
+) -> int:
+    """
+    Удаляет из кеша записи, подходящие под шаблоны URL и/или возраст.
+
+    Если заданы и шаблоны, и возраст, удаляются только записи,
+    удовлетворяющие обоим условиям.
+
+    :param session: CachedSession - сессия, кеш которой очищается.
+    :param patterns: Шаблоны URL, названия режимов или регулярные выражения.
+    :param older_than: Минимальный возраст удаляемых записей.
+
+    :returns: int: Количество удалённых записей.
+    """
+    compiled = compile_patterns(patterns or ())
+    keys = [
+        response.cache_key
+        for response in session.cache.filter(valid=True, expired=True)
+        if (
+            (not compiled or any(
+                pattern.search(response.url) for pattern in compiled
+            ))
+            and (older_than is None or is_older(
+                response.created_at, older_than
+            ))
+        )
+    ]
+    if keys:
+        session.cache.delete(*keys)
+    logging.info(Literals.CACHE_INVALIDATED.format(len(keys)))
+    return len(keys)
+
+
+def url_prefix(url: str) -> str:
+    """
+    Возвращает префикс URL для группировки записей кеша.
+
+    В префикс входят хост и каталоги пути, не глубже двух уровней;
+    номера в названиях каталогов заменяются на "*", поэтому
+    все страницы PEP попадают в одну группу.
+
+    :param url: URL записи кеша.
+
+    :returns: str: Префикс вида "peps.python.org/pep-*/".
+    """
+    parts = urlsplit(url)
+    directories = parts.path.split('/')[1:-1][:2]
+    directories = [
+        re.sub(r'\d+', '*', directory)
+        if re.search('[a-zA-Z]', directory) else directory
+        for directory in directories
+    ]
+    return '/'.join((parts.netloc, *directories, ''))
+
+
+def collect_cache_stats(session: CachedSession) -> dict[str, list[int]]:
+    """
+    Подсчитывает количество записей и объём кеша по префиксам URL.
+
+    :param session: CachedSession - сессия, кеш которой анализируется.
+
+    :returns: dict[str, list[int]]: Префикс и пара (записей, байт).
+    """
+    stats = defaultdict(lambda: [0, 0])
+    for response in session.cache.filter(valid=True, expired=True):
+        prefix_stats = stats[url_prefix(response.url)]
+        prefix_stats[0] += 1
+        prefix_stats[1] += response.size
+    return dict(sorted(stats.items()))
+
+
+def load_cache_usage(path: Path) -> dict[str, int]:
+    """
+    Загружает накопленную статистику попаданий в кеш.
+
+    :param path: Путь к файлу статистики.
+
+    :returns: dict[str, int]: Количество попаданий и промахов.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {'hits': 0, 'misses': 0}
+
+
+def save_cache_usage(path: Path, usage: CacheUsage = CACHE_USAGE) -> None:
+    """
+    Добавляет статистику попаданий в кеш за запуск к накопленной.
+
+    :param path: Путь к файлу статистики.
+    :param usage: Счётчик попаданий и промахов за текущий запуск.
+
+    :returns: None
+    """
+    if not usage.hits and not usage.misses:
+        return
+    totals = load_cache_usage(path)
+    totals['hits'] += usage.hits
+    totals['misses'] += usage.misses
+    atomic_write(path, json.dumps(totals))
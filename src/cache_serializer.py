@@ -0,0 +1,163 @@
+import gzip
+import struct
+import zlib
+from typing import Optional
+
+from requests_cache import CachedSession
+from requests_cache.serializers import SerializerPipeline
+from requests_cache.serializers.preconf import pickle_serializer
+
+from constants import Literals
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+NO_COMPRESSION = 'none'
+FRAME = struct.Struct('>2sBI')
+FRAME_MAGIC = b'\xfeZ'
+CODECS = {
+    'zlib': (
+        1,
+        lambda data, level: zlib.compress(data, level),
+        zlib.decompress
+    ),
+    'gzip': (
+        2,
+        lambda data, level: gzip.compress(data, level, mtime=0),
+        gzip.decompress
+    ),
+    'zstd': (
+        3,
+        lambda data, level: zstandard.ZstdCompressor(level).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data)
+    ),
+}
+CODEC_IDS = {codec_id: name for name, (codec_id, *_) in CODECS.items()}
+COMPRESSION_CHOICES = (NO_COMPRESSION, *CODECS)
+DEFAULT_LEVELS = {'zlib': 6, 'gzip': 6, 'zstd': 3}
+
+
+def frame_info(data: bytes) -> Optional[tuple[str, int]]:
+    """
+    Читает заголовок сжатой записи кеша.
+
+    :param data: Запись кеша в том виде, в котором она хранится.
+
+    :returns: Optional[tuple[str, int]]: Алгоритм сжатия и размер записи
+     до сжатия или None, если запись не сжата.
+    """
+    if len(data) < FRAME.size or not data.startswith(FRAME_MAGIC):
+        return None
+    _, codec_id, raw_size = FRAME.unpack_from(data)
+    return CODEC_IDS[codec_id], raw_size
+
+
+class CompressionStage:
+    """
+    Этап сериализации, сжимающий записи кеша.
+
+    Сжатая запись начинается с заголовка FRAME: сигнатуры, алгоритма
+    сжатия и размера записи до сжатия. Записи без заголовка, сохранённые
+    до включения сжатия, читаются без изменений, а сжатые записи
+    читаются независимо от текущей настройки сжатия.
+    """
+
+    def __init__(
+            self, codec: str = NO_COMPRESSION, level: Optional[int] = None
+    ) -> None:
+        if codec == 'zstd' and zstandard is None:
+            raise ImportError(Literals.ZSTANDARD_REQUIRED)
+        self.codec = codec
+        self.level = DEFAULT_LEVELS.get(codec) if level is None else level
+
+    def dumps(self, data: bytes) -> bytes:
+        """Сжимает запись кеша."""
+        if self.codec == NO_COMPRESSION:
+            return data
+        codec_id, compress, _ = CODECS[self.codec]
+        return FRAME.pack(FRAME_MAGIC, codec_id, len(data)) + compress(
+            data, self.level
+        )
+
+    def loads(self, data: bytes) -> bytes:
+        """Распаковывает запись кеша, если она была сжата."""
+        info = frame_info(data)
+        if info is None:
+            return data
+        codec, _ = info
+        if codec == 'zstd' and zstandard is None:
+            raise ImportError(Literals.ZSTANDARD_REQUIRED)
+        return CODECS[codec][2](memoryview(data)[FRAME.size:])
+
+    def copy(self) -> 'CompressionStage':
+        return CompressionStage(self.codec, self.level)
+
+
+class CompressingSerializer(SerializerPipeline):
+    """
+    Сериализатор кеша на основе pickle со сжатием записей.
+
+    requests_cache включает строковое представление сериализатора
+    в ключ кеша, поэтому оно совпадает с pickle_serializer: записи,
+    сохранённые без сжатия или с другим алгоритмом, остаются доступны.
+    """
+
+    def copy(self) -> 'CompressingSerializer':
+        return CompressingSerializer(
+            [stage.copy() for stage in self.stages],
+            name=self.name,
+            is_binary=self.is_binary
+        )
+
+    def __str__(self) -> str:
+        return str(pickle_serializer)
+
+
+def compressing_serializer(
+        codec: str = NO_COMPRESSION, level: Optional[int] = None
+) -> CompressingSerializer:
+    """
+    Создаёт сериализатор кеша на основе pickle со сжатием записей.
+
+    :param codec: Алгоритм сжатия из COMPRESSION_CHOICES.
+    :param level: Уровень сжатия; None — уровень по умолчанию.
+
+    :returns: CompressingSerializer: Сериализатор для CachedSession.
+    """
+    return CompressingSerializer(
+        [*pickle_serializer.stages, CompressionStage(codec, level)],
+        name=pickle_serializer.name,
+        is_binary=True
+    )
+
+
+def stored_sizes(session: CachedSession) -> Optional[dict[str, int]]:
+    """
+    Подсчитывает объём записей кеша до и после сжатия.
+
+    Размер записи до сжатия берётся из её заголовка, поэтому
+    записи не распаковываются и не считываются целиком.
+
+    :param session: CachedSession - сессия с кешем в SQLite.
+
+    :returns: Optional[dict[str, int]]: Количество записей, количество
+     сжатых записей, объём до сжатия и объём в кеше, или None,
+     если кеш хранится не в SQLite.
+    """
+    responses = session.cache.responses
+    if not hasattr(responses, 'connection'):
+        return None
+    sizes = {'entries': 0, 'compressed': 0, 'raw': 0, 'stored': 0}
+    with responses.connection() as connection:
+        for size, header in connection.execute(
+            f'SELECT length(value), substr(value, 1, {FRAME.size}) '
+            f'FROM {responses.table_name}'
+        ):
+            info = frame_info(header)
+            sizes['entries'] += 1
+            sizes['stored'] += size
+            sizes['raw'] += size if info is None else info[1]
+            sizes['compressed'] += info is not None
+    return sizes
@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from constants import PathConstants
+
+
+def get_checkpoint_path(base_dir: Path, mode: str) -> Path:
+    """
+    Возвращает путь к файлу контрольной точки для режима парсера.
+
+    :param base_dir: Базовый каталог приложения.
+    :param mode: Режим работы парсера.
+
+    :returns: Path: Путь к файлу контрольной точки.
+    """
+    return base_dir / PathConstants.CHECKPOINTS_DIR / f'{mode}.json'
+
+
+def atomic_write(
+        path: Path, data: Union[str, bytes], encoding: str = 'utf-8'
+) -> None:
+    """
+    Атомарно записывает данные в файл.
+
+    Данные сначала пишутся во временный файл в том же каталоге,
+    который затем подменяет целевой файл через os.replace. Поэтому
+    при аварийном завершении на диске остаётся либо старая,
+    либо новая версия файла, но никогда не частично записанная.
+
+    :param path: Путь к целевому файлу.
+    :param data: Записываемые данные: текст или байты.
+    :param encoding: Кодировка файла для текстовых данных.
+
+    :returns: None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp'
+    )
+    try:
+        binary = isinstance(data, bytes)
+        with os.fdopen(
+            descriptor, 'wb' if binary else 'w',
+            encoding=None if binary else encoding
+        ) as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def save_checkpoint(path: Path, state: dict) -> None:
+    """
+    Сохраняет состояние парсера в контрольную точку.
+
+    :param path: Путь к файлу контрольной точки.
+    :param state: Сериализуемое в JSON состояние парсера.
+
+    :returns: None
+    """
+    atomic_write(path, json.dumps(state, ensure_ascii=False))
+
+
+def load_checkpoint(path: Path) -> Optional[dict]:
+    """
+    Загружает состояние парсера из контрольной точки.
+
+    :param path: Путь к файлу контрольной точки.
+
+    :returns: Optional[dict]: Сохранённое состояние или None,
+    если контрольной точки нет.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def remove_checkpoint(path: Path) -> None:
+    """
+    Удаляет контрольную точку после успешного завершения работы.
+
+    :param path: Путь к файлу контрольной точки.
+
+    :returns: None
+    """
+    path.unlink(missing_ok=True)
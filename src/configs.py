@@ -1,10 +1,20 @@
 import argparse
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import signal
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 
 from requests_cache import CachedSession
 
-from constants import PathConstants, UtilityConstants
+from cache_control import parse_age
+from cache_serializer import COMPRESSION_CHOICES, NO_COMPRESSION
+from constants import Literals, PathConstants, UtilityConstants
+from memory import parse_size
+from metadata_store import METADATA_COLUMNS
 
 
 def configure_argument_parser(
@@ -39,17 +49,361 @@ def configure_argument_parser(
         ),
         help='Дополнительные способы вывода данных'
     )
+    parser.add_argument(
+        '--delta',
+        action='store_true',
+        help='Выводить только изменения с предыдущего запуска: '
+             'добавленные, удалённые и изменившиеся строки'
+    )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Загрузить все статьи "What\'s new", а не только новые '
+             'и две новейшие'
+    )
+    parser.add_argument(
+        '--table-sample',
+        type=int,
+        metavar='ROWS',
+        help='Вычислять ширину столбцов таблицы по первым ROWS строкам '
+             'и обрезать не помещающиеся значения'
+    )
+    parser.add_argument(
+        '--no-pager',
+        action='store_true',
+        help='Не открывать длинные таблицы в pager'
+    )
+    parser.add_argument(
+        '--cache-compression',
+        choices=COMPRESSION_CHOICES,
+        default=NO_COMPRESSION,
+        help='Сжатие новых записей кеша; ранее сохранённые записи '
+             'читаются независимо от этой настройки'
+    )
+    parser.add_argument(
+        '--cache-compression-level',
+        type=int,
+        metavar='LEVEL',
+        help='Уровень сжатия записей кеша'
+    )
+    parser.add_argument(
+        '-r',
+        '--resume',
+        action='store_true',
+        help='Продолжить работу с последней контрольной точки'
+    )
+    parser.add_argument(
+        '--invalidate',
+        action='append',
+        metavar='PATTERN',
+        help='Удалить из кеша записи по режиму, glob-шаблону URL '
+             'или регулярному выражению с префиксом re:'
+    )
+    parser.add_argument(
+        '--invalidate-older-than',
+        type=parse_age,
+        metavar='AGE',
+        help='Удалить из кеша записи старше указанного возраста, '
+             'например 30m, 6h или 2d'
+    )
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help='Дублировать запросы, которые выполняются дольше 95-го '
+             'перцентиля задержек'
+    )
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        help='Бюджет времени на запуск в секундах; по его исчерпании '
+             'выводятся неполные результаты'
+    )
+    parser.add_argument(
+        '--formats',
+        nargs='+',
+        metavar='FORMAT',
+        help='Форматы архивов документации для режима download, '
+             'например pdf-a4.zip, html, epub или all'
+    )
+    parser.add_argument(
+        '--page-store',
+        action='store_true',
+        help='Хранить страницы в файлах с адресацией по содержимому '
+             'и читать их через mmap; --clear-cache и --invalidate '
+             'применяются и к ним'
+    )
+    parser.add_argument(
+        '--http2',
+        action='store_true',
+        help='Загружать страницы по HTTP/2, параллельно мультиплексируя '
+             'запросы в одном соединении; требуется пакет httpx[http2]'
+    )
+    parser.add_argument(
+        '--max-connections',
+        type=int,
+        default=UtilityConstants.MAX_CONNECTIONS,
+        help='Максимальное количество одновременных загрузок архивов '
+             'и страниц языковых версий, а с --http2 — также страниц PEP '
+             'и статей "What\'s new"'
+    )
+    parser.add_argument(
+        '--languages',
+        nargs='+',
+        metavar='LANGUAGE',
+        help='Языковые версии документации для режимов whats-new '
+             'и latest-versions, например fr ja zh-cn или all'
+    )
+    parser.add_argument(
+        '--max-memory',
+        type=parse_size,
+        metavar='SIZE',
+        help='Лимит резидентной памяти, например 256M: при его превышении '
+             'страницы загружаются по одной'
+    )
+    parser.add_argument(
+        '--memory-report',
+        action='store_true',
+        help='Вывести в лог пиковую память и места, выделившие больше '
+             'всего памяти'
+    )
+    parser.add_argument(
+        '--metrics-dir',
+        type=Path,
+        metavar='DIR',
+        help='Записать метрики запуска в каталог textfile collector '
+             'node_exporter'
+    )
+    parser.add_argument(
+        '--metrics-push',
+        metavar='URL',
+        help='Отправить метрики запуска в Prometheus Pushgateway'
+    )
+    parser.add_argument(
+        '-q',
+        '--query',
+        help='Поисковый запрос для режима pep-search; '
+             'фразы заключаются в кавычки'
+    )
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=UtilityConstants.SEARCH_LIMIT,
+        help='Максимальное количество результатов поиска'
+    )
+    parser.add_argument(
+        '--group-by',
+        nargs='+',
+        choices=METADATA_COLUMNS,
+        help='Поля группировки для режима pep-query'
+    )
+    parser.add_argument(
+        '--metadata-file',
+        type=Path,
+        metavar='FILE',
+        help='Хранилище метаданных PEP для режимов pep и pep-query'
+    )
+    parser.add_argument(
+        '--host',
+        default=UtilityConstants.SERVER_HOST,
+        help='Адрес, на котором режим serve принимает запросы'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=UtilityConstants.SERVER_PORT,
+        help='Порт, на котором режим serve принимает запросы'
+    )
+    parser.add_argument(
+        '--refresh-interval',
+        type=float,
+        default=UtilityConstants.REFRESH_INTERVAL,
+        help='Интервал обновления результатов в режиме serve, в секундах'
+    )
     return parser
 
 
-def configure_logging() -> None:
+def configure_load_test_parser(
+        modes: dict[str, CachedSession].keys
+) -> argparse.ArgumentParser:
+    """
+    Настраивает ArgumentParser для нагрузочного тестирования парсера
+    на локальном сервере.
+
+    :param modes : dict[str, CachedSession].keys - Список режимов работы.
+
+    :returns: ArgumentParser: - Сконфигурированный парсер аргументов
+    командной строки.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'modes',
+        nargs='+',
+        choices=modes,
+        help='Режимы работы парсера для нагрузочного теста'
+    )
+    parser.add_argument(
+        '--peps', type=int, default=700, help='Количество PEP в индексе'
+    )
+    parser.add_argument(
+        '--versions', type=int, default=30,
+        help='Количество страниц "What\'s new"'
+    )
+    parser.add_argument(
+        '--page-size', type=int, default=20_000,
+        help='Размер генерируемой страницы в байтах'
+    )
+    parser.add_argument(
+        '--latency', type=float, default=0.0,
+        help='Задержка ответа сервера в секундах'
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=0.0,
+        help='Доля запросов, завершающихся ошибкой'
+    )
+    parser.add_argument(
+        '--bandwidth', type=int, default=None,
+        help='Скорость отдачи ответа в байтах в секунду'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        choices=(
+            UtilityConstants.PRETTY_OUTPUT_MODE,
+            UtilityConstants.FILE_OUTPUT_MODE
+        ),
+        help='Дополнительные способы вывода данных'
+    )
+    return parser
+
+
+def configure_benchmark_parser() -> argparse.ArgumentParser:
+    """
+    Настраивает ArgumentParser для бенчмарков отдельных компонентов парсера.
+
+    :returns: ArgumentParser: - Сконфигурированный парсер аргументов
+    командной строки.
+    """
+    parser = argparse.ArgumentParser()
+    benchmarks = parser.add_subparsers(dest='benchmark', required=True)
+    tables = benchmarks.add_parser(
+        'tables', help='Вывод таблицы в формате PrettyTable'
+    )
+    tables.add_argument(
+        '--rows', type=int, default=10_000, help='Количество строк таблицы'
+    )
+    tables.add_argument(
+        '--repeat', type=int, default=3, help='Количество повторов'
+    )
+    cache = benchmarks.add_parser(
+        'cache', help='Сжатие записей кеша ответов'
+    )
+    cache.add_argument(
+        '--pages', type=int, default=500, help='Количество страниц PEP'
+    )
+    cache.add_argument(
+        '--page-size', type=int, default=20_000,
+        help='Размер генерируемой страницы в байтах'
+    )
+    cache.add_argument(
+        '--level', type=int, default=None, help='Уровень сжатия'
+    )
+    pages = benchmarks.add_parser(
+        'pages', help='Чтение страниц из кеша SQLite и хранилища страниц'
+    )
+    pages.add_argument(
+        '--pages', type=int, default=500, help='Количество страниц PEP'
+    )
+    pages.add_argument(
+        '--page-size', type=int, default=20_000,
+        help='Размер генерируемой страницы в байтах'
+    )
+    pages.add_argument(
+        '--duplicates', type=int, default=1,
+        help='Количество дополнительных адресов каждой страницы'
+    )
+    return parser
+
+
+class RepeatedMessageFilter(logging.Filter):
+    """
+    Фильтр, подавляющий одинаковые предупреждения и ошибки.
+
+    Повтор сообщения в течение интервала не пропускается дальше,
+    а лишь подсчитывается. Количество подавленных повторов добавляется
+    к следующему пропущенному такому же сообщению или выводится
+    сводкой при завершении работы.
+    """
+
+    def __init__(
+            self,
+            interval: float = UtilityConstants.LOG_REPEAT_INTERVAL,
+            level: int = logging.WARNING
+    ) -> None:
+        super().__init__()
+        self.interval = interval
+        self.level = level
+        self.seen = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self.lock:
+            started, suppressed = self.seen.get(key, (None, 0))
+            if started is not None and now - started < self.interval:
+                self.seen[key] = (started, suppressed + 1)
+                return False
+            self.seen[key] = (now, 0)
+        if suppressed:
+            record.msg = Literals.REPEATED_MESSAGE.format(
+                record.getMessage(), suppressed
+            )
+            record.args = None
+        return True
+
+    def flush(self) -> None:
+        """Выводит сводку по подавленным, но ещё не учтённым повторам."""
+        with self.lock:
+            pending = [
+                (level, message, suppressed)
+                for (level, message), (_, suppressed) in self.seen.items()
+                if suppressed
+            ]
+            self.seen.clear()
+        for level, message, suppressed in pending:
+            logging.log(
+                level, Literals.REPEATED_MESSAGE.format(message, suppressed)
+            )
+
+
+def stop_logging(
+        listener: QueueListener, repeat_filter: RepeatedMessageFilter
+) -> None:
+    """
+    Выводит сводку по повторам и дожидается записи всех сообщений.
+
+    :param listener: QueueListener - фоновый обработчик очереди логов.
+    :param repeat_filter: RepeatedMessageFilter - фильтр повторов.
+
+    :returns: None
+    """
+    repeat_filter.flush()
+    listener.stop()
+
+
+def configure_logging() -> QueueListener:
     """
     Настраивает логирование для приложения.
 
     Создает каталог для логов, если его не существует,
     и настраивает RotatingHandler для записи логов в файл.
+    Корневой логгер лишь складывает записи в очередь, а форматирование
+    и запись на диск выполняются в фоновом потоке QueueListener,
+    поэтому логирование не блокирует поток, выполняющий обход страниц.
 
-    :returns: None
+    :returns: QueueListener: Запущенный фоновый обработчик очереди логов.
     """
     log_dir = PathConstants.LOG_DIR
     log_dir.mkdir(exist_ok=True)
@@ -60,9 +414,48 @@ def configure_logging() -> None:
         backupCount=5,
         encoding='utf-8'
     )
-    logging.basicConfig(
-        datefmt=UtilityConstants.LOGGER_DT_FORMAT,
-        format=UtilityConstants.LOGGER_FORMAT,
-        level=logging.INFO,
-        handlers=(rotating_handler, logging.StreamHandler())
+    formatter = logging.Formatter(
+        fmt=UtilityConstants.LOGGER_FORMAT,
+        datefmt=UtilityConstants.LOGGER_DT_FORMAT
+    )
+    handlers = (rotating_handler, logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    queue_handler = QueueHandler(log_queue)
+    repeat_filter = RepeatedMessageFilter()
+    queue_handler.addFilter(repeat_filter)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(stop_logging, listener, repeat_filter)
+    return listener
+
+
+def handle_termination(signum: int, frame) -> None:
+    """
+    Обработчик сигнала завершения процесса.
+
+    Превращает сигнал в SystemExit, чтобы успели отработать блоки finally,
+    сохраняющие контрольные точки.
+
+    :param signum: Номер полученного сигнала.
+    :param frame: Текущий кадр стека.
+
+    :raises SystemExit: Всегда.
+    """
+    logging.warning(
+        Literals.TERMINATED_BY_SIGNAL.format(signal.Signals(signum).name)
     )
+    raise SystemExit(128 + signum)
+
+
+def configure_signal_handlers() -> None:
+    """
+    Настраивает обработку SIGTERM, который присылают планировщики задач.
+
+    :returns: None
+    """
+    signal.signal(signal.SIGTERM, handle_termination)
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 MAIN_DOC_URL = 'https://docs.python.org/3/'
+DOC_ROOT_URL = 'https://docs.python.org/'
+SWITCHERS_URL = MAIN_DOC_URL + '_static/switchers.js'
 PEP_MAIN_URL = 'https://peps.python.org/'
 BASE_DIR = Path(__file__).parent
 EXPECTED_STATUS = {
@@ -13,12 +15,27 @@ EXPECTED_STATUS = {
     'W': ('Withdrawn',),
     '': ('Draft', 'Active')
 }
+CACHE_SCOPES = {
+    'whats-new': (
+        MAIN_DOC_URL + 'whatsnew/*', DOC_ROOT_URL + '*/3/whatsnew/*'
+    ),
+    'latest-versions': (MAIN_DOC_URL, DOC_ROOT_URL + '*/3/', SWITCHERS_URL),
+    'download': (MAIN_DOC_URL + 'download.html', MAIN_DOC_URL + 'archives/*'),
+    'pep': (PEP_MAIN_URL + '*',),
+}
 
 
 class PathConstants:
     LOG_DIR = BASE_DIR / 'logs'
     DOWNLOADS_PATH = 'downloads'
     RESULTS_PATH = 'results'
+    CHECKPOINTS_DIR = 'checkpoints'
+    SNAPSHOTS_DIR = 'snapshots'
+    RECORDS_DIR = 'records'
+    CACHE_USAGE_FILE = 'cache_usage.json'
+    SEARCH_INDEX_FILE = 'pep_index.sqlite3'
+    METADATA_FILE = 'pep_metadata.sqlite3'
+    PAGE_STORE_DIR = 'page_store'
     LOG_FILE = LOG_DIR / 'parser.log'
 
 
@@ -31,10 +48,39 @@ class UtilityConstants:
         '%(levelname)s - %(asctime)s - %(lineno)s - %(funcName)s - '
         '%(message)s - %(name)s')
     PROGRESS_BAR_COLOR = 'red'
+    CHECKPOINT_INTERVAL = 25
+    HEDGING_PERCENTILE = 0.95
+    HEDGING_MIN_SAMPLES = 20
+    HEDGING_WINDOW = 500
+    HEDGING_TIMEOUT = 30
+    LOG_REPEAT_INTERVAL = 60
+    SERVER_HOST = '127.0.0.1'
+    SERVER_PORT = 8000
+    REFRESH_INTERVAL = 300
+    MAX_CONNECTIONS = 4
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    SEARCH_LIMIT = 10
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    PAGER = 'less -FRSX'
+    PROGRESS_LOG_INTERVAL = 10
+    METRICS_PUSH_TIMEOUT = 5
+    MEMORY_REPORT_TOP = 10
+    REFRESH_LATEST_PAGES = 2
+    DEFAULT_LANGUAGE = 'en'
+    ALL_LANGUAGES = 'all'
+    DOC_LANGUAGES = (
+        'en', 'es', 'fr', 'it', 'ja', 'ko', 'pl', 'pt-br', 'tr', 'uk',
+        'zh-cn', 'zh-tw'
+    )
 
 
 class Literals:
     ARCHIVE_DOWNLOADED = 'Архив был загружен и сохранён в: {}'
+    ARCHIVE_UP_TO_DATE = 'Локальная копия архива актуальна: {}'
+    DOWNLOADING_ARCHIVES = 'Загружаем архивы'
+    DOWNLOAD_THROUGHPUT = ('Загружено архивов: {}, пропущено: {}, '
+                           '{:.1f} МБ за {:.1f} с ({:.2f} МБ/с)')
     UNEXPECTED_PEP_STATUS = ('Несовпадающие статусы:\n'
                              '{}\n'
                              'Статус в карточке: {}\n'
@@ -48,3 +94,39 @@ class Literals:
     COLLECTING_URLS = 'Собираем ссылки'
     COLLECTING_STATUSES = 'Собираем статусы'
     PARSER_EXCEPTION = 'Во время работы парсера возникла ошибка: {}'
+    CHECKPOINT_SAVED = 'Контрольная точка сохранена: {} ({} обработано)'
+    CHECKPOINT_RESUMED = 'Продолжаем с контрольной точки {}: {} обработано'
+    CHECKPOINT_NOT_FOUND = 'Контрольная точка {} не найдена, начинаем заново'
+    TERMINATED_BY_SIGNAL = 'Получен сигнал {}, завершаем работу'
+    DEADLINE_EXCEEDED = 'Бюджет времени исчерпан, страница {} не загружена'
+    INCOMPLETE_RESULTS = 'РЕЗУЛЬТАТ НЕПОЛНЫЙ'
+    RESULTS_INCOMPLETE = 'Бюджет времени исчерпан, результаты неполные: {}'
+    PYARROW_REQUIRED = 'Для экспорта в Arrow установите пакет pyarrow'
+    ZSTANDARD_REQUIRED = 'Для сжатия zstd установите пакет zstandard'
+    HTTPX_REQUIRED = 'Для HTTP/2 установите пакет httpx[http2]'
+    REPEATED_MESSAGE = '{} (повторилось ещё {} раз)'
+    INVALID_CACHE_AGE = ('Некорректный возраст {}: ожидается число '
+                         'с единицей измерения s, m, h, d или w')
+    CACHE_INVALIDATED = 'Удалено записей из кеша: {}'
+    SERVER_STARTED = 'Сервер результатов запущен на http://{}:{}/'
+    RESULTS_REFRESHED = 'Результаты обновлены: {}'
+    REFRESH_FAILED = 'Не удалось обновить результаты режима {}: {}'
+    LOAD_TEST_FAILED = 'Нагрузочный тест режима {} прерван: {}'
+    SEARCH_QUERY_REQUIRED = 'Для режима pep-search укажите запрос: -q QUERY'
+    HEDGED_REQUESTS = 'Отправлено дублирующих запросов: {}'
+    DELTA_ADDED = 'Добавлено'
+    DELTA_REMOVED = 'Удалено'
+    DELTA_CHANGED = 'Изменено'
+    DELTA_CHANGE = '{} → {}'
+    PROGRESS = '{}: обработано {} из {}'
+    METRICS_PUSH_FAILED = 'Не удалось отправить метрики в {}: {}'
+    METRICS_WRITTEN = 'Метрики записаны в {}'
+    INVALID_MEMORY_SIZE = ('Некорректный размер {}: ожидается число '
+                           'с необязательным суффиксом K, M или G')
+    MEMORY_BUDGET_EXCEEDED = ('Использовано {} памяти при лимите {}, '
+                              'страницы загружаются по одной')
+    MEMORY_PEAK = ('Режим {}: пиковая резидентная память {}, '
+                   'пик отслеживаемых выделений {}')
+    MEMORY_SITE = '{}:{}: {} в {} блоках'
+    LANGUAGES_NOT_FOUND = ('Не удалось получить список языковых версий '
+                           'документации, используем известный: {}')
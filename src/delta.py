@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+from checkpoints import atomic_write
+from constants import Literals, PathConstants
+from tables import ResultTable
+
+KEY_SEPARATOR = '\x1f'
+
+
+def get_snapshot_path(base_dir: Path, mode: str) -> Path:
+    """
+    Возвращает путь к снимку результатов режима парсера.
+
+    :param base_dir: Базовый каталог приложения.
+    :param mode: Режим работы парсера.
+
+    :returns: Path: Путь к файлу снимка.
+    """
+    return base_dir / PathConstants.SNAPSHOTS_DIR / f'{mode}.json'
+
+
+def load_snapshot(path: Path, header: tuple) -> dict[str, list[str]]:
+    """
+    Загружает снимок результатов предыдущего запуска.
+
+    :param path: Путь к файлу снимка.
+    :param header: Заголовок текущих результатов.
+
+    :returns: dict[str, list[str]]: Ключ строки и значения остальных
+     столбцов; пустой словарь, если снимка нет или он сохранён
+     для таблицы с другими столбцами.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            snapshot = json.load(file)
+    except FileNotFoundError:
+        return {}
+    if snapshot['header'] != list(header):
+        return {}
+    return snapshot['rows']
+
+
+def save_snapshot(
+        path: Path, header: tuple, rows: dict[str, list[str]]
+) -> None:
+    """Атомарно сохраняет снимок результатов."""
+    atomic_write(path, json.dumps(
+        {'header': header, 'rows': rows},
+        ensure_ascii=False, separators=(',', ':')
+    ))
+
+
+def keyed_rows(table: ResultTable) -> dict[str, list[str]]:
+    """
+    Преобразует строки таблицы в словарь по ключевым столбцам.
+
+    :param table: ResultTable - результаты режима парсера.
+
+    :returns: dict[str, list[str]]: Ключ строки и значения остальных
+     столбцов.
+    """
+    size = table.key_columns
+    return {
+        KEY_SEPARATOR.join(map(str, row[:size])): [
+            str(value) for value in row[size:]
+        ]
+        for row in table.iter_rows()
+    }
+
+
+def format_change(old: list[str], new: list[str]) -> list[str]:
+    """Отмечает изменившиеся значения как "старое → новое"."""
+    return [
+        value if value == previous
+        else Literals.DELTA_CHANGE.format(previous, value)
+        for previous, value in zip(old, new)
+    ]
+
+
+def compute_delta(
+        previous: dict[str, list[str]], current: dict[str, list[str]],
+        removals: bool = True
+) -> list[tuple]:
+    """
+    Сравнивает результаты двух запусков за O(n) поиском по ключу.
+
+    :param previous: Строки предыдущего запуска.
+    :param current: Строки текущего запуска.
+    :param removals: Учитывать строки, которых нет в текущем запуске.
+
+    :returns: list[tuple]: Вид изменения, ключевые столбцы и значения.
+    """
+    delta = []
+    for key, values in current.items():
+        old = previous.get(key)
+        if old is None:
+            delta.append((Literals.DELTA_ADDED, *key.split(KEY_SEPARATOR),
+                          *values))
+        elif old != values:
+            delta.append((Literals.DELTA_CHANGED, *key.split(KEY_SEPARATOR),
+                          *format_change(old, values)))
+    if removals:
+        delta.extend(
+            (Literals.DELTA_REMOVED, *key.split(KEY_SEPARATOR), *values)
+            for key, values in previous.items() if key not in current
+        )
+    return delta
+
+
+def apply_delta(results: ResultTable, path: Path) -> ResultTable:
+    """
+    Оставляет в результатах только изменения с предыдущего запуска
+    и сохраняет текущие результаты как новый снимок.
+
+    Если результаты неполные, отсутствующие строки не считаются
+    удалёнными, а снимок дополняется, а не заменяется.
+
+    :param results: ResultTable - результаты режима парсера.
+    :param path: Путь к файлу снимка.
+
+    :returns: ResultTable: Таблица изменений.
+    """
+    results = ResultTable.coerce(results)
+    previous = load_snapshot(path, results.header)
+    current = keyed_rows(results)
+    delta = ResultTable(
+        ('Изменение', *results.header),
+        compute_delta(previous, current, removals=results.complete),
+        key_columns=results.key_columns + 1
+    )
+    delta.complete = results.complete
+    save_snapshot(
+        path, results.header,
+        current if results.complete else {**previous, **current}
+    )
+    return delta
@@ -0,0 +1,163 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from requests import RequestException
+from requests_cache import DO_NOT_CACHE, CachedSession
+
+from checkpoints import atomic_write
+from constants import Literals, UtilityConstants
+
+ALL_FORMATS = 'all'
+DEFAULT_DOWNLOAD_FORMAT = 'pdf-a4.zip'
+MANIFEST_NAME = '.manifest.json'
+
+
+def archive_format(filename: str) -> str:
+    """
+    Возвращает формат архива по имени файла.
+
+    :param filename: Имя файла, например "python-3.12.1-docs-pdf-a4.zip".
+
+    :returns: str: Формат архива, например "pdf-a4.zip" или "epub".
+    """
+    return re.sub(r'^.*?-docs[-.]', '', filename)
+
+
+def discover_archives(
+        soup: BeautifulSoup, downloads_url: str
+) -> dict[str, str]:
+    """
+    Находит ссылки на все архивы в таблице страницы загрузок.
+
+    :param soup: BeautifulSoup - страница загрузок документации.
+    :param downloads_url: URL страницы загрузок.
+
+    :returns: dict[str, str]: Формат архива и абсолютная ссылка на него.
+    """
+    archives = {}
+    for link in soup.select('div.body > table.docutils a[href]'):
+        url = urljoin(downloads_url, link['href'])
+        archives[archive_format(url.split('/')[-1])] = url
+    return archives
+
+
+def select_formats(
+        archives: dict[str, str], formats: list[str]
+) -> dict[str, str]:
+    """
+    Отбирает архивы запрошенных форматов.
+
+    Формат "html" выбирает все архивы с HTML ("html.zip", "html.tar.bz2"),
+    а "all" — все найденные архивы.
+
+    :param archives: Формат архива и ссылка на него.
+    :param formats: Запрошенные форматы.
+
+    :returns: dict[str, str]: Отобранные архивы.
+    """
+    if ALL_FORMATS in formats:
+        return archives
+    return {
+        name: url for name, url in archives.items()
+        if any(
+            name == requested or name.startswith(requested + '.')
+            for requested in formats
+        )
+    }
+
+
+def load_manifest(downloads_dir: Path) -> dict[str, dict]:
+    """
+    Загружает сведения о ранее скачанных архивах.
+
+    :param downloads_dir: Каталог загрузок.
+
+    :returns: dict[str, dict]: Имя файла и его ETag и размер.
+    """
+    try:
+        with open(downloads_dir / MANIFEST_NAME, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(downloads_dir: Path, manifest: dict[str, dict]) -> None:
+    """Атомарно сохраняет сведения о скачанных архивах."""
+    atomic_write(downloads_dir / MANIFEST_NAME, json.dumps(manifest))
+
+
+def is_up_to_date(
+        archive_path: Path, record: Optional[dict], headers: dict
+) -> bool:
+    """
+    Проверяет, совпадает ли локальная копия архива с удалённой.
+
+    :param archive_path: Путь к локальной копии.
+    :param record: Сведения о локальной копии из манифеста.
+    :param headers: Заголовки ответа сервера.
+
+    :returns: bool: True, если архив можно не скачивать.
+    """
+    if not archive_path.exists():
+        return False
+    size = archive_path.stat().st_size
+    etag = headers.get('ETag')
+    if record and etag and record.get('etag'):
+        return record['etag'] == etag and record.get('size') == size
+    length = headers.get('Content-Length')
+    return length is not None and int(length) == size
+
+
+def download_archive(
+        session: CachedSession,
+        url: str,
+        archive_path: Path,
+        record: Optional[dict]
+) -> tuple[Optional[dict], int]:
+    """
+    Скачивает архив в файл, пропуская его, если локальная копия актуальна.
+
+    Архив загружается потоково во временный файл, который по окончании
+    загрузки подменяет локальную копию, и не сохраняется в кеш сессии.
+    Если для локальной копии известен ETag, отправляется условный запрос.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param url: URL архива.
+    :param archive_path: Путь, по которому сохраняется архив.
+    :param record: Сведения о локальной копии из манифеста.
+
+    :returns: tuple[Optional[dict], int]: Новые сведения для манифеста
+     (None, если архив не изменился) и количество загруженных байт.
+    :raises ConnectionError: Если произошла ошибка подключения.
+    """
+    headers = {}
+    if record and record.get('etag') and archive_path.exists():
+        headers['If-None-Match'] = record['etag']
+    try:
+        with session.get(
+            url, headers=headers, stream=True, expire_after=DO_NOT_CACHE
+        ) as response:
+            if response.status_code == 304:
+                return None, 0
+            response.raise_for_status()
+            if is_up_to_date(archive_path, record, response.headers):
+                return None, 0
+            size = 0
+            part_path = archive_path.with_name(archive_path.name + '.part')
+            with open(part_path, 'wb') as file:
+                for chunk in response.iter_content(
+                    UtilityConstants.DOWNLOAD_CHUNK_SIZE
+                ):
+                    file.write(chunk)
+                    size += len(chunk)
+            os.replace(part_path, archive_path)
+    except RequestException as error:
+        raise ConnectionError(
+            Literals.REQUEST_EXCEPTION.format(url, error)
+        ) from error
+    return {'etag': response.headers.get('ETag'), 'size': size}, size
@@ -1,3 +1,8 @@
 class ParserFindTagException(Exception):
     """Вызывается, когда парсер не может найти тег."""
     pass
+
+
+class DeadlineExceededException(Exception):
+    """Вызывается, когда бюджет времени на запуск парсера исчерпан."""
+    pass
@@ -0,0 +1,213 @@
+import os
+import ssl
+import threading
+from io import BytesIO
+from typing import Optional, Union
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response, certs
+from requests.adapters import HTTPAdapter
+from requests.exceptions import (
+    ConnectionError, ConnectTimeout, ReadTimeout, RequestException
+)
+from requests.utils import select_proxy
+from requests_cache import CachedSession
+from urllib3.response import HTTPHeaderDict, HTTPResponse
+
+from constants import Literals, UtilityConstants
+from metrics import METRICS
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+HTTP_VERSIONS = {'HTTP/1.0': 10, 'HTTP/1.1': 11, 'HTTP/2': 20}
+DECODED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+HOP_BY_HOP_HEADERS = (
+    'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding',
+    'upgrade'
+)
+
+
+def convert_timeout(
+        timeout: Union[float, tuple, None]
+) -> 'httpx.Timeout':
+    """Преобразует таймаут requests (число или пара) в таймаут httpx."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def create_ssl_context(
+        verify: Union[bool, str], cert: Union[str, tuple, None]
+) -> ssl.SSLContext:
+    """
+    Создаёт контекст TLS по аргументам verify и cert requests.
+
+    :param verify: Проверять ли сертификат сервера либо путь к файлу
+     или каталогу корневых сертификатов.
+    :param cert: Путь к клиентскому сертификату или пара путей
+     (сертификат, ключ).
+
+    :returns: ssl.SSLContext: Контекст для клиента httpx.
+    """
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        cafile = certs.where() if verify is True else verify
+        if os.path.isdir(cafile):
+            context = ssl.create_default_context(capath=cafile)
+        else:
+            context = ssl.create_default_context(cafile=cafile)
+    if cert:
+        context.load_cert_chain(*(cert if isinstance(cert, tuple)
+                                  else (cert,)))
+    return context
+
+
+class HTTP2Adapter(HTTPAdapter):
+    """
+    Транспортный адаптер requests, отправляющий запросы через httpx
+    по HTTP/2.
+
+    Параллельные запросы к одному хосту мультиплексируются в одном
+    соединении. Адаптер монтируется в CachedSession, поэтому кеширование
+    и условные запросы работают так же, как с транспортом по умолчанию.
+    Если сервер не поддерживает HTTP/2, версия протокола согласуется
+    через ALPN; если сервер нарушил протокол, запросы к этому хосту
+    повторяются транспортом по умолчанию по HTTP/1.1.
+
+    Потоковые запросы (stream=True), например загрузка архивов,
+    и запросы через прокси тоже выполняются транспортом по умолчанию,
+    чтобы тело ответа не загружалось в память целиком. Для каждого
+    сочетания verify и cert создаётся свой клиент httpx.
+
+    :param max_connections: Максимальное количество соединений.
+    :param http1: Разрешить HTTP/1.1; без него запросы по http://
+     отправляются по HTTP/2 без согласования (prior knowledge).
+    """
+
+    def __init__(
+            self, max_connections: int = UtilityConstants.MAX_CONNECTIONS,
+            http1: bool = True, **kwargs
+    ) -> None:
+        if httpx is None:
+            raise ImportError(Literals.HTTPX_REQUIRED)
+        super().__init__(**kwargs)
+        self.http1 = http1
+        self.max_connections = max_connections
+        self.clients = {}
+        self.http1_hosts = set()
+        self.lock = threading.Lock()
+
+    def get_client(
+            self, verify: Union[bool, str], cert: Union[str, tuple, None]
+    ) -> 'httpx.Client':
+        """Возвращает клиент httpx с заданными настройками TLS."""
+        key = (verify, cert)
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = httpx.Client(
+                    http1=self.http1, http2=True, follow_redirects=False,
+                    verify=create_ssl_context(verify, cert),
+                    limits=httpx.Limits(max_connections=self.max_connections)
+                )
+            return self.clients[key]
+
+    def uses_http1(
+            self, request: PreparedRequest, stream: bool,
+            proxies: Optional[dict]
+    ) -> bool:
+        """
+        Проверяет, должен ли запрос выполняться транспортом
+        по умолчанию: потоковый, через прокси или к хосту без HTTP/2.
+        """
+        return (
+            stream or bool(select_proxy(request.url, proxies))
+            or urlsplit(request.url).netloc in self.http1_hosts
+        )
+
+    def send(
+            self, request: PreparedRequest, stream: bool = False,
+            timeout: Union[float, tuple, None] = None, verify=True,
+            cert=None, proxies=None
+    ) -> Response:
+        if self.uses_http1(request, stream, proxies):
+            return super().send(request, stream, timeout, verify, cert,
+                                proxies)
+        client = self.get_client(verify, cert)
+        try:
+            response = client.send(client.build_request(
+                request.method, request.url, headers=[
+                    (name, value) for name, value in request.headers.items()
+                    if name.lower() not in HOP_BY_HOP_HEADERS
+                ],
+                content=request.body, timeout=convert_timeout(timeout)
+            ))
+        except httpx.RemoteProtocolError:
+            with self.lock:
+                self.http1_hosts.add(urlsplit(request.url).netloc)
+            return super().send(request, stream, timeout, verify, cert,
+                                proxies)
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(error, request=request) from error
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(error, request=request) from error
+        except httpx.TransportError as error:
+            raise ConnectionError(error, request=request) from error
+        except httpx.HTTPError as error:
+            raise RequestException(error, request=request) from error
+        METRICS.inc('parser_http_responses_total',
+                    http_version=response.http_version)
+        return self.build_response(request, self.to_urllib3(response))
+
+    @staticmethod
+    def to_urllib3(response: 'httpx.Response') -> HTTPResponse:
+        """
+        Представляет ответ httpx в виде ответа urllib3, из которого
+        requests и requests_cache собирают Response.
+
+        Тело ответа уже распаковано httpx, поэтому заголовки сжатия
+        из ответа удаляются.
+        """
+        headers = HTTPHeaderDict()
+        for name, value in response.headers.multi_items():
+            if name.lower() not in DECODED_HEADERS:
+                headers.add(name, value)
+        headers['Content-Length'] = str(len(response.content))
+        return HTTPResponse(
+            body=BytesIO(response.content), headers=headers,
+            status=response.status_code,
+            version=HTTP_VERSIONS.get(response.http_version, 11),
+            reason=response.reason_phrase, preload_content=False,
+            decode_content=False, request_method=response.request.method,
+            request_url=str(response.request.url)
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients.clear()
+        super().close()
+
+
+def mount_http2(
+        session: CachedSession,
+        max_connections: int = UtilityConstants.MAX_CONNECTIONS
+) -> HTTP2Adapter:
+    """
+    Подключает к сессии транспорт HTTP/2 для запросов по https://.
+
+    :param session: CachedSession - сессия, используемая для запросов.
+    :param max_connections: Максимальное количество соединений.
+
+    :returns: HTTP2Adapter: Подключённый адаптер.
+    """
+    adapter = HTTP2Adapter(max_connections)
+    session.mount('https://', adapter)
+    return adapter
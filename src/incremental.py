@@ -0,0 +1,71 @@
+import hashlib
+import json
+import mmap
+from pathlib import Path
+from typing import Union
+
+from checkpoints import atomic_write
+from constants import PathConstants, UtilityConstants
+
+
+def get_record_path(base_dir: Path, mode: str) -> Path:
+    """
+    Возвращает путь к записи обработанных страниц режима парсера.
+
+    :param base_dir: Базовый каталог приложения.
+    :param mode: Режим работы парсера.
+
+    :returns: Path: Путь к файлу записи.
+    """
+    return base_dir / PathConstants.RECORDS_DIR / f'{mode}.json'
+
+
+def load_record(path: Path, header: tuple) -> dict[str, dict]:
+    """
+    Загружает запись страниц, обработанных предыдущими запусками.
+
+    :param path: Путь к файлу записи.
+    :param header: Заголовок текущих результатов.
+
+    :returns: dict[str, dict]: Хеш содержимого и строка результатов
+     для каждого адреса; пустой словарь, если записи нет или она
+     сохранена для таблицы с другими столбцами.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            record = json.load(file)
+    except FileNotFoundError:
+        return {}
+    if record['header'] != list(header):
+        return {}
+    return record['pages']
+
+
+def save_record(path: Path, header: tuple, pages: dict[str, dict]) -> None:
+    """Атомарно сохраняет запись обработанных страниц."""
+    atomic_write(path, json.dumps(
+        {'header': header, 'pages': pages},
+        ensure_ascii=False, separators=(',', ':')
+    ))
+
+
+def content_hash(markup: Union[str, mmap.mmap]) -> str:
+    """Вычисляет хеш SHA-256 разметки страницы."""
+    if isinstance(markup, str):
+        markup = markup.encode('utf-8')
+    return hashlib.sha256(markup).hexdigest()
+
+
+def stale_links(links: list[str], pages: dict[str, dict]) -> list[str]:
+    """
+    Выбирает страницы, которые нужно загрузить: ещё не обработанные
+    и UtilityConstants.REFRESH_LATEST_PAGES первых страниц оглавления,
+    которые описывают ещё не выпущенные версии и могут меняться.
+
+    :param links: Ссылки из оглавления, начиная с новейшей версии.
+    :param pages: Запись обработанных страниц.
+
+    :returns: list[str]: Ссылки на страницы для загрузки.
+    """
+    latest = set(links[:UtilityConstants.REFRESH_LATEST_PAGES])
+    return [link for link in links if link in latest or link not in pages]
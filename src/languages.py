@@ -0,0 +1,88 @@
+import logging
+import re
+from urllib.parse import urljoin
+
+from requests_cache import CachedSession
+
+from constants import (
+    DOC_ROOT_URL, MAIN_DOC_URL, SWITCHERS_URL, Literals, UtilityConstants
+)
+from utils import get_response
+
+LANGUAGES_BLOCK_PATTERN = re.compile(
+    r'languages\s*=\s*\{(?P<languages>.*?)\}', re.IGNORECASE | re.DOTALL
+)
+LANGUAGE_PATTERN = re.compile(
+    r'["\'](?P<language>[a-z]{2,3}(?:[-_][a-z]{2,4})?)["\']\s*:',
+    re.IGNORECASE
+)
+
+
+def edition_url(language: str) -> str:
+    """
+    Возвращает адрес документации Python 3 на указанном языке.
+
+    :param language: Код языка, например "fr" или "zh-cn".
+
+    :returns: str: Например "https://docs.python.org/fr/3/".
+    """
+    if language == UtilityConstants.DEFAULT_LANGUAGE:
+        return MAIN_DOC_URL
+    return urljoin(DOC_ROOT_URL, f'{language}/3/')
+
+
+def parse_languages(script: str) -> list[str]:
+    """
+    Извлекает коды языков из скрипта переключателя версий документации.
+
+    :param script: Текст switchers.js.
+
+    :returns: list[str]: Коды языков в порядке их перечисления.
+    """
+    block = LANGUAGES_BLOCK_PATTERN.search(script)
+    if block is None:
+        return []
+    return [
+        language.lower().replace('_', '-') for language in
+        LANGUAGE_PATTERN.findall(block.group('languages'))
+    ]
+
+
+def discover_languages(session: CachedSession) -> list[str]:
+    """
+    Определяет доступные языковые версии документации.
+
+    Если переключатель версий недоступен или его формат изменился,
+    используется известный список UtilityConstants.DOC_LANGUAGES.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+
+    :returns: list[str]: Коды языков.
+    """
+    try:
+        languages = parse_languages(get_response(session, SWITCHERS_URL).text)
+    except ConnectionError:
+        languages = []
+    if not languages:
+        logging.warning(Literals.LANGUAGES_NOT_FOUND.format(
+            ', '.join(UtilityConstants.DOC_LANGUAGES)
+        ))
+        return list(UtilityConstants.DOC_LANGUAGES)
+    return languages
+
+
+def resolve_languages(
+        session: CachedSession, requested: list[str]
+) -> list[str]:
+    """
+    Возвращает список языков для обхода.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param requested: Коды языков из аргумента --languages; "all" —
+     все доступные языковые версии.
+
+    :returns: list[str]: Коды языков без повторов.
+    """
+    if UtilityConstants.ALL_LANGUAGES in requested:
+        return discover_languages(session)
+    return list(dict.fromkeys(language.lower() for language in requested))
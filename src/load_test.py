@@ -0,0 +1,108 @@
+import logging
+import time
+from argparse import Namespace
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
+
+from requests_cache import CachedSession
+
+from configs import configure_load_test_parser, configure_logging
+from constants import Literals
+import main as parser_main
+from main import MODE_TO_FUNCTION
+from mock_server import MockSiteAdapter, MockSiteConfig, MockSiteServer
+from outputs import control_output
+from policies import percentile
+from tables import ResultTable
+
+LOAD_TEST_MODES = ('whats-new', 'latest-versions', 'pep')
+
+
+@contextmanager
+def temporary_base_dir() -> Iterator[Path]:
+    """
+    Подменяет базовый каталог режимов парсера временным, чтобы
+    контрольные точки, записи и хранилища, созданные при запуске против
+    локального сервера, не смешивались с данными реальных запусков
+    и удалялись вместе с каталогом.
+    """
+    previous = parser_main.BASE_DIR
+    with TemporaryDirectory() as directory:
+        parser_main.BASE_DIR = Path(directory)
+        try:
+            yield parser_main.BASE_DIR
+        finally:
+            parser_main.BASE_DIR = previous
+
+
+def run_load_test(server: MockSiteServer, mode: str) -> tuple:
+    """
+    Запускает режим парсера против локального сервера и измеряет
+    пропускную способность и задержки.
+
+    Если режим прерван ошибкой (например, при --error-rate сервер
+    ответил ошибкой на запрос оглавления), ошибка записывается в лог,
+    а режим отмечается в таблице как прерванный с измерениями,
+    собранными до ошибки.
+
+    :param server: MockSiteServer - запущенный локальный сервер.
+    :param mode: str - режим работы парсера.
+
+    :returns: tuple: Строка таблицы с результатами измерений.
+    """
+    session = CachedSession(backend='memory')
+    adapter = MockSiteAdapter(server.url)
+    session.mount('https://', adapter)
+    status = 'Завершён'
+    with temporary_base_dir():
+        started = time.perf_counter()
+        try:
+            MODE_TO_FUNCTION[mode](session, Namespace(resume=False))
+        except Exception as error:
+            logging.exception(Literals.LOAD_TEST_FAILED.format(mode, error))
+            status = 'Прерван'
+        elapsed = time.perf_counter() - started
+    latencies = adapter.latencies
+    return (
+        mode,
+        status,
+        len(latencies),
+        adapter.errors,
+        f'{elapsed:.2f}',
+        f'{len(latencies) / elapsed:.1f}',
+        f'{adapter.bytes_received / elapsed / 1_000_000:.2f}',
+        *(f'{percentile(latencies, fraction) * 1000:.1f}'
+          for fraction in (0.5, 0.95, 0.99)),
+    )
+
+
+def main() -> None:
+    """
+    Запускает локальный сервер с заданными параметрами, прогоняет
+    указанные режимы парсера и выводит сводку по каждому из них.
+
+    :returns: None
+    """
+    configure_logging()
+    args = configure_load_test_parser(LOAD_TEST_MODES).parse_args()
+    args.mode = 'load-test'
+    logging.info(Literals.PARSER_ARGS.format(args))
+    config = MockSiteConfig(
+        peps=args.peps, versions=args.versions, page_size=args.page_size,
+        latency=args.latency, error_rate=args.error_rate,
+        bandwidth=args.bandwidth
+    )
+    results = ResultTable((
+        'Режим', 'Результат', 'Запросов', 'Ошибок', 'Время, с',
+        'Запросов/с', 'МБ/с', 'p50, мс', 'p95, мс', 'p99, мс'
+    ))
+    with MockSiteServer(config) as server:
+        for mode in args.modes:
+            results.append(run_load_test(server, mode))
+    control_output(results, args)
+
+
+if __name__ == '__main__':
+    main()
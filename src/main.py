@@ -1,134 +1,592 @@
 import logging
 import re
-from collections import defaultdict
-from typing import Optional
+import time
+from argparse import Namespace
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 from urllib.parse import urljoin
 
-from requests_cache import CachedSession
-from tqdm import tqdm
+from bs4 import BeautifulSoup, Tag
+from requests_cache import EXPIRE_IMMEDIATELY, CachedSession
 
-from configs import configure_argument_parser, configure_logging
+from cache_control import (
+    collect_cache_stats, invalidate_cache, load_cache_usage, save_cache_usage
+)
+from cache_serializer import compressing_serializer, stored_sizes
+from checkpoints import (
+    get_checkpoint_path, load_checkpoint, remove_checkpoint, save_checkpoint
+)
+from configs import (
+    configure_argument_parser, configure_logging, configure_signal_handlers
+)
 from constants import (
     Literals, PathConstants, BASE_DIR,
     MAIN_DOC_URL, PEP_MAIN_URL, EXPECTED_STATUS, UtilityConstants
 )
+from delta import apply_delta, get_snapshot_path
+from downloads import (
+    DEFAULT_DOWNLOAD_FORMAT, discover_archives, download_archive,
+    load_manifest, save_manifest, select_formats
+)
+from exceptions import DeadlineExceededException, ParserFindTagException
+from http2 import mount_http2
+from incremental import (
+    content_hash, get_record_path, load_record, save_record, stale_links
+)
+from languages import edition_url, resolve_languages
+from memory import MemoryBudget, memory_budget, memory_report
+from metadata_store import METADATA_LABELS, MetadataStore
+from metrics import METRICS, progress
 from outputs import control_output
-from utils import find_tag, get_response, get_soup, manage_logging
+from page_store import PageStore
+from policies import Deadline, HedgingPolicy
+from search_index import SearchIndex
+from server import serve_results
+from tables import ResultTable
+from utils import (
+    find_tag, get_soup, is_complete, manage_logging,
+    mark_incomplete, parse_page, read_page
+)
+
+VERSION_PATTERN = re.compile(r'Python (?P<version>\d\.\d+) \((?P<status>.*)\)')
+
+
+def collect_futures(
+        futures: dict[Future, str], logger_stack: list[Exception]
+) -> tuple[dict[Future, object], bool]:
+    """
+    Дожидается выполнения задач и собирает их результаты.
+
+    Ошибки загрузки и разбора страниц накапливаются в logger_stack,
+    а исчерпание бюджета времени помечает результаты как неполные.
+
+    :param futures: Задачи и языки, к которым они относятся.
+    :param logger_stack: Список, в который добавляются ошибки.
+
+    :returns: tuple[dict[Future, object], bool]: Результаты успешно
+     выполненных задач и признак неполных результатов.
+    """
+    results, incomplete = {}, False
+    for future in progress(
+        as_completed(futures),
+        Literals.COLLECTING_URLS,
+        total=len(futures)
+    ):
+        try:
+            results[future] = future.result()
+        except (ConnectionError, ParserFindTagException, RuntimeError) as e:
+            logger_stack.append(e)
+        except DeadlineExceededException:
+            incomplete = True
+    return results, incomplete
+
+
+def language_executor(cli_args: Namespace) -> ThreadPoolExecutor:
+    """Создаёт пул потоков для параллельного обхода языковых версий."""
+    return ThreadPoolExecutor(
+        max_workers=getattr(cli_args, 'max_connections', None)
+        or UtilityConstants.MAX_CONNECTIONS
+    )
+
+
+def fetch_workers(cli_args: Optional[Namespace]) -> int:
+    """
+    Возвращает количество одновременных загрузок страниц одного сайта:
+    с аргументом --http2 запросы мультиплексируются в одном соединении,
+    иначе страницы загружаются последовательно.
+    """
+    if not getattr(cli_args, 'http2', False):
+        return 1
+    return (getattr(cli_args, 'max_connections', None)
+            or UtilityConstants.MAX_CONNECTIONS)
+
+
+def fetch_sequentially(
+        function: Callable, items: Iterable
+) -> Iterator[tuple[object, Future]]:
+    """
+    Применяет функцию к элементам по одному в текущем потоке, только
+    когда предыдущий результат уже обработан, и возвращает
+    завершённые задачи.
+    """
+    for item in items:
+        future = Future()
+        try:
+            future.set_result(function(item))
+        except Exception as error:
+            future.set_exception(error)
+        yield item, future
+
+
+def fetch_ordered(
+        function: Callable, items: Iterable, workers: int,
+        budget: Optional[MemoryBudget] = None
+) -> Iterator[tuple[object, Future]]:
+    """
+    Применяет функцию к элементам в пуле потоков и возвращает задачи
+    в исходном порядке элементов.
+
+    Вперёд запускается не более 2 * workers задач, поэтому обработка
+    результатов по порядку не требует хранить все загруженные страницы.
+    Лимит памяти budget проверяется перед запуском каждой задачи: пока
+    он превышен, новые задачи не запускаются, пока не будут обработаны
+    все уже запущенные, после чего вперёд запускается только одна.
+    Задачи, не дождавшиеся обработки, отменяются. С одним потоком
+    страницы заранее не загружаются (см. fetch_sequentially).
+
+    :param function: Функция, вызываемая для каждого элемента.
+    :param items: Элементы.
+    :param workers: Количество потоков.
+    :param budget: Ограничение памяти (аргумент --max-memory).
+
+    :returns: Iterator[tuple[object, Future]]: Элемент и его задача.
+    """
+    if workers <= 1:
+        yield from fetch_sequentially(function, items)
+        return
+
+    def ahead() -> int:
+        if budget is not None and budget.exceeded():
+            return 1
+        return 2 * workers
+
+    items = iter(items)
+    end = object()
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            while len(pending) < ahead():
+                item = next(items, end)
+                if item is end:
+                    break
+                pending.append((item, executor.submit(function, item)))
+            if not pending:
+                return
+            yield pending.popleft()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def whats_new_links(session: CachedSession, doc_url: str) -> list[str]:
+    """
+    Собирает ссылки на статьи "What's new" из оглавления раздела.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param doc_url: Адрес документации, например MAIN_DOC_URL.
+
+    :returns: list[str]: Абсолютные ссылки на статьи.
+    """
+    whats_new_url = urljoin(doc_url, 'whatsnew/')
+    return [
+        urljoin(whats_new_url, tag.get('href'))
+        for tag in get_soup(session, whats_new_url).select(
+            '#what-s-new-in-python div.toctree-wrapper li.toctree-l1 > a'
+        )
+    ]
+
+
+def whats_new_entry(
+        session: CachedSession, version_link: str
+) -> tuple[str, str, str]:
+    """
+    Извлекает заголовок статьи "What's new" и сведения о редакторе.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param version_link: Ссылка на статью.
+
+    :returns: tuple[str, str, str]: Ссылка, заголовок и автор статьи.
+    """
+    return whats_new_row(version_link, get_soup(session, version_link))
+
+
+def whats_new_row(
+        version_link: str, soup: BeautifulSoup
+) -> tuple[str, str, str]:
+    """Извлекает строку результатов из статьи и разрушает её дерево."""
+    entry = (version_link, find_tag(soup, 'h1').text,
+             find_tag(soup, 'dl').text.replace('\n', ' ').strip())
+    soup.decompose()
+    return entry
+
+
+def whats_new_page(
+        session: CachedSession, pages: dict[str, dict], version_link: str
+) -> dict:
+    """
+    Загружает статью "What's new" и возвращает её запись.
+
+    Если содержимое статьи не изменилось с предыдущего запуска,
+    статья не разбирается повторно.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param pages: Запись обработанных страниц.
+    :param version_link: Ссылка на статью.
+
+    :returns: dict: Хеш содержимого статьи и строка результатов.
+    """
+    markup = read_page(session, version_link)
+    digest = content_hash(markup)
+    previous = pages.get(version_link)
+    if previous is not None and previous['hash'] == digest:
+        if not isinstance(markup, str):
+            markup.close()
+        return previous
+    return {'hash': digest,
+            'row': whats_new_row(version_link, parse_page(markup))}
 
 
-def whats_new(session: CachedSession) -> Optional[list[tuple[str, str, str]]]:
+def whats_new_by_language(
+        session: CachedSession, cli_args: Namespace
+) -> ResultTable:
+    """
+    Параллельно обходит разделы "What's new" нескольких языковых
+    версий документации одной сессией.
+
+    Сначала загружаются оглавления всех языковых версий, затем все статьи,
+    поэтому каждый язык добавляет к времени работы примерно одну
+    параллельную загрузку на страницу.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Namespace - аргументы командной строки, содержащие
+     языки и количество соединений.
+
+    :returns: ResultTable: Таблица, строки которой содержат язык,
+     ссылку на статью, заголовок, и её автора.
+    """
+    languages = resolve_languages(session, cli_args.languages)
+    results = ResultTable(
+        ('Язык', 'Ссылка на статью', 'Заголовок', 'Редактор, Автор'),
+        key_columns=2
+    )
+    logger_stack = []
+    with language_executor(cli_args) as executor:
+        index_futures = {
+            executor.submit(
+                whats_new_links, session, edition_url(language)
+            ): language
+            for language in languages
+        }
+        links, links_incomplete = collect_futures(index_futures, logger_stack)
+        entry_futures = {
+            executor.submit(whats_new_entry, session, link): language
+            for future, language in index_futures.items()
+            for link in links.get(future, ())
+        }
+        entries, incomplete = collect_futures(entry_futures, logger_stack)
+    results.extend(
+        (language, *entries[future])
+        for future, language in entry_futures.items() if future in entries
+    )
+    manage_logging(logger_stack)
+    if links_incomplete or incomplete:
+        return mark_incomplete(results)
+    return results
+
+
+def whats_new(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> Optional[ResultTable]:
     """
     Парсит страницу "What's new" и возвращает список кортежей, содержащих
     ссылку на статью, заголовок, и информацию о редакторе и авторе.
 
+    Статьи о выпущенных версиях не меняются, поэтому обработанные
+    статьи сохраняются в записи вместе с хешем содержимого, а повторно
+    загружаются только новые статьи и две новейшие. С аргументом
+    --full-refresh загружаются все статьи.
+
+    С аргументом --languages обходит несколько языковых версий
+    документации параллельно и добавляет к результатам столбец с языком.
+
     :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
 
-    :returns: List[tuple[str, str, str]]: Список кортежей,
-    содержащий ссылку на статью, заголовок, и её автора.
+    :returns: ResultTable: Таблица, строки которой содержат
+    ссылку на статью, заголовок, и её автора.
     """
-    result = [('Ссылка на статью', 'Заголовок', 'Редактор, Автор')]
+    if getattr(cli_args, 'languages', None):
+        return whats_new_by_language(session, cli_args)
+    header = ('Ссылка на статью', 'Заголовок', 'Редактор, Автор')
+    record_path = get_record_path(BASE_DIR, 'whats-new')
+    pages = {} if getattr(cli_args, 'full_refresh', False) else (
+        load_record(record_path, header)
+    )
+    links = whats_new_links(session, MAIN_DOC_URL)
+    pending = stale_links(links, pages)
     logger_stack = []
-    for tag in tqdm(
-        get_soup(
-            session,
-            urljoin(MAIN_DOC_URL, 'whatsnew/')
-        ).select(
-            '#what-s-new-in-python div.toctree-wrapper li.toctree-l1 > a'
-        ),
+    incomplete = False
+    for link, future in progress(
+        fetch_ordered(partial(whats_new_page, session, pages), pending,
+                      fetch_workers(cli_args), memory_budget(cli_args)),
         Literals.COLLECTING_URLS,
-        colour=UtilityConstants.PROGRESS_BAR_COLOR
+        total=len(pending)
     ):
-        version_link = urljoin(
-            urljoin(MAIN_DOC_URL, 'whatsnew/'),
-            tag.get('href')
-        )
         try:
-            soup = get_soup(session, version_link)
-            result.append((version_link, find_tag(soup, 'h1').text,
-                           find_tag(soup, 'dl').text.replace(
-                               '\n', ' '
-                           ).strip()))
+            pages[link] = future.result()
         except ConnectionError as error:
             logger_stack.append(error)
+        except DeadlineExceededException:
+            incomplete = True
+            break
+    pages = {link: pages[link] for link in links if link in pages}
+    save_record(record_path, header, pages)
     manage_logging(logger_stack)
-    return result
+    result = ResultTable(
+        header, (tuple(page['row']) for page in pages.values())
+    )
+    return mark_incomplete(result) if incomplete else result
 
 
-def latest_versions(session: CachedSession) -> Optional[
-    list[tuple[str, str, str]]
-]:
+def version_links(soup: BeautifulSoup) -> list[Tag]:
     """
-    Получает ссылки на последние версии документации Python и возвращает
-    список кортежей, содержащих ссылку на документацию, версию, и статус
-    версии.
+    Находит ссылки на версии документации в боковой панели.
 
-    :param session: CachedSession - сессия, используемая для запроса.
+    В переведённых версиях документации заголовок списка переведён,
+    поэтому, если списка "All versions" нет, используется первый список,
+    содержащий ссылки вида "Python 3.12 (stable)".
 
-    :returns: Optional[list[tuple[str, str, str]]]: Список кортежей,
-     содержащий ссылку на документацию, версию, и статус версии.
+    :param soup: BeautifulSoup - главная страница документации.
 
+    :returns: list[Tag]: Ссылки на версии.
+    :raises RuntimeError: Если список версий не найден.
     """
-    soup = get_soup(session, MAIN_DOC_URL)
     ul_tags = soup.select('div.sphinxsidebarwrapper > ul')
     for ul in ul_tags:
         if 'All versions' in ul.text:
-            a_tags = ul.find_all('a')
-            break
+            return ul.find_all('a')
+    for ul in ul_tags:
+        if VERSION_PATTERN.search(ul.text):
+            return ul.find_all('a')
+    raise RuntimeError(Literals.PYTHON_VERSIONS_NOT_FOUND)
+
+
+def version_row(a_tag: Tag) -> tuple[str, str, str]:
+    """
+    Извлекает ссылку, номер и статус версии документации.
+
+    :param a_tag: Tag - ссылка на версию.
+
+    :returns: tuple[str, str, str]: Ссылка, версия и статус.
+    """
+    text_match = VERSION_PATTERN.search(a_tag.text)
+    if text_match:
+        version, status = text_match.groups()
     else:
-        raise RuntimeError(Literals.PYTHON_VERSIONS_NOT_FOUND)
-    results = [('Ссылка на документацию', 'Версия', 'Статус')]
-    pattern = r'Python (?P<version>\d\.\d+) \((?P<status>.*)\)'
-    for a_tag in tqdm(
-        a_tags,
-        Literals.COLLECTING_URLS,
-        colour=UtilityConstants.PROGRESS_BAR_COLOR
-    ):
-        text_match = re.search(pattern, a_tag.text)
-        if text_match:
-            version, status = text_match.groups()
-        else:
-            version, status = a_tag.text, ''
-        results.append(
-            (a_tag['href'], version, status)
-        )
-    return results
+        version, status = a_tag.text, ''
+    return a_tag['href'], version, status
 
 
-def download(session: CachedSession) -> None:
+def latest_versions_rows(
+        session: CachedSession, doc_url: str
+) -> list[tuple[str, str, str]]:
+    """Собирает версии документации с главной страницы doc_url."""
+    return [
+        version_row(a_tag)
+        for a_tag in version_links(get_soup(session, doc_url))
+    ]
+
+
+def latest_versions_by_language(
+        session: CachedSession, cli_args: Namespace
+) -> ResultTable:
+    """
+    Параллельно собирает версии документации для нескольких языков.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Namespace - аргументы командной строки, содержащие
+     языки и количество соединений.
+
+    :returns: ResultTable: Таблица, строки которой содержат язык,
+     ссылку на документацию, версию, и статус версии.
+    """
+    languages = resolve_languages(session, cli_args.languages)
+    results = ResultTable(
+        ('Язык', 'Ссылка на документацию', 'Версия', 'Статус'),
+        key_columns=2
+    )
+    logger_stack = []
+    with language_executor(cli_args) as executor:
+        futures = {
+            executor.submit(
+                latest_versions_rows, session, edition_url(language)
+            ): language
+            for language in languages
+        }
+        rows, incomplete = collect_futures(futures, logger_stack)
+    results.extend(
+        (language, *row)
+        for future, language in futures.items()
+        for row in rows.get(future, ())
+    )
+    manage_logging(logger_stack)
+    return mark_incomplete(results) if incomplete else results
+
+
+def latest_versions(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> Optional[ResultTable]:
+    """
+    Получает ссылки на последние версии документации Python и возвращает
+    список кортежей, содержащих ссылку на документацию, версию, и статус
+    версии.
+
+    С аргументом --languages обходит несколько языковых версий
+    документации параллельно и добавляет к результатам столбец с языком.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+
+    :returns: Optional[ResultTable]: Таблица, строки которой содержат
+     ссылку на документацию, версию, и статус версии.
+
+    """
+    if getattr(cli_args, 'languages', None):
+        return latest_versions_by_language(session, cli_args)
+    a_tags = version_links(get_soup(session, MAIN_DOC_URL))
+    return ResultTable(
+        ('Ссылка на документацию', 'Версия', 'Статус'),
+        (version_row(a_tag) for a_tag in progress(
+            a_tags,
+            Literals.COLLECTING_URLS
+        ))
+    )
+
+
+def download(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> None:
     """
-    Скачивает архив документации Python и сохраняет его в каталог "downloads".
+    Скачивает архивы документации Python и сохраняет их в каталог
+    "downloads".
+
+    Архивы запрошенных форматов загружаются параллельно, но не более
+    чем через заданное количество соединений. Архивы, локальные копии
+    которых совпадают с удалёнными по ETag или размеру, пропускаются.
 
     :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
 
     :returns: None
     """
     downloads_url = urljoin(MAIN_DOC_URL, 'download.html')
-    pdf_relative_url = get_soup(session, downloads_url).select_one(
-        'div.body > table.docutils a[href$="pdf-a4.zip"]'
-    )['href']
-    archive_url = urljoin(downloads_url, pdf_relative_url)
-    filename = archive_url.split('/')[-1]
+    archives = select_formats(
+        discover_archives(get_soup(session, downloads_url), downloads_url),
+        getattr(cli_args, 'formats', None) or [DEFAULT_DOWNLOAD_FORMAT]
+    )
     downloads_dir = BASE_DIR / PathConstants.DOWNLOADS_PATH
     downloads_dir.mkdir(exist_ok=True)
-    archive_path = downloads_dir / filename
-    response = get_response(session, archive_url)
-    with open(archive_path, 'wb') as file:
-        file.write(response.content)
-    logging.info(Literals.ARCHIVE_DOWNLOADED.format(archive_path))
+    manifest = load_manifest(downloads_dir)
+    logger_stack = []
+    downloaded_bytes, skipped = 0, 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=getattr(cli_args, 'max_connections', None)
+        or UtilityConstants.MAX_CONNECTIONS
+    ) as executor:
+        futures = {
+            executor.submit(
+                download_archive, session, url, downloads_dir / filename,
+                manifest.get(filename)
+            ): downloads_dir / filename
+            for filename, url in (
+                (url.split('/')[-1], url) for url in archives.values()
+            )
+        }
+        for future in progress(
+            as_completed(futures),
+            Literals.DOWNLOADING_ARCHIVES,
+            total=len(futures)
+        ):
+            archive_path = futures[future]
+            try:
+                record, size = future.result()
+            except ConnectionError as error:
+                logger_stack.append(error)
+                continue
+            if record is None:
+                skipped += 1
+                logging.info(Literals.ARCHIVE_UP_TO_DATE.format(archive_path))
+                continue
+            manifest[archive_path.name] = record
+            downloaded_bytes += size
+            logging.info(Literals.ARCHIVE_DOWNLOADED.format(archive_path))
+    save_manifest(downloads_dir, manifest)
+    manage_logging(logger_stack)
+    elapsed = time.perf_counter() - started
+    logging.info(Literals.DOWNLOAD_THROUGHPUT.format(
+        len(futures) - skipped - len(logger_stack), skipped,
+        downloaded_bytes / 1_000_000, elapsed,
+        downloaded_bytes / 1_000_000 / elapsed if elapsed else 0
+    ))
 
 
-def pep(session: CachedSession) -> Optional[list[tuple[str, str]]]:
+def load_pep_state(checkpoint_path: Path, resume: bool) -> dict:
     """
-    Собирает статусы PEP из основного каталога PEP и возвращает
-    список кортежей, содержащий статус и количество PEP с этим статусом.
+    Загружает состояние сбора статусов PEP из контрольной точки.
 
-    :param session: CachedSession - сессия, используемая для запроса.
+    :param checkpoint_path: Path - путь к файлу контрольной точки.
+    :param resume: bool - продолжать ли работу с контрольной точки.
+
+    :returns: dict: Словарь с обработанными PEP, количеством статусов
+     и найденными несовпадениями.
+    """
+    state = load_checkpoint(checkpoint_path) if resume else None
+    if state is None:
+        if resume:
+            logging.info(Literals.CHECKPOINT_NOT_FOUND.format(checkpoint_path))
+        return {'processed': {}, 'status_codes': {}, 'mismatches': []}
+    logging.info(Literals.CHECKPOINT_RESUMED.format(
+        checkpoint_path, len(state['processed'])
+    ))
+    return state
 
-    :returns: List[tuple[str, str]]: Список кортежей,
-     содержащих статус и количество PEP с этим статусом.
 
+def parse_pep_status(
+        soup: BeautifulSoup,
+        pep_url: str,
+        table_status: str,
+        mismatches: list[str]
+) -> str:
+    """
+    Получает статус PEP с его страницы и сверяет его со статусом в таблице.
+
+    :param soup: BeautifulSoup - страница PEP.
+    :param pep_url: str - ссылка на страницу PEP.
+    :param table_status: str - сокращение статуса из общей таблицы.
+    :param mismatches: list[str] - список, в который добавляется
+     сообщение о несовпадении статусов.
+
+    :returns: str: Статус PEP, указанный в карточке.
+    """
+    page_status = soup.select_one('#pep-content > dl abbr').text
+    if (
+        page_status and page_status not in
+        EXPECTED_STATUS.get(table_status)
+    ):
+        mismatches.append(
+            Literals.UNEXPECTED_PEP_STATUS.format(
+                pep_url, page_status, EXPECTED_STATUS.get(table_status)
+            )
+        )
+    return page_status
+
+
+def get_pep_links(session: CachedSession) -> tuple[list[str], list[str]]:
+    """
+    Получает из основного каталога PEP ссылки на PEP и их статусы.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+
+    :returns: tuple[list[str], list[str]]: Относительные ссылки на PEP
+     и сокращения статусов из таблицы.
     """
-    logger_stack = []
     soup = get_soup(session, PEP_MAIN_URL)
     pep_relative_links = sorted(set(
         [url.get('href') for url in soup.select(
@@ -141,39 +599,291 @@ def pep(session: CachedSession) -> Optional[list[tuple[str, str]]]:
             'docutils.align-default abbr'
         )
     ]
-    pep_status_codes = defaultdict(int)
-    mismatches = []
-    for number, url in tqdm(
-        enumerate(pep_relative_links),
-        Literals.COLLECTING_STATUSES,
-        colour=UtilityConstants.PROGRESS_BAR_COLOR,
-        total=len(pep_relative_links)
-    ):
-        try:
-            soup = get_soup(session, urljoin(PEP_MAIN_URL, url))
-            page_status = soup.select_one('#pep-content > dl abbr').text
-            if (
-                page_status and page_status not in
-                EXPECTED_STATUS.get(table_statuses[number])
-            ):
-                mismatches.append(
-                    Literals.UNEXPECTED_PEP_STATUS.format(
-                        urljoin(PEP_MAIN_URL, url), page_status,
-                        EXPECTED_STATUS.get(table_statuses[number])
-                    )
-                )
-            pep_status_codes[page_status] += 1
-        except ConnectionError as error:
-            logger_stack.append(error)
-    logging.warning('\n'.join(mismatches))
+    return pep_relative_links, table_statuses
+
+
+def crawl_peps(
+        session: CachedSession,
+        cli_args: Optional[Namespace],
+        checkpoint_name: str,
+        page_handlers: tuple[Callable[[str, BeautifulSoup], None], ...] = ()
+) -> tuple[dict, bool]:
+    """
+    Обходит страницы всех PEP, собирая их статусы и передавая
+    каждую страницу дополнительным обработчикам.
+
+    Прогресс периодически сохраняется в контрольную точку, поэтому
+    прерванный запуск можно продолжить с флагом --resume.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+    :param checkpoint_name: str - имя контрольной точки.
+    :param page_handlers: Функции, вызываемые со ссылкой на PEP
+     и его страницей.
+
+    :returns: tuple[dict, bool]: Состояние обхода (обработанные PEP,
+     количество статусов, несовпадения) и признак неполных результатов.
+    """
+    logger_stack = []
+    pep_relative_links, table_statuses = get_pep_links(session)
+    checkpoint_path = get_checkpoint_path(BASE_DIR, checkpoint_name)
+    state = load_pep_state(
+        checkpoint_path, getattr(cli_args, 'resume', False)
+    )
+    processed = state['processed']
+    pep_status_codes = state['status_codes']
+    incomplete = False
+    pending = [
+        (number, url) for number, url in enumerate(pep_relative_links)
+        if url not in processed
+    ]
+    try:
+        for (number, url), future in progress(
+            fetch_ordered(
+                lambda item: get_soup(session, urljoin(PEP_MAIN_URL,
+                                                       item[1])),
+                pending, fetch_workers(cli_args), memory_budget(cli_args)
+            ),
+            Literals.COLLECTING_STATUSES,
+            total=len(pending)
+        ):
+            pep_url = urljoin(PEP_MAIN_URL, url)
+            try:
+                soup = future.result()
+            except ConnectionError as error:
+                logger_stack.append(error)
+                continue
+            except DeadlineExceededException:
+                incomplete = True
+                break
+            page_status = parse_pep_status(
+                soup, pep_url, table_statuses[number], state['mismatches']
+            )
+            for handler in page_handlers:
+                handler(pep_url, soup)
+            soup.decompose()
+            processed[url] = page_status
+            pep_status_codes[page_status] = (
+                pep_status_codes.get(page_status, 0) + 1
+            )
+            if len(processed) % UtilityConstants.CHECKPOINT_INTERVAL == 0:
+                save_checkpoint(checkpoint_path, state)
+    finally:
+        save_checkpoint(checkpoint_path, state)
+        logging.info(Literals.CHECKPOINT_SAVED.format(
+            checkpoint_path, len(processed)
+        ))
+    METRICS.set('parser_pep_status_mismatches', len(state['mismatches']))
+    logging.warning('\n'.join(state['mismatches']))
     manage_logging(logger_stack)
+    return state, incomplete
+
+
+def metadata_path(cli_args: Optional[Namespace]) -> Path:
+    """
+    Возвращает путь к хранилищу метаданных PEP: указанный аргументом
+    --metadata-file или файл в базовом каталоге приложения.
+    """
+    return (getattr(cli_args, 'metadata_file', None)
+            or BASE_DIR / PathConstants.METADATA_FILE)
+
+
+def pep(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> Optional[ResultTable]:
+    """
+    Собирает статусы PEP из основного каталога PEP и возвращает
+    список кортежей, содержащий статус и количество PEP с этим статусом.
+
+    Все поля карточки каждого PEP сохраняются в хранилище метаданных
+    (см. metadata_path), по которому режим pep-query строит группировки
+    без повторного обхода.
+
+    С аргументом --delta возвращает статус каждого PEP, чтобы изменения
+    можно было отследить по отдельным PEP.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+
+    :returns: ResultTable: Таблица, строки которой содержат
+     статус и количество PEP с этим статусом.
+
+    """
+    with MetadataStore(metadata_path(cli_args)) as store:
+        state, incomplete = crawl_peps(
+            session, cli_args, 'pep', (store.add_page,)
+        )
+    pep_status_codes = state['status_codes']
+    if getattr(cli_args, 'delta', False):
+        results = ResultTable(('Ссылка на PEP', 'Статус'), (
+            (urljoin(PEP_MAIN_URL, url), status)
+            for url, status in state['processed'].items()
+        ))
+    else:
+        results = ResultTable(('Статус', 'Количество'), [
+            *pep_status_codes.items(),
+            ('Итого', str(sum(pep_status_codes.values())))
+        ])
+    return mark_incomplete(results) if incomplete else results
+
+
+def pep_index(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> ResultTable:
+    """
+    Обходит страницы PEP и обновляет локальный полнотекстовый индекс.
+
+    Страницы, текст которых не изменился с прошлой индексации,
+    повторно не разбираются на токены.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+
+    :returns: ResultTable: Сводка по обновлению индекса.
+    """
+    with SearchIndex(BASE_DIR / PathConstants.SEARCH_INDEX_FILE) as index:
+        _, incomplete = crawl_peps(
+            session, cli_args, 'pep-index', (index.add_page,)
+        )
+        results = ResultTable(
+            ('Документов в индексе', 'Проиндексировано', 'Без изменений'),
+            [(str(index.document_count()), str(index.indexed),
+              str(index.unchanged))]
+        )
+    return mark_incomplete(results) if incomplete else results
+
+
+def pep_search(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> ResultTable:
+    """
+    Ищет PEP по локальному полнотекстовому индексу без обращения к сети.
+
+    :param session: CachedSession - не используется, режим работает
+     только с индексом.
+    :param cli_args: Optional[Namespace] - аргументы командной строки,
+     содержащие запрос и количество результатов.
+
+    :returns: ResultTable: Таблица, строки которой содержат
+     ссылку на PEP, его заголовок и релевантность.
+    """
+    if not getattr(cli_args, 'query', None):
+        raise ValueError(Literals.SEARCH_QUERY_REQUIRED)
+    with SearchIndex(BASE_DIR / PathConstants.SEARCH_INDEX_FILE) as index:
+        hits = index.search(cli_args.query, cli_args.limit)
+    return ResultTable(
+        ('Ссылка на PEP', 'Заголовок', 'Релевантность'),
+        [(url, title, f'{score:.3f}') for url, title, score in hits]
+    )
+
+
+def pep_query(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> ResultTable:
+    """
+    Группирует PEP из хранилища метаданных по указанным полям,
+    например по статусу и типу или по версии Python.
+
+    :param session: CachedSession - не используется, режим работает
+     только с хранилищем метаданных.
+    :param cli_args: Optional[Namespace] - аргументы командной строки,
+     содержащие поля группировки.
+
+    :returns: ResultTable: Таблица, строки которой содержат значения
+     полей и количество PEP.
+    """
+    columns = getattr(cli_args, 'group_by', None) or ['status']
+    with MetadataStore(metadata_path(cli_args)) as store:
+        groups = store.group_by(columns)
+        total = store.count()
+    return ResultTable(
+        (*(METADATA_LABELS[column] for column in columns), 'Количество'),
+        [
+            *((*(value or '' for value in group[:-1]), str(group[-1]))
+              for group in groups),
+            ('Итого', *[''] * (len(columns) - 1), str(total))
+        ]
+    )
+
+
+def compression_stats(session: CachedSession) -> list[tuple[str, str, str]]:
+    """
+    Формирует строки статистики сжатия кеша для режима cache-stats.
+
+    :param session: CachedSession - сессия, кеш которой анализируется.
+
+    :returns: list[tuple[str, str, str]]: Объём записей до и после
+     сжатия; пустой список, если кеш хранится не в SQLite.
+    """
+    sizes = stored_sizes(session)
+    if sizes is None:
+        return []
+    ratio = sizes['raw'] / sizes['stored'] if sizes['stored'] else 1
     return [
-        ('Статус', 'Количество'),
-        *pep_status_codes.items(),
-        ('Итого', str(sum(pep_status_codes.values())))
+        ('Объём без сжатия', str(sizes['entries']), str(sizes['raw'])),
+        ('Объём в кеше', str(sizes['entries']), str(sizes['stored'])),
+        ('Сжатых записей', str(sizes['compressed']), ''),
+        ('Степень сжатия', f'{ratio:.2f}', ''),
     ]
 
 
+def page_store_stats(session: CachedSession) -> list[tuple[str, str, str]]:
+    """
+    Формирует строки статистики хранилища страниц для режима cache-stats.
+
+    :param session: CachedSession - сессия, к которой подключено
+     хранилище страниц.
+
+    :returns: list[tuple[str, str, str]]: Количество адресов и файлов
+     страниц и их объём; пустой список, если хранилище не подключено.
+    """
+    store = getattr(session, 'page_store', None)
+    if store is None:
+        return []
+    stats = store.stats()
+    return [
+        ('Адресов в хранилище страниц', str(stats['urls']), ''),
+        ('Файлов в хранилище страниц', str(stats['objects']),
+         str(stats['bytes'])),
+    ]
+
+
+def cache_stats(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> ResultTable:
+    """
+    Собирает статистику кеша: количество записей и объём по префиксам
+    URL, объём кеша до и после сжатия, а также накопленную долю
+    попаданий в кеш.
+
+    :param session: CachedSession - сессия, кеш которой анализируется.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+
+    :returns: ResultTable: Таблица, строки которой содержат
+     префикс URL, количество записей и их объём в байтах.
+    """
+    stats = collect_cache_stats(session)
+    usage = load_cache_usage(BASE_DIR / PathConstants.CACHE_USAGE_FILE)
+    requests_total = usage['hits'] + usage['misses']
+    hit_rate = usage['hits'] / requests_total if requests_total else 0
+    return ResultTable(('Префикс', 'Записей', 'Байт'), [
+        *((prefix, str(count), str(size))
+          for prefix, (count, size) in stats.items()),
+        ('Итого', str(sum(count for count, _ in stats.values())),
+         str(sum(size for _, size in stats.values()))),
+        *compression_stats(session),
+        *page_store_stats(session),
+        ('Попаданий в кеш', str(usage['hits']), ''),
+        ('Промахов кеша', str(usage['misses']), ''),
+        ('Доля попаданий', f'{hit_rate:.1%}', ''),
+    ])
+
+
 MODE_TO_FUNCTION = {
     'whats-new': whats_new,
     'latest-versions': latest_versions,
@@ -182,6 +892,144 @@ MODE_TO_FUNCTION = {
 }
 
 
+def remove_checkpoint_after(mode: str, function: Callable) -> Callable:
+    """
+    Оборачивает функцию режима так, чтобы после получения полных
+    результатов удалялась его контрольная точка, как в main. Иначе
+    контрольная точка, оставшаяся от обновления в режиме сервиса,
+    заставила бы последующий запуск с флагом --resume пропустить
+    все страницы.
+
+    :param mode: str - режим работы парсера.
+    :param function: Callable - функция режима.
+
+    :returns: Callable: Функция режима, удаляющая контрольную точку.
+    """
+    def refresh(
+            session: CachedSession,
+            cli_args: Optional[Namespace] = None
+    ) -> Optional[ResultTable]:
+        results = function(session, cli_args)
+        if is_complete(results):
+            remove_checkpoint(get_checkpoint_path(BASE_DIR, mode))
+        return results
+
+    return refresh
+
+
+def serve(
+        session: CachedSession,
+        cli_args: Optional[Namespace] = None
+) -> None:
+    """
+    Запускает парсер в режиме сервиса: результаты режимов периодически
+    обновляются с использованием одной "тёплой" сессии и отдаются
+    по HTTP в формате JSON или CSV.
+
+    Записи кеша устаревают через интервал обновления, после чего
+    requests_cache перепроверяет их условными запросами, поэтому
+    неизменившиеся страницы повторно не загружаются. Записи, сохранённые
+    до запуска сервиса, помечаются устаревшими, чтобы первое обновление
+    тоже перепроверило их.
+
+    :param session: CachedSession - сессия, используемая для запросов.
+    :param cli_args: Optional[Namespace] - аргументы командной строки.
+
+    :returns: None
+    """
+    session.cache.reset_expiration(EXPIRE_IMMEDIATELY)
+    session.settings.expire_after = cli_args.refresh_interval
+    serve_results(
+        session,
+        {
+            mode: remove_checkpoint_after(mode, MODE_TO_FUNCTION[mode])
+            for mode in SERVED_MODES
+        },
+        cli_args
+    )
+
+
+SERVED_MODES = ('latest-versions', 'whats-new', 'pep')
+SERVICE_MODE_TO_FUNCTION = {
+    'cache-stats': cache_stats,
+    'serve': serve,
+    'pep-index': pep_index,
+    'pep-search': pep_search,
+    'pep-query': pep_query,
+}
+
+
+def prepare_page_store(args: Namespace) -> Optional[PageStore]:
+    """
+    Открывает хранилище страниц, если указан аргумент --page-store,
+    и применяет к нему очистку и инвалидацию кеша.
+
+    :param args: Namespace - аргументы командной строки.
+
+    :returns: Optional[PageStore]: Хранилище страниц или None.
+    """
+    if not args.page_store:
+        return None
+    store = PageStore(BASE_DIR / PathConstants.PAGE_STORE_DIR)
+    if args.clear_cache:
+        store.clear()
+    if args.invalidate or args.invalidate_older_than:
+        store.invalidate(args.invalidate, args.invalidate_older_than)
+    return store
+
+
+def prepare_session(args: Namespace) -> CachedSession:
+    """
+    Создаёт сессию, очищает или выборочно инвалидирует кеш
+    и привязывает к сессии политики запросов.
+
+    :param args: Namespace - аргументы командной строки.
+
+    :returns: CachedSession: Настроенная сессия.
+    """
+    session = CachedSession(serializer=compressing_serializer(
+        args.cache_compression, args.cache_compression_level
+    ))
+    if args.clear_cache:
+        session.cache.clear()
+    if args.invalidate or args.invalidate_older_than:
+        invalidate_cache(
+            session, args.invalidate, args.invalidate_older_than
+        )
+    session.deadline = Deadline(args.deadline) if args.deadline else None
+    session.hedging = HedgingPolicy() if args.hedge else None
+    session.page_store = prepare_page_store(args)
+    if args.http2:
+        mount_http2(session, args.max_connections)
+    return session
+
+
+def export_metrics(
+        args: Namespace, results: Optional[ResultTable], duration: float,
+        success: bool
+) -> None:
+    """
+    Фиксирует итоговые метрики запуска и экспортирует их, если указаны
+    аргументы --metrics-dir или --metrics-push.
+
+    :param args: Namespace - аргументы командной строки.
+    :param results: Результаты режима парсера или None.
+    :param duration: Длительность запуска в секундах.
+    :param success: Завершился ли запуск без ошибок.
+
+    :returns: None
+    """
+    METRICS.finish_run(
+        ResultTable.coerce(results).row_count if results else None,
+        duration, success and is_complete(results)
+    )
+    if args.metrics_dir:
+        path = METRICS.write_textfile(args.metrics_dir)
+        logging.info(Literals.METRICS_WRITTEN.format(path))
+    if args.metrics_push:
+        METRICS.push(args.metrics_push)
+
+
 def main() -> None:
     """
     Основная функция для запуска парсера.
@@ -193,23 +1041,44 @@ def main() -> None:
 
     :returns: None
     """
+    started = time.monotonic()
+    args = results = session = None
+    success = False
     try:
         configure_logging()
         logging.info(Literals.PARSER_STARTED)
-        arg_parser = configure_argument_parser(MODE_TO_FUNCTION.keys())
+        modes = {**MODE_TO_FUNCTION, **SERVICE_MODE_TO_FUNCTION}
+        arg_parser = configure_argument_parser(modes.keys())
         args = arg_parser.parse_args()
+        METRICS.mode = args.mode
         logging.info(Literals.PARSER_ARGS.format(args))
-        session = CachedSession()
-        if args.clear_cache:
-            session.cache.clear()
+        configure_signal_handlers()
+        session = prepare_session(args)
         parser_mode = args.mode
-        results = MODE_TO_FUNCTION[parser_mode](session)
+        with memory_report(args.memory_report, parser_mode):
+            results = modes[parser_mode](session, args)
+        if results and args.delta:
+            results = apply_delta(
+                results, get_snapshot_path(BASE_DIR, parser_mode)
+            )
         if results:
             control_output(results, args)
+        if is_complete(results):
+            remove_checkpoint(get_checkpoint_path(BASE_DIR, parser_mode))
+        save_cache_usage(BASE_DIR / PathConstants.CACHE_USAGE_FILE)
+        if session.hedging is not None:
+            logging.info(
+                Literals.HEDGED_REQUESTS.format(session.hedging.hedged)
+            )
         logging.info(Literals.PARSER_FINISHED)
+        success = True
     except Exception as error:
         logging.exception(Literals.PARSER_EXCEPTION.format(error),
                           stack_info=True)
+    if getattr(session, 'hedging', None) is not None:
+        session.hedging.close()
+    if args is not None:
+        export_metrics(args, results, time.monotonic() - started, success)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,155 @@
+import argparse
+import logging
+import os
+import re
+import sys
+import threading
+import tracemalloc
+from argparse import Namespace
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from constants import Literals, UtilityConstants
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+STATM_PATH = '/proc/self/statm'
+
+
+def parse_size(value: str) -> int:
+    """
+    Преобразует строку вида "512M" или "2G" в количество байт.
+
+    :param value: Размер с необязательным суффиксом K, M или G.
+
+    :returns: int: Размер в байтах.
+    :raises ArgumentTypeError: Если строка не распознана.
+    """
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([KMG]?)B?', value.strip().upper())
+    if not match:
+        raise argparse.ArgumentTypeError(
+            Literals.INVALID_MEMORY_SIZE.format(value)
+        )
+    amount, unit = match.groups()
+    return int(float(amount) * SIZE_UNITS[unit])
+
+
+def format_size(size: float) -> str:
+    """Форматирует размер в байтах в мебибайтах."""
+    return f'{size / SIZE_UNITS["M"]:.1f} MiB'
+
+
+def current_rss() -> Optional[int]:
+    """
+    Возвращает текущий объём резидентной памяти процесса.
+
+    :returns: Optional[int]: Объём в байтах или None, если система
+     не предоставляет /proc/self/statm.
+    """
+    try:
+        with open(STATM_PATH) as file:
+            resident = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident * os.sysconf('SC_PAGE_SIZE')
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Возвращает пиковый объём резидентной памяти процесса.
+
+    :returns: Optional[int]: Объём в байтах или None, если модуль
+     resource недоступен.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MemoryBudget:
+    """
+    Ограничение памяти процесса для обхода страниц.
+
+    Пока резидентная память превышает лимит, новые страницы
+    не загружаются заранее: в обработке остаётся одна страница,
+    а её дерево разрушается сразу после извлечения данных.
+
+    :param limit: Лимит резидентной памяти в байтах.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def exceeded(self) -> bool:
+        """Проверяет, превышен ли лимит памяти."""
+        rss = current_rss() or peak_rss()
+        if rss is None or rss <= self.limit:
+            return False
+        with self.lock:
+            if not self.throttled:
+                logging.warning(Literals.MEMORY_BUDGET_EXCEEDED.format(
+                    format_size(rss), format_size(self.limit)
+                ))
+            self.throttled += 1
+        return True
+
+
+def memory_budget(cli_args: Optional[Namespace]) -> Optional[MemoryBudget]:
+    """Создаёт ограничение памяти по аргументу --max-memory."""
+    limit = getattr(cli_args, 'max_memory', None)
+    return MemoryBudget(limit) if limit else None
+
+
+def log_memory_report(mode: str, snapshot: tracemalloc.Snapshot) -> None:
+    """
+    Сообщает в лог пиковую память процесса и места, выделившие
+    больше всего памяти.
+
+    :param mode: Режим работы парсера.
+    :param snapshot: Снимок распределения памяти tracemalloc.
+
+    :returns: None
+    """
+    _, traced_peak = tracemalloc.get_traced_memory()
+    rss = peak_rss()
+    logging.info(Literals.MEMORY_PEAK.format(
+        mode, format_size(rss) if rss is not None else '?',
+        format_size(traced_peak)
+    ))
+    statistics = snapshot.statistics('lineno')
+    for statistic in statistics[:UtilityConstants.MEMORY_REPORT_TOP]:
+        frame = statistic.traceback[0]
+        logging.info(Literals.MEMORY_SITE.format(
+            frame.filename, frame.lineno, format_size(statistic.size),
+            statistic.count
+        ))
+
+
+@contextmanager
+def memory_report(enabled: bool, mode: str) -> Iterator[None]:
+    """
+    Отслеживает распределение памяти на время работы режима
+    и сообщает итоги в лог.
+
+    :param enabled: Включён ли отчёт (аргумент --memory-report).
+    :param mode: Режим работы парсера.
+    """
+    if not enabled:
+        yield
+        return
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ))
+        log_memory_report(mode, snapshot)
+        tracemalloc.stop()
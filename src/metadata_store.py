@@ -0,0 +1,146 @@
+import json
+import re
+import sqlite3
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+METADATA_LABELS = {
+    'author': 'Автор',
+    'type': 'Тип',
+    'created': 'Создан',
+    'python_version': 'Версия Python',
+    'status': 'Статус',
+    'resolution': 'Решение',
+    'requires': 'Зависит от',
+}
+METADATA_COLUMNS = tuple(METADATA_LABELS)
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS peps (
+    number INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT,
+    type TEXT,
+    created TEXT,
+    python_version TEXT,
+    status TEXT,
+    resolution TEXT,
+    requires TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS peps_status ON peps (status);
+CREATE INDEX IF NOT EXISTS peps_type ON peps (type);
+CREATE INDEX IF NOT EXISTS peps_python_version ON peps (python_version);
+'''
+PEP_NUMBER_PATTERN = re.compile(r'pep-(\d+)')
+
+
+def field_name(label: str) -> str:
+    """
+    Преобразует подпись поля карточки PEP в имя столбца.
+
+    :param label: Подпись поля, например "Python-Version:".
+
+    :returns: str: Имя столбца, например "python_version".
+    """
+    return re.sub(r'\W+', '_', label.strip().rstrip(':').lower()).strip('_')
+
+
+def parse_pep_metadata(soup: BeautifulSoup) -> dict[str, str]:
+    """
+    Извлекает все поля из карточки PEP ("#pep-content > dl").
+
+    :param soup: BeautifulSoup - страница PEP.
+
+    :returns: dict[str, str]: Имя поля и его значение.
+    """
+    fields = {}
+    card = soup.select_one('#pep-content > dl')
+    if card is None:
+        return fields
+    for term in card.find_all('dt'):
+        value = term.find_next_sibling('dd')
+        if value is not None:
+            fields[field_name(term.get_text(strip=True))] = value.get_text(
+                ' ', strip=True
+            )
+    return fields
+
+
+class MetadataStore:
+    """
+    Хранилище метаданных PEP в таблице SQLite с индексами по статусу,
+    типу и версии Python.
+
+    Группировки по этим столбцам вычисляются средствами SQLite
+    без повторного обхода страниц.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> 'MetadataStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def add_page(self, url: str, soup: BeautifulSoup) -> None:
+        """
+        Сохраняет метаданные со страницы PEP.
+
+        :param url: Ссылка на страницу PEP.
+        :param soup: BeautifulSoup - страница PEP.
+
+        :returns: None
+        """
+        number = PEP_NUMBER_PATTERN.search(url)
+        if number is None:
+            return
+        fields = parse_pep_metadata(soup)
+        title = soup.select_one('#pep-content h1')
+        extra = {
+            name: value for name, value in fields.items()
+            if name not in METADATA_COLUMNS
+        }
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO peps VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    int(number.group(1)), url,
+                    title.get_text(strip=True) if title else '',
+                    *(fields.get(column) for column in METADATA_COLUMNS),
+                    json.dumps(extra, ensure_ascii=False) if extra else None
+                )
+            )
+
+    def group_by(self, columns: list[str]) -> list[tuple]:
+        """
+        Подсчитывает количество PEP для каждого сочетания значений столбцов.
+
+        :param columns: Столбцы группировки из METADATA_COLUMNS.
+
+        :returns: list[tuple]: Значения столбцов и количество PEP,
+         по убыванию количества.
+        :raises ValueError: Если указан неизвестный столбец.
+        """
+        unknown = set(columns) - set(METADATA_COLUMNS)
+        if unknown:
+            raise ValueError(', '.join(sorted(unknown)))
+        selected = ', '.join(columns)
+        return self.connection.execute(
+            f'SELECT {selected}, COUNT(*) AS total FROM peps '
+            f'GROUP BY {selected} ORDER BY total DESC, {selected}'
+        ).fetchall()
+
+    def count(self) -> int:
+        """Возвращает количество PEP в хранилище."""
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM peps'
+        ).fetchone()[0]
@@ -0,0 +1,291 @@
+import bisect
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import requests
+from requests_cache import Response
+from tqdm import tqdm
+
+from checkpoints import atomic_write
+from constants import Literals, UtilityConstants
+from memory import peak_rss
+
+METRICS_JOB = 'bs4_parser_pep'
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+METRIC_DESCRIPTIONS = {
+    'parser_requests_total': (
+        'counter', 'Количество запросов страниц по источнику ответа'
+    ),
+    'parser_response_bytes_total': (
+        'counter', 'Объём полученных ответов в байтах'
+    ),
+    'parser_http_responses_total': (
+        'counter', 'Количество ответов по версии протокола HTTP'
+    ),
+    'parser_request_errors_total': (
+        'counter', 'Количество запросов, завершившихся ошибкой'
+    ),
+    'parser_request_duration_seconds': (
+        'histogram', 'Длительность HTTP-запросов'
+    ),
+    'parser_parse_duration_seconds': (
+        'histogram', 'Длительность разбора HTML-страниц'
+    ),
+    'parser_errors_total': (
+        'counter', 'Количество ошибок, накопленных режимом парсера'
+    ),
+    'parser_pep_status_mismatches': (
+        'gauge', 'Количество несовпадений статусов PEP'
+    ),
+    'parser_cache_hit_ratio': (
+        'gauge', 'Доля ответов, полученных из кеша'
+    ),
+    'parser_result_rows': (
+        'gauge', 'Количество строк в результатах'
+    ),
+    'parser_peak_rss_bytes': (
+        'gauge', 'Пиковый объём резидентной памяти процесса'
+    ),
+    'parser_run_duration_seconds': (
+        'gauge', 'Длительность запуска'
+    ),
+    'parser_run_success': (
+        'gauge', '1, если запуск завершился без ошибок'
+    ),
+    'parser_last_run_timestamp_seconds': (
+        'gauge', 'Время завершения последнего запуска'
+    ),
+}
+
+
+def format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    """Форматирует метки метрики в синтаксисе Prometheus."""
+    if not labels:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', r'\\').replace('"', r'\"')
+         .replace('\n', r'\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(
+        f'{name}="{value}"' for name, value in escaped
+    ) + '}'
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик запуска парсера: счётчики, значения и гистограммы.
+
+    Каждая метрика снабжается меткой mode с текущим режимом парсера.
+    Реестр потокобезопасен, поэтому его могут обновлять параллельные
+    загрузки.
+    """
+
+    def __init__(self) -> None:
+        self.mode = ''
+        self.values = defaultdict(float)
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def key(self, name: str, labels: dict) -> tuple:
+        return name, tuple(sorted({'mode': self.mode, **labels}.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Увеличивает счётчик."""
+        key = self.key(name, labels)
+        with self.lock:
+            self.values[key] += value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        """Устанавливает значение метрики."""
+        key = self.key(name, labels)
+        with self.lock:
+            self.values[key] = value
+
+    def value(self, name: str, **labels) -> float:
+        """Возвращает значение счётчика или метрики."""
+        with self.lock:
+            return self.values.get(self.key(name, labels), 0)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Добавляет наблюдение в гистограмму."""
+        key = self.key(name, labels)
+        with self.lock:
+            buckets, total = self.histograms.get(
+                key, ([0] * (len(DURATION_BUCKETS) + 1), [0.0, 0])
+            )
+            buckets[bisect.bisect_left(DURATION_BUCKETS, value)] += 1
+            total[0] += value
+            total[1] += 1
+            self.histograms[key] = buckets, total
+
+    def record_response(self, response: Response, elapsed: float) -> None:
+        """
+        Учитывает ответ на запрос: источник, объём и длительность.
+
+        :param response: Ответ, полученный из сети или из кеша.
+        :param elapsed: Длительность запроса в секундах.
+
+        :returns: None
+        """
+        source = 'cache' if getattr(response, 'from_cache', False) else (
+            'network'
+        )
+        self.inc('parser_requests_total', source=source)
+        self.inc('parser_response_bytes_total', len(response.content),
+                 source=source)
+        self.observe('parser_request_duration_seconds', elapsed,
+                     source=source)
+
+    def record_stored_page(self, size: int) -> None:
+        """Учитывает страницу, прочитанную из хранилища страниц."""
+        self.inc('parser_requests_total', source='page_store')
+        self.inc('parser_response_bytes_total', size, source='page_store')
+
+    def finish_run(
+            self, rows: Optional[int], duration: float, success: bool
+    ) -> None:
+        """
+        Фиксирует итоговые метрики запуска.
+
+        :param rows: Количество строк в результатах или None.
+        :param duration: Длительность запуска в секундах.
+        :param success: Завершился ли запуск без ошибок.
+
+        :returns: None
+        """
+        hits = self.value('parser_requests_total', source='cache')
+        total = hits + self.value('parser_requests_total', source='network')
+        self.set('parser_cache_hit_ratio', hits / total if total else 0)
+        if rows is not None:
+            self.set('parser_result_rows', rows)
+        rss = peak_rss()
+        if rss is not None:
+            self.set('parser_peak_rss_bytes', rss)
+        self.set('parser_run_duration_seconds', duration)
+        self.set('parser_run_success', int(success))
+        self.set('parser_last_run_timestamp_seconds', time.time())
+
+    def render_histogram(self, name: str, key: tuple, data: tuple) -> list:
+        """Форматирует гистограмму в синтаксисе Prometheus."""
+        buckets, (total, count) = data
+        lines, cumulative = [], 0
+        for bound, bucket in zip((*DURATION_BUCKETS, '+Inf'), buckets):
+            cumulative += bucket
+            lines.append(f'{name}_bucket'
+                         f'{format_labels((*key, ("le", bound)))} '
+                         f'{cumulative}')
+        lines.append(f'{name}_sum{format_labels(key)} {total}')
+        lines.append(f'{name}_count{format_labels(key)} {count}')
+        return lines
+
+    def render(self) -> str:
+        """
+        Форматирует все метрики в текстовом формате Prometheus.
+
+        :returns: str: Текст для textfile collector или Pushgateway.
+        """
+        with self.lock:
+            values = dict(self.values)
+            histograms = dict(self.histograms)
+        lines = []
+        for name, (metric_type, description) in METRIC_DESCRIPTIONS.items():
+            samples = [
+                f'{name}{format_labels(labels)} {value}'
+                for (metric, labels), value in sorted(values.items())
+                if metric == name
+            ]
+            for (metric, labels), data in sorted(histograms.items()):
+                if metric == name:
+                    samples.extend(self.render_histogram(name, labels, data))
+            if samples:
+                lines.extend((f'# HELP {name} {description}',
+                              f'# TYPE {name} {metric_type}', *samples))
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, directory: Path) -> Path:
+        """
+        Атомарно записывает метрики в файл для node_exporter textfile
+        collector.
+
+        :param directory: Каталог textfile collector.
+
+        :returns: Path: Путь к записанному файлу.
+        """
+        path = Path(directory) / f'{METRICS_JOB}_{self.mode}.prom'
+        atomic_write(path, self.render())
+        return path
+
+    def push(self, url: str) -> None:
+        """
+        Отправляет метрики в Prometheus Pushgateway, заменяя метрики
+        предыдущего запуска этого режима.
+
+        :param url: Адрес Pushgateway, например http://127.0.0.1:9091.
+
+        :returns: None
+        """
+        try:
+            requests.put(
+                f'{url.rstrip("/")}/metrics/job/{METRICS_JOB}'
+                f'/mode/{quote(self.mode, safe="")}',
+                data=self.render().encode('utf-8'),
+                timeout=UtilityConstants.METRICS_PUSH_TIMEOUT
+            ).raise_for_status()
+        except requests.RequestException as error:
+            logging.warning(Literals.METRICS_PUSH_FAILED.format(url, error))
+
+
+METRICS = MetricsRegistry()
+
+
+def log_progress(
+        iterable: Iterable, description: str, total: Optional[int]
+) -> Iterator:
+    """
+    Сообщает о ходе обработки в лог не чаще, чем раз в
+    UtilityConstants.PROGRESS_LOG_INTERVAL секунд.
+    """
+    reported = time.monotonic()
+    count = 0
+    for count, item in enumerate(iterable, 1):
+        yield item
+        if time.monotonic() - reported >= (
+                UtilityConstants.PROGRESS_LOG_INTERVAL
+        ):
+            reported = time.monotonic()
+            logging.info(Literals.PROGRESS.format(
+                description, count, total or '?'
+            ))
+    logging.info(Literals.PROGRESS.format(description, count, total or '?'))
+
+
+def progress(
+        iterable: Iterable, description: str, total: Optional[int] = None
+) -> Iterable:
+    """
+    Отображает ход обработки: в терминале — индикатором tqdm,
+    иначе — периодическими сообщениями в логе.
+
+    :param iterable: Обрабатываемые элементы.
+    :param description: Описание этапа.
+    :param total: Количество элементов, если известно заранее.
+
+    :returns: Iterable: Те же элементы.
+    """
+    if total is None and hasattr(iterable, '__len__'):
+        total = len(iterable)
+    if sys.stdout.isatty():
+        return tqdm(
+            iterable, description, total=total,
+            colour=UtilityConstants.PROGRESS_BAR_COLOR
+        )
+    return log_progress(iterable, description, total)
@@ -0,0 +1,488 @@
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import BaseRequestHandler
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+
+from constants import EXPECTED_STATUS, MAIN_DOC_URL, PEP_MAIN_URL
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:
+    h2 = None
+
+PEP_TYPES = ('I', 'P', 'S')
+FILLER_WORDS = (
+    'python', 'interpreter', 'syntax', 'module', 'import', 'typing',
+    'generator', 'coroutine', 'async', 'await', 'decorator', 'bytecode',
+    'unicode', 'packaging', 'release', 'deprecation', 'semantics',
+    'specification', 'rationale', 'backwards', 'compatibility', 'reference',
+    'implementation', 'garbage', 'collector', 'dictionary', 'iterator',
+)
+PEP_INDEX_TEMPLATE = (
+    '<html><body><section id="numerical-index">'
+    '<table class="pep-zero-table docutils align-default"><tbody>{}'
+    '</tbody></table></section></body></html>'
+)
+PEP_ROW_TEMPLATE = (
+    '<tr><td><abbr title="{status}">{abbr}</abbr></td>'
+    '<td><a href="{href}">{number}</a></td>'
+    '<td><a href="{href}">{title}</a></td></tr>'
+)
+PEP_PAGE_TEMPLATE = (
+    '<html><body><section id="pep-content"><h1>PEP {number} – {title}</h1>'
+    '<dl class="rfc2822 field-list simple">'
+    '<dt>Author:</dt><dd>{author}</dd>'
+    '<dt>Status:</dt><dd><abbr title="{status}">{status}</abbr></dd>'
+    '<dt>Type:</dt><dd>{type}</dd>'
+    '<dt>Created:</dt><dd>{created}</dd>'
+    '<dt>Python-Version:</dt><dd>{version}</dd>'
+    '</dl>{body}</section></body></html>'
+)
+DOCS_INDEX_TEMPLATE = (
+    '<html><body><div class="sphinxsidebarwrapper"><ul>{}'
+    '<li><a href="https://www.python.org/doc/versions/">All versions</a></li>'
+    '</ul></div></body></html>'
+)
+WHATS_NEW_INDEX_TEMPLATE = (
+    '<html><body><section id="what-s-new-in-python">'
+    '<div class="toctree-wrapper"><ul>{}</ul></div></section></body></html>'
+)
+WHATS_NEW_PAGE_TEMPLATE = (
+    '<html><body><section><h1>What’s New In Python {version}</h1>'
+    '<dl class="field-list simple"><dt>Editor:</dt><dd>{author}</dd></dl>'
+    '{body}</section></body></html>'
+)
+DOWNLOAD_TEMPLATE = (
+    '<html><body><div class="body"><table class="docutils"><tbody>{}'
+    '</tbody></table></div></body></html>'
+)
+SWITCHERS_TEMPLATE = (
+    "(function() {{\n'use strict';\n"
+    "var all_languages = {{\n{}}};\n"
+    "}})();\n"
+)
+ARCHIVE_SUFFIXES = (
+    '-pdf-a4.zip', '-pdf-a4.tar.bz2', '-pdf-letter.zip',
+    '-pdf-letter.tar.bz2', '-html.zip', '-html.tar.bz2', '-text.zip',
+    '-text.tar.bz2', '-texinfo.zip', '-texinfo.tar.bz2', '.epub',
+)
+CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class MockSiteConfig:
+    """
+    Параметры генерируемого сайта и сетевых условий.
+
+    :param peps: Количество PEP в индексе.
+    :param versions: Количество страниц "What's new".
+    :param page_size: Примерный размер страницы PEP в байтах.
+    :param archive_size: Размер архива документации в байтах.
+    :param latency: Задержка перед ответом в секундах.
+    :param error_rate: Доля запросов, завершающихся ошибкой 500.
+    :param bandwidth: Скорость отдачи тела ответа в байтах в секунду.
+    :param seed: Зерно генератора псевдослучайных данных.
+    :param languages: Языковые версии документации.
+    """
+    peps: int = 700
+    versions: int = 30
+    page_size: int = 20_000
+    archive_size: int = 1_000_000
+    latency: float = 0.0
+    error_rate: float = 0.0
+    bandwidth: Optional[int] = None
+    seed: int = 0
+    languages: tuple[str, ...] = ('en',)
+
+
+def pep_number_width(config: MockSiteConfig) -> int:
+    """Ширина номера PEP в ссылке, чтобы сортировка совпадала с числовой."""
+    return max(4, len(str(config.peps)))
+
+
+def pep_status(config: MockSiteConfig, number: int) -> tuple[str, str]:
+    """
+    Детерминированно выбирает тип и статус PEP.
+
+    :returns: tuple[str, str]: Сокращение для индекса и полный статус.
+    """
+    generator = random.Random(config.seed * 1_000_003 + number)
+    abbr_status = generator.choice(sorted(EXPECTED_STATUS))
+    status = generator.choice(EXPECTED_STATUS[abbr_status])
+    return generator.choice(PEP_TYPES) + abbr_status, status
+
+
+def filler_text(generator: random.Random, size: int) -> str:
+    """Генерирует абзацы текста примерно заданного размера."""
+    paragraphs, length = [], 0
+    while length < size:
+        paragraph = ' '.join(generator.choices(FILLER_WORDS, k=60))
+        paragraphs.append(f'<p>{paragraph}</p>')
+        length += len(paragraph) + 7
+    return ''.join(paragraphs)
+
+
+def render_pep_index(config: MockSiteConfig) -> str:
+    """Генерирует страницу индекса PEP."""
+    width = pep_number_width(config)
+    rows = []
+    for number in range(config.peps):
+        abbr, status = pep_status(config, number)
+        rows.append(PEP_ROW_TEMPLATE.format(
+            status=status, abbr=abbr, number=number,
+            href=f'pep-{number:0{width}d}/', title=f'Proposal {number}'
+        ))
+    return PEP_INDEX_TEMPLATE.format(''.join(rows))
+
+
+def render_pep_page(config: MockSiteConfig, number: int) -> Optional[str]:
+    """Генерирует страницу отдельного PEP."""
+    if not 0 <= number < config.peps:
+        return None
+    generator = random.Random(config.seed * 7_919 + number)
+    abbr, status = pep_status(config, number)
+    return PEP_PAGE_TEMPLATE.format(
+        number=number, title=f'Proposal {number}', status=status,
+        author=f'Author {generator.randrange(100)}',
+        type={'I': 'Informational', 'P': 'Process',
+              'S': 'Standards Track'}[abbr[0]],
+        created=f'{generator.randrange(1, 29):02d}-Jan-20{number % 25:02d}',
+        version=f'3.{generator.randrange(14)}',
+        body=filler_text(generator, config.page_size)
+    )
+
+
+def render_docs_index(config: MockSiteConfig) -> str:
+    """Генерирует главную страницу документации со списком версий."""
+    links = ''.join(
+        f'<li><a href="https://docs.python.org/3.{minor}/">'
+        f'Python 3.{minor} (stable)</a></li>'
+        for minor in range(config.versions - 1, -1, -1)
+    )
+    return DOCS_INDEX_TEMPLATE.format(links)
+
+
+def render_whats_new_index(config: MockSiteConfig) -> str:
+    """Генерирует оглавление раздела "What's new"."""
+    links = ''.join(
+        f'<li class="toctree-l1"><a href="3.{minor}.html">'
+        f'What’s New In Python 3.{minor}</a></li>'
+        for minor in range(config.versions - 1, -1, -1)
+    )
+    return WHATS_NEW_INDEX_TEMPLATE.format(links)
+
+
+def render_whats_new_page(config: MockSiteConfig, minor: int) -> Optional[str]:
+    """Генерирует страницу "What's new" для версии Python."""
+    if not 0 <= minor < config.versions:
+        return None
+    generator = random.Random(config.seed * 104_729 + minor)
+    return WHATS_NEW_PAGE_TEMPLATE.format(
+        version=f'3.{minor}', author=f'Editor {generator.randrange(100)}',
+        body=filler_text(generator, config.page_size)
+    )
+
+
+def render_download_page(config: MockSiteConfig) -> str:
+    """Генерирует страницу загрузки архивов документации."""
+    rows = ''.join(
+        f'<tr><td><a href="archives/python-3-docs{suffix}">'
+        f'{suffix[1:]}</a></td></tr>'
+        for suffix in ARCHIVE_SUFFIXES
+    )
+    return DOWNLOAD_TEMPLATE.format(rows)
+
+
+def render_switchers(config: MockSiteConfig) -> str:
+    """Генерирует скрипт переключателя версий и языков документации."""
+    languages = ''.join(
+        f"  '{language}': '{language.upper()}',\n"
+        for language in config.languages
+    )
+    return SWITCHERS_TEMPLATE.format(languages)
+
+
+def strip_language(config: MockSiteConfig, path: str) -> str:
+    """
+    Приводит путь к странице переведённой документации к пути
+    английской версии, например "/docs/fr/3/" к "/docs/3/".
+    """
+    language, _, tail = path[len('/docs/'):].partition('/')
+    if (path.startswith('/docs/') and language in config.languages
+            and tail.startswith('3/')):
+        return '/docs/' + tail
+    return path
+
+
+def urljoin_root(url: str) -> str:
+    """Возвращает корень сайта для указанного URL."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, '/', '', ''))
+
+
+def render_page(config: MockSiteConfig, path: str) -> Optional[bytes]:
+    """
+    Генерирует тело ответа для пути на локальном сервере.
+
+    :param config: Параметры генерируемого сайта.
+    :param path: Путь запроса.
+
+    :returns: Optional[bytes]: Тело ответа или None для неизвестного пути.
+    """
+    page = None
+    path = strip_language(config, path)
+    if path == '/peps/':
+        page = render_pep_index(config)
+    elif path.startswith('/peps/pep-') and path.endswith('/'):
+        page = render_pep_page(config, int(path[len('/peps/pep-'):-1]))
+    elif path == '/docs/3/':
+        page = render_docs_index(config)
+    elif path == '/docs/3/whatsnew/':
+        page = render_whats_new_index(config)
+    elif path.startswith('/docs/3/whatsnew/3.') and path.endswith('.html'):
+        page = render_whats_new_page(
+            config, int(path[len('/docs/3/whatsnew/3.'):-len('.html')])
+        )
+    elif path == '/docs/3/download.html':
+        page = render_download_page(config)
+    elif path == '/docs/3/_static/switchers.js':
+        page = render_switchers(config)
+    elif path.startswith('/docs/3/archives/'):
+        return random.Random(path).randbytes(config.archive_size)
+    return page.encode('utf-8') if page is not None else None
+
+
+def build_response(
+        config: MockSiteConfig, path: str, if_none_match: Optional[str]
+) -> tuple[int, bytes, Optional[str]]:
+    """
+    Формирует ответ локального сервера с учётом задержки, доли ошибок
+    и условного запроса.
+
+    :param config: Параметры генерируемого сайта.
+    :param path: Путь запроса.
+    :param if_none_match: Значение заголовка If-None-Match.
+
+    :returns: tuple[int, bytes, Optional[str]]: Код ответа, тело и ETag.
+    """
+    if config.latency:
+        time.sleep(config.latency)
+    if config.error_rate and random.random() < config.error_rate:
+        return 500, b'Internal Server Error', None
+    body = render_page(config, urlsplit(path).path)
+    if body is None:
+        return 404, b'Not Found', None
+    etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+    if if_none_match == etag:
+        return 304, b'', etag
+    return 200, body, etag
+
+
+class MockSiteHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов к локальной копии сайтов PEP и документации."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_body(*build_response(
+            self.server.config, self.path, self.headers.get('If-None-Match')
+        ))
+
+    def send_body(
+            self, status: int, body: bytes, etag: Optional[str] = None
+    ) -> None:
+        """Отправляет тело ответа с учётом ограничения скорости."""
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        bandwidth = self.server.config.bandwidth
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class MockSiteServer(ThreadingHTTPServer):
+    """Локальный HTTP-сервер, генерирующий страницы PEP и документации."""
+
+    daemon_threads = True
+    handler_class = MockSiteHandler
+
+    def __init__(self, config: MockSiteConfig, host: str = '127.0.0.1',
+                 port: int = 0) -> None:
+        super().__init__((host, port), self.handler_class)
+        self.config = config
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    def process_request(self, request, client_address) -> None:
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def __enter__(self) -> 'MockSiteServer':
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class MockH2Handler(BaseRequestHandler):
+    """
+    Обработчик соединения HTTP/2 без TLS (h2c, prior knowledge).
+
+    Каждый поток отвечает в отдельном потоке выполнения, поэтому
+    задержки ответов на мультиплексированные запросы не складываются.
+    Ограничение скорости отдачи не поддерживается.
+    """
+
+    def setup(self) -> None:
+        self.connection = h2.connection.H2Connection(h2.config.H2Configuration(
+            client_side=False, header_encoding='utf-8'
+        ))
+        self.window_changed = threading.Condition()
+        self.closed = False
+
+    def handle(self) -> None:
+        with self.window_changed:
+            self.connection.initiate_connection()
+            self.flush()
+        while not self.closed:
+            data = self.request.recv(CHUNK_SIZE)
+            if not data:
+                break
+            with self.window_changed:
+                for event in self.connection.receive_data(data):
+                    self.dispatch(event)
+                self.flush()
+                self.window_changed.notify_all()
+        self.closed = True
+
+    def dispatch(self, event) -> None:
+        """Обрабатывает событие соединения HTTP/2."""
+        if isinstance(event, h2.events.RequestReceived):
+            threading.Thread(
+                target=self.respond, args=(event.stream_id,
+                                           dict(event.headers)),
+                daemon=True
+            ).start()
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            self.closed = True
+
+    def flush(self) -> None:
+        """Отправляет накопленные кадры."""
+        self.request.sendall(self.connection.data_to_send())
+
+    def respond(self, stream_id: int, headers: dict) -> None:
+        """Отвечает на запрос в потоке stream_id."""
+        status, body, etag = build_response(
+            self.server.config, headers[':path'], headers.get('if-none-match')
+        )
+        response_headers = [
+            (':status', str(status)),
+            ('content-type', 'text/html; charset=utf-8'),
+            ('content-length', str(len(body))),
+        ]
+        if etag:
+            response_headers.append(('etag', etag))
+        try:
+            with self.window_changed:
+                self.connection.send_headers(
+                    stream_id, response_headers, end_stream=not body
+                )
+                self.flush()
+            while body:
+                body = self.send_chunk(stream_id, body)
+        except (h2.exceptions.StreamClosedError, OSError):
+            return
+
+    def send_chunk(self, stream_id: int, body: bytes) -> bytes:
+        """
+        Отправляет часть тела ответа, которую допускает окно управления
+        потоком, дожидаясь его увеличения клиентом.
+
+        :returns: bytes: Неотправленная часть тела.
+        """
+        with self.window_changed:
+            window = self.connection.local_flow_control_window(stream_id)
+            while window <= 0 and not self.closed:
+                self.window_changed.wait(1)
+                window = self.connection.local_flow_control_window(stream_id)
+            if self.closed:
+                return b''
+            size = min(window, self.connection.max_outbound_frame_size,
+                       len(body))
+            self.connection.send_data(
+                stream_id, body[:size], end_stream=size == len(body)
+            )
+            self.flush()
+        return body[size:]
+
+
+class MockH2Server(MockSiteServer):
+    """
+    Локальный сервер HTTP/2 без TLS, генерирующий те же страницы,
+    что и MockSiteServer.
+    """
+
+    handler_class = MockH2Handler
+
+
+class MockSiteAdapter(HTTPAdapter):
+    """
+    Транспортный адаптер, перенаправляющий запросы к peps.python.org
+    и docs.python.org на локальный сервер.
+
+    Сохраняет длительность каждого запроса вместе с загрузкой тела ответа,
+    количество ошибок и объём полученных данных.
+    """
+
+    def __init__(self, server_url: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefixes = {
+            PEP_MAIN_URL: server_url + 'peps/',
+            urljoin_root(MAIN_DOC_URL): server_url + 'docs/',
+        }
+        self.latencies = []
+        self.errors = 0
+        self.bytes_received = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, *args, **kwargs):
+        for prefix, replacement in self.prefixes.items():
+            if request.url.startswith(prefix):
+                request.url = replacement + request.url[len(prefix):]
+                break
+        started = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        size = len(response.content)
+        with self.lock:
+            self.latencies.append(time.perf_counter() - started)
+            self.bytes_received += size
+            self.errors += response.status_code >= 400
+        return response
@@ -1,13 +1,61 @@
 import csv
 import datetime as dt
 from argparse import Namespace
-
-from prettytable import PrettyTable
+from typing import Iterator, Optional, TextIO
 
 from constants import BASE_DIR, PathConstants, UtilityConstants
+from table_renderer import stream_table
+from tables import ResultTable
+
+
+class OutputRows:
+    """
+    Строки таблицы для вывода без заголовка.
+
+    Если результаты неполные, последней выводится строка-маркер.
+    Строки не копируются, а представление можно обойти несколько раз.
+    """
+
+    __slots__ = ('table',)
+
+    def __init__(self, table: ResultTable) -> None:
+        self.table = table
+
+    def __iter__(self) -> Iterator[tuple]:
+        yield from self.table.iter_rows()
+        if not self.table.complete:
+            yield self.table.marker_row()
+
+    def __len__(self) -> int:
+        return self.table.row_count + (not self.table.complete)
+
+
+def output_rows(table: ResultTable) -> OutputRows:
+    """
+    Возвращает строки таблицы для вывода.
 
+    :param table: ResultTable - результаты, которые нужно вывести.
 
-def default_output(results: list, *args) -> None:
+    :returns: OutputRows: Строки без заголовка, включая строку-маркер.
+    """
+    return OutputRows(table)
+
+
+def write_csv(file: TextIO, table: ResultTable) -> None:
+    """
+    Записывает таблицу в формате CSV.
+
+    :param file: Файл или буфер, в который записываются результаты.
+    :param table: ResultTable - результаты, которые нужно записать.
+
+    :returns: None
+    """
+    writer = csv.writer(file, dialect=csv.excel)
+    writer.writerow(table.header)
+    writer.writerows(output_rows(table))
+
+
+def default_output(results: ResultTable, *args) -> None:
     """
     Выводит результаты по умолчанию.
 
@@ -15,27 +63,38 @@ def default_output(results: list, *args) -> None:
 
     :returns: None
     """
-    for result in results:
-        print(*result)
+    table = ResultTable.coerce(results)
+    print(*table.header)
+    for row in output_rows(table):
+        print(*row)
 
 
-def pretty_output(results: list, *args) -> None:
+def pretty_output(
+        results: ResultTable, cli_args: Optional[Namespace] = None
+) -> None:
     """
-    Выводит отформатированную таблицу PrettyTable на основе результатов.
+    Выводит результаты в виде таблицы в формате PrettyTable.
+
+    Таблица выводится построчно, а в терминале длинный вывод
+    открывается в pager.
 
     :param results: Результаты, которые нужно вывести.
+    :param cli_args: Аргументы командной строки, включая размер выборки
+     для вычисления ширины столбцов и отключение pager.
 
     :returns: None
     """
-    table = PrettyTable()
-    table.field_names = results[0]
-    table.align = 'l'
-    table.add_rows(results[1:])
-    print(table)
+    table = ResultTable.coerce(results)
+    rows = output_rows(table)
+    stream_table(
+        table.header, rows, len(rows),
+        sample=getattr(cli_args, 'table_sample', None),
+        paging=not getattr(cli_args, 'no_pager', False)
+    )
 
 
 def file_output(
-        results: list,
+        results: ResultTable,
         cli_args: Namespace,
         encoding: str = 'utf-8'
 ) -> None:
@@ -56,7 +115,7 @@ def file_output(
     filename = f'{parser_mode}_{current_time}.csv'
     filepath = results_dir / filename
     with open(filepath, 'w', encoding=encoding) as file:
-        csv.writer(file, dialect=csv.excel).writerows(results)
+        write_csv(file, ResultTable.coerce(results))
 
 
 OUTPUT_MODES = {
@@ -66,7 +125,7 @@ OUTPUT_MODES = {
 }
 
 
-def control_output(results: list, cli_args: Namespace) -> None:
+def control_output(results: ResultTable, cli_args: Namespace) -> None:
     """
     Управляет выводом в зависимости от аргументов командной строки.
 
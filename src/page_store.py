@@ -0,0 +1,204 @@
+import hashlib
+import mmap
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from cache_control import compile_patterns, is_older
+from checkpoints import atomic_write
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest);
+'''
+INDEX_FILE = 'index.sqlite3'
+OBJECTS_DIR = 'objects'
+
+
+class PageStore:
+    """
+    Хранилище страниц с адресацией по содержимому.
+
+    Тело каждой страницы хранится в файле, названном по его хешу SHA-256,
+    поэтому одинаковые страницы по разным адресам хранятся один раз.
+    Соответствие адресов и хешей хранится в индексе SQLite. Страницы
+    читаются через mmap и передаются парсеру без копирования в кеш
+    ответов и без декодирования в str.
+
+    Страница считается актуальной, пока не удалена аргументами
+    --clear-cache или --invalidate и не старше срока, переданного
+    в get. Пустые ответы не сохраняются.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        (self.directory / OBJECTS_DIR).mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.directory / INDEX_FILE, check_same_thread=False
+        )
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> 'PageStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+    def object_path(self, digest: str) -> Path:
+        """Возвращает путь к файлу с телом страницы."""
+        return self.directory / OBJECTS_DIR / digest[:2] / digest[2:]
+
+    def get(
+            self, url: str, max_age: Optional[float] = None
+    ) -> Optional[mmap.mmap]:
+        """
+        Открывает сохранённую страницу.
+
+        :param url: Адрес страницы.
+        :param max_age: Срок актуальности страницы в секундах; None -
+         страница не устаревает.
+
+        :returns: Optional[mmap.mmap]: Отображение файла страницы
+         в память только для чтения или None, если страницы нет
+         или она устарела.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT digest, stored_at FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None or (
+            max_age is not None and time.time() - row[1] >= max_age
+        ):
+            return None
+        try:
+            with open(self.object_path(row[0]), 'rb') as file:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+    def put(self, url: str, body: bytes) -> Optional[str]:
+        """
+        Сохраняет страницу, если её тела ещё нет в хранилище,
+        и связывает с ним адрес.
+
+        :param url: Адрес страницы.
+        :param body: Тело ответа.
+
+        :returns: Optional[str]: Хеш тела страницы или None для пустого
+         ответа.
+        """
+        if not body:
+            return None
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.object_path(digest)
+        if not path.exists():
+            atomic_write(path, body)
+        with self.lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+                (url, digest, time.time())
+            )
+        return digest
+
+    def invalidate(
+            self,
+            patterns: Optional[list[str]] = None,
+            older_than: Optional[timedelta] = None
+    ) -> int:
+        """
+        Удаляет страницы, подходящие под шаблоны URL и/или возраст,
+        по тем же правилам, что и cache_control.invalidate_cache.
+
+        :param patterns: Шаблоны URL, названия режимов или регулярные
+         выражения.
+        :param older_than: Минимальный возраст удаляемых страниц.
+
+        :returns: int: Количество удалённых адресов.
+        """
+        compiled = compile_patterns(patterns or ())
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT url, stored_at FROM pages'
+            ).fetchall()
+        urls = [
+            (url,) for url, stored_at in rows
+            if (
+                (not compiled or any(
+                    pattern.search(url) for pattern in compiled
+                ))
+                and (older_than is None or is_older(
+                    datetime.fromtimestamp(stored_at, timezone.utc),
+                    older_than
+                ))
+            )
+        ]
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'DELETE FROM pages WHERE url = ?', urls
+            )
+        self.prune()
+        return len(urls)
+
+    def clear(self) -> None:
+        """Удаляет все страницы."""
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM pages')
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Удаляет файлы страниц, на которые не ссылается ни один адрес.
+
+        :returns: int: Количество удалённых файлов.
+        """
+        with self.lock:
+            referenced = {
+                digest for digest, in self.connection.execute(
+                    'SELECT DISTINCT digest FROM pages'
+                )
+            }
+        removed = 0
+        for path in (self.directory / OBJECTS_DIR).glob('*/*'):
+            if path.name.startswith('.'):
+                continue
+            if path.parent.name + path.name not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """
+        Собирает статистику хранилища.
+
+        :returns: dict[str, int]: Количество адресов и файлов страниц
+         и объём файлов в байтах.
+        """
+        with self.lock:
+            urls, = self.connection.execute(
+                'SELECT COUNT(*) FROM pages'
+            ).fetchone()
+            digests = [
+                digest for digest, in self.connection.execute(
+                    'SELECT DISTINCT digest FROM pages'
+                )
+            ]
+        sizes = [
+            path.stat().st_size for path in map(self.object_path, digests)
+            if path.exists()
+        ]
+        return {'urls': urls, 'objects': len(sizes), 'bytes': sum(sizes)}
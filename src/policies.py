@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from requests_cache import CachedSession, Response
+
+from constants import UtilityConstants
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Вычисляет перцентиль методом ближайшего ранга.
+
+    :param values: Список значений.
+    :param fraction: Доля от 0 до 1, например 0.95.
+
+    :returns: float: Значение перцентиля или 0 для пустого списка.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Deadline:
+    """Бюджет времени на весь запуск парсера."""
+
+    def __init__(self, seconds: float) -> None:
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Возвращает оставшееся время в секундах."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Проверяет, исчерпан ли бюджет времени."""
+        return self.remaining() == 0.0
+
+
+class HedgingPolicy:
+    """
+    Политика дублирующих запросов.
+
+    Если запрос выполняется дольше заданного перцентиля уже наблюдавшихся
+    задержек, отправляется его дубликат, и используется тот ответ,
+    который придёт первым.
+
+    Запросы без таймаута ограничиваются HEDGING_TIMEOUT секундами, чтобы
+    проигравший дубликат не занимал поток бесконечно. Метод close
+    отменяет ещё не начатые запросы в конце запуска.
+    """
+
+    def __init__(
+            self,
+            fraction: float = UtilityConstants.HEDGING_PERCENTILE,
+            min_samples: int = UtilityConstants.HEDGING_MIN_SAMPLES,
+            window: int = UtilityConstants.HEDGING_WINDOW,
+            timeout: float = UtilityConstants.HEDGING_TIMEOUT
+    ) -> None:
+        self.fraction = fraction
+        self.timeout = timeout
+        self.min_samples = min_samples
+        self.latencies = deque(maxlen=window)
+        self.hedged = 0
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            thread_name_prefix='hedged-request'
+        )
+
+    def close(self) -> None:
+        """Отменяет ожидающие запросы, не дожидаясь выполняющихся."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def threshold(self) -> Optional[float]:
+        """
+        Возвращает задержку, после которой отправляется дубликат запроса.
+
+        :returns: Optional[float]: Порог в секундах или None, пока
+        наблюдений недостаточно.
+        """
+        with self.lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            return percentile(list(self.latencies), self.fraction)
+
+    def timed_get(
+            self, session: CachedSession, url: str, timeout: Optional[float],
+            **kwargs
+    ) -> Response:
+        """Выполняет запрос и запоминает задержку ответа из сети."""
+        started = time.monotonic()
+        response = session.get(
+            url, timeout=self.timeout if timeout is None else timeout,
+            **kwargs
+        )
+        if not getattr(response, 'from_cache', False):
+            with self.lock:
+                self.latencies.append(time.monotonic() - started)
+        return response
+
+    def get(
+            self, session: CachedSession, url: str, timeout: Optional[float],
+            **kwargs
+    ) -> Response:
+        """
+        Выполняет запрос, при необходимости отправляя его дубликат.
+
+        :param session: CachedSession - сессия, используемая для запроса.
+        :param url: URL веб-страницы.
+        :param timeout: Таймаут запроса в секундах; None означает
+         таймаут политики.
+        :param kwargs: Дополнительные аргументы запроса.
+
+        :returns: Response: Первый успешно полученный ответ.
+        """
+        threshold = self.threshold()
+        if threshold is None:
+            return self.timed_get(session, url, timeout, **kwargs)
+        primary = self.executor.submit(
+            self.timed_get, session, url, timeout, **kwargs
+        )
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+        with self.lock:
+            self.hedged += 1
+        backup = self.executor.submit(
+            self.timed_get, session, url, timeout, **kwargs
+        )
+        pending = {primary, backup}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            successful = [
+                future for future in done if future.exception() is None
+            ]
+            if successful or not pending:
+                return (successful or list(done))[0].result()
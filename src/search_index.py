@@ -0,0 +1,257 @@
+import hashlib
+import heapq
+import math
+import re
+import sqlite3
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from constants import UtilityConstants
+
+TOKEN_PATTERN = re.compile(r'\w+')
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    document_id INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, document_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_document ON postings (document_id);
+'''
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Разбивает текст на токены в нижнем регистре.
+
+    :param text: Исходный текст.
+
+    :returns: list[str]: Токены в порядке следования в тексте.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_query(query: str) -> tuple[list[str], list[list[str]]]:
+    """
+    Разбирает поисковый запрос на отдельные слова и фразы в кавычках.
+
+    :param query: Поисковый запрос, например 'pattern "match statement"'.
+
+    :returns: tuple[list[str], list[list[str]]]: Слова и фразы запроса.
+    """
+    phrases = [tokenize(phrase) for phrase in PHRASE_PATTERN.findall(query)]
+    terms = tokenize(PHRASE_PATTERN.sub(' ', query))
+    return terms, [phrase for phrase in phrases if phrase]
+
+
+def contains_phrase(positions: list[array]) -> bool:
+    """
+    Проверяет, что слова фразы встречаются в документе подряд.
+
+    :param positions: Позиции каждого слова фразы в документе.
+
+    :returns: bool: True, если фраза найдена.
+    """
+    following = [set(word_positions) for word_positions in positions[1:]]
+    return any(
+        all(start + offset in word_positions
+            for offset, word_positions in enumerate(following, 1))
+        for start in positions[0]
+    )
+
+
+class SearchIndex:
+    """
+    Инвертированный индекс по тексту страниц PEP, хранящийся в SQLite.
+
+    Для каждого слова хранится список документов и позиций слова
+    в документе, что позволяет ранжировать результаты по BM25
+    и искать точные фразы без повторного разбора HTML.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        self.indexed = 0
+        self.unchanged = 0
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def add_page(self, url: str, soup: BeautifulSoup) -> None:
+        """
+        Индексирует страницу PEP.
+
+        :param url: Ссылка на страницу.
+        :param soup: BeautifulSoup - страница PEP.
+
+        :returns: None
+        """
+        content = soup.select_one('#pep-content') or soup
+        title = content.find('h1')
+        self.add_document(
+            url,
+            title.get_text(strip=True) if title else url,
+            content.get_text(' ')
+        )
+
+    def add_document(self, url: str, title: str, text: str) -> None:
+        """
+        Добавляет документ в индекс или обновляет его, если текст изменился.
+
+        :param url: Ссылка на документ.
+        :param title: Заголовок документа.
+        :param text: Текст документа.
+
+        :returns: None
+        """
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        row = self.connection.execute(
+            'SELECT id, content_hash FROM documents WHERE url = ?', (url,)
+        ).fetchone()
+        if row and row[1] == content_hash:
+            self.unchanged += 1
+            return
+        tokens = tokenize(text)
+        positions = defaultdict(lambda: array('I'))
+        for position, token in enumerate(tokens):
+            positions[token].append(position)
+        with self.connection:
+            if row:
+                document_id = row[0]
+                self.connection.execute(
+                    'DELETE FROM postings WHERE document_id = ?',
+                    (document_id,)
+                )
+                self.connection.execute(
+                    'UPDATE documents SET title = ?, length = ?, '
+                    'content_hash = ? WHERE id = ?',
+                    (title, len(tokens), content_hash, document_id)
+                )
+            else:
+                document_id = self.connection.execute(
+                    'INSERT INTO documents (url, title, length, content_hash) '
+                    'VALUES (?, ?, ?, ?)',
+                    (url, title, len(tokens), content_hash)
+                ).lastrowid
+            self.connection.executemany(
+                'INSERT INTO postings (term, document_id, positions) '
+                'VALUES (?, ?, ?)',
+                ((term, document_id, term_positions.tobytes())
+                 for term, term_positions in positions.items())
+            )
+        self.indexed += 1
+
+    def document_count(self) -> int:
+        """Возвращает количество документов в индексе."""
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM documents'
+        ).fetchone()[0]
+
+    def postings(self, term: str) -> dict[int, tuple[array, int]]:
+        """
+        Возвращает позиции слова в документах и длины этих документов.
+
+        :param term: Слово в нижнем регистре.
+
+        :returns: dict[int, tuple[array, int]]: Идентификатор документа,
+         позиции слова и длина документа.
+        """
+        result = {}
+        for document_id, blob, length in self.connection.execute(
+            'SELECT p.document_id, p.positions, d.length FROM postings p '
+            'JOIN documents d ON d.id = p.document_id WHERE p.term = ?',
+            (term,)
+        ):
+            positions = array('I')
+            positions.frombytes(blob)
+            result[document_id] = (positions, length)
+        return result
+
+    def search(
+            self, query: str, limit: int = UtilityConstants.SEARCH_LIMIT
+    ) -> list[tuple[str, str, float]]:
+        """
+        Ищет документы по запросу и ранжирует их по BM25.
+
+        Документ подходит, если содержит хотя бы одно слово запроса
+        и все фразы в кавычках.
+
+        :param query: Поисковый запрос.
+        :param limit: Максимальное количество результатов.
+
+        :returns: list[tuple[str, str, float]]: Ссылка, заголовок
+         и релевантность найденных документов.
+        """
+        terms, phrases = parse_query(query)
+        words = list(dict.fromkeys(
+            terms + [word for phrase in phrases for word in phrase]
+        ))
+        total, average_length = self.connection.execute(
+            'SELECT COUNT(*), AVG(length) FROM documents'
+        ).fetchone()
+        if not total or not words:
+            return []
+        postings = {word: self.postings(word) for word in words}
+        scores = defaultdict(float)
+        for word_postings in postings.values():
+            idf = math.log(
+                1 + (total - len(word_postings) + 0.5)
+                / (len(word_postings) + 0.5)
+            )
+            for document_id, (positions, length) in word_postings.items():
+                frequency = len(positions)
+                scores[document_id] += idf * frequency * (
+                    UtilityConstants.BM25_K1 + 1
+                ) / (frequency + UtilityConstants.BM25_K1 * (
+                    1 - UtilityConstants.BM25_B
+                    + UtilityConstants.BM25_B * length / average_length
+                ))
+        for phrase in phrases:
+            scores = {
+                document_id: score for document_id, score in scores.items()
+                if all(document_id in postings[word] for word in phrase)
+                and contains_phrase(
+                    [postings[word][document_id][0] for word in phrase]
+                )
+            }
+        return self.describe(
+            heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        )
+
+    def describe(
+            self, ranked: list[tuple[int, float]]
+    ) -> list[tuple[str, str, float]]:
+        """Добавляет к найденным документам их ссылки и заголовки."""
+        if not ranked:
+            return []
+        placeholders = ', '.join('?' * len(ranked))
+        documents = {
+            document_id: (url, title)
+            for document_id, url, title in self.connection.execute(
+                f'SELECT id, url, title FROM documents '
+                f'WHERE id IN ({placeholders})',
+                [document_id for document_id, _ in ranked]
+            )
+        }
+        return [
+            (*documents[document_id], score)
+            for document_id, score in ranked
+        ]
@@ -0,0 +1,199 @@
+import datetime as dt
+import io
+import json
+import logging
+import threading
+from argparse import Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import urlsplit
+
+from requests_cache import CachedSession
+
+from constants import Literals
+from outputs import write_csv
+from tables import ResultTable
+
+CONTENT_TYPES = {
+    'json': 'application/json; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def render_json(mode: str, results: ResultTable, updated_at: str) -> bytes:
+    """Сериализует результаты режима в JSON."""
+    table = ResultTable.coerce(results)
+    return json.dumps({
+        'mode': mode,
+        'updated_at': updated_at,
+        'complete': table.complete,
+        'header': table.header,
+        'rows': list(table.iter_rows()),
+    }, ensure_ascii=False).encode('utf-8')
+
+
+def render_csv(results: ResultTable) -> bytes:
+    """Сериализует результаты режима в CSV."""
+    buffer = io.StringIO()
+    write_csv(buffer, ResultTable.coerce(results))
+    return buffer.getvalue().encode('utf-8')
+
+
+class ResultsStore:
+    """
+    Хранилище последних результатов каждого режима.
+
+    Результаты сериализуются в JSON и CSV сразу при обновлении,
+    поэтому запросы к серверу обслуживаются без повторной сериализации.
+    """
+
+    def __init__(self) -> None:
+        self.rendered = {}
+        self.updated = {}
+        self.lock = threading.Lock()
+
+    def update(self, mode: str, results: ResultTable) -> None:
+        """Сохраняет свежие результаты режима."""
+        updated_at = dt.datetime.now().isoformat(timespec='seconds')
+        rendered = {
+            'json': render_json(mode, results, updated_at),
+            'csv': render_csv(results),
+        }
+        with self.lock:
+            self.rendered[mode] = rendered
+            self.updated[mode] = updated_at
+
+    def get(self, mode: str, output_format: str):
+        """Возвращает сериализованные результаты или None."""
+        with self.lock:
+            return self.rendered.get(mode, {}).get(output_format)
+
+    def index(self) -> bytes:
+        """Возвращает список режимов и время их последнего обновления."""
+        with self.lock:
+            return json.dumps(self.updated).encode('utf-8')
+
+
+def refresh_results(
+        session: CachedSession,
+        store: ResultsStore,
+        modes: dict[str, Callable],
+        cli_args: Namespace
+) -> None:
+    """
+    Однократно обновляет результаты всех режимов.
+
+    Ошибка в одном режиме не мешает обновлению остальных, а клиенты
+    продолжают получать предыдущие результаты этого режима.
+
+    :param session: CachedSession - общая "тёплая" сессия.
+    :param store: ResultsStore - хранилище результатов.
+    :param modes: Режимы парсера и соответствующие им функции.
+    :param cli_args: Namespace - аргументы командной строки.
+
+    :returns: None
+    """
+    for mode, function in modes.items():
+        try:
+            results = function(session, cli_args)
+        except Exception as error:
+            logging.exception(Literals.REFRESH_FAILED.format(mode, error))
+            continue
+        if results:
+            store.update(mode, results)
+    logging.info(Literals.RESULTS_REFRESHED.format(', '.join(modes)))
+
+
+def schedule_refresh(
+        session: CachedSession,
+        store: ResultsStore,
+        modes: dict[str, Callable],
+        cli_args: Namespace,
+        stop_event: threading.Event
+) -> None:
+    """
+    Обновляет результаты с заданным интервалом, пока не будет
+    установлено событие остановки.
+
+    :returns: None
+    """
+    while not stop_event.is_set():
+        refresh_results(session, store, modes, cli_args)
+        stop_event.wait(cli_args.refresh_interval)
+
+
+class ResultsHandler(BaseHTTPRequestHandler):
+    """
+    Отдаёт результаты по адресам вида /pep.json и /whats-new.csv,
+    а по адресу / — список режимов и время их обновления.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path.strip('/')
+        if not path:
+            self.send_body(200, self.server.store.index(), 'json')
+            return
+        mode, _, output_format = path.rpartition('.')
+        if output_format not in CONTENT_TYPES:
+            mode, output_format = path, 'json'
+        body = self.server.store.get(mode, output_format)
+        if body is None:
+            self.send_body(404, b'{}', 'json')
+            return
+        self.send_body(200, body, output_format)
+
+    def send_body(self, status: int, body: bytes, output_format: str) -> None:
+        """Отправляет ответ с заданным телом."""
+        self.send_response(status)
+        self.send_header('Content-Type', CONTENT_TYPES[output_format])
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logging.debug(format, *args)
+
+
+class ResultsServer(ThreadingHTTPServer):
+    """HTTP-сервер, отдающий последние результаты режимов парсера."""
+
+    daemon_threads = True
+
+    def __init__(self, store: ResultsStore, host: str, port: int) -> None:
+        super().__init__((host, port), ResultsHandler)
+        self.store = store
+
+
+def serve_results(
+        session: CachedSession,
+        modes: dict[str, Callable],
+        cli_args: Namespace
+) -> None:
+    """
+    Запускает фоновое обновление результатов и HTTP-сервер.
+
+    Работает до получения KeyboardInterrupt или SIGTERM.
+
+    :param session: CachedSession - общая сессия для всех обновлений.
+    :param modes: Режимы парсера и соответствующие им функции.
+    :param cli_args: Namespace - аргументы командной строки.
+
+    :returns: None
+    """
+    store = ResultsStore()
+    stop_event = threading.Event()
+    refresher = threading.Thread(
+        target=schedule_refresh,
+        args=(session, store, modes, cli_args, stop_event),
+        daemon=True
+    )
+    server = ResultsServer(store, cli_args.host, cli_args.port)
+    logging.info(Literals.SERVER_STARTED.format(*server.server_address[:2]))
+    refresher.start()
+    try:
+        server.serve_forever()
+    finally:
+        stop_event.set()
+        server.server_close()
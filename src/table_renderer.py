@@ -0,0 +1,216 @@
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO
+
+from constants import UtilityConstants
+
+try:
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None
+
+
+def text_width(text: str) -> int:
+    """
+    Возвращает ширину строки в колонках терминала.
+
+    Если установлен пакет wcwidth, учитываются широкие символы
+    (например, иероглифы), иначе ширина равна длине строки.
+
+    :param text: Строка без переводов строк.
+
+    :returns: int: Ширина строки.
+    """
+    if wcswidth is None or text.isascii():
+        return len(text)
+    width = wcswidth(text)
+    return width if width >= 0 else len(text)
+
+
+def cell_lines(value) -> list[str]:
+    """
+    Разбивает значение ячейки на строки так же, как это делает PrettyTable.
+
+    :param value: Значение ячейки.
+
+    :returns: list[str]: Строки ячейки.
+    """
+    return str(value).expandtabs().split('\n')
+
+
+def truncate(text: str, width: int) -> str:
+    """
+    Обрезает строку до указанной ширины, заменяя конец многоточием.
+
+    :param text: Строка ячейки.
+    :param width: Ширина столбца.
+
+    :returns: str: Строка, помещающаяся в столбец.
+    """
+    if text_width(text) <= width:
+        return text
+    while text and text_width(text) > width - 1:
+        text = text[:-1]
+    return text + '…'
+
+
+def column_widths(
+        header: tuple, rows: Iterable[tuple], sample: Optional[int] = None
+) -> list[int]:
+    """
+    Вычисляет ширину столбцов за один проход по строкам.
+
+    :param header: Заголовок таблицы.
+    :param rows: Строки таблицы.
+    :param sample: Количество строк, по которым вычисляется ширина;
+     None — по всем строкам.
+
+    :returns: list[int]: Ширина каждого столбца.
+    """
+    widths = [
+        max(map(text_width, cell_lines(name))) for name in header
+    ]
+    for row in islice(rows, sample):
+        for index, value in enumerate(row):
+            for line in cell_lines(value):
+                width = text_width(line)
+                if width > widths[index]:
+                    widths[index] = width
+    return widths
+
+
+def render_border(widths: list[int]) -> str:
+    """Возвращает горизонтальную границу таблицы."""
+    return '+' + '+'.join('-' * (width + 2) for width in widths) + '+'
+
+
+def render_row(row: tuple, widths: list[int], clip: bool) -> Iterator[str]:
+    """
+    Выводит строку таблицы с выравниванием по левому краю.
+
+    :param row: Значения ячеек.
+    :param widths: Ширина столбцов.
+    :param clip: Обрезать значения, не помещающиеся в столбец.
+
+    :returns: Iterator[str]: Строки текста, по одной на каждую строку
+     самой высокой ячейки.
+    """
+    cells = [cell_lines(value) for value in row]
+    for number in range(max(map(len, cells))):
+        parts = []
+        for lines, width in zip(cells, widths):
+            line = lines[number] if number < len(lines) else ''
+            if clip:
+                line = truncate(line, width)
+            parts.append(line + ' ' * (width - text_width(line)))
+        yield '| ' + ' | '.join(parts) + ' |'
+
+
+def render_table(
+        header: tuple, rows: Iterable[tuple], sample: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Выводит таблицу построчно в формате PrettyTable с align='l'.
+
+    Если ширина столбцов вычисляется по выборке строк, значения,
+    не помещающиеся в столбец, обрезаются. Это позволяет начать вывод
+    до того, как будут просмотрены все строки.
+
+    :param header: Заголовок таблицы.
+    :param rows: Строки таблицы; если ширина вычисляется по всем строкам,
+     коллекция, которую можно обойти дважды.
+    :param sample: Количество строк для вычисления ширины столбцов;
+     None — по всем строкам.
+
+    :returns: Iterator[str]: Строки текста таблицы.
+    """
+    if sample is None and iter(rows) is rows:
+        rows = list(rows)
+    head = []
+    if sample is not None:
+        rows = iter(rows)
+        head = list(islice(rows, sample))
+        widths = column_widths(header, head)
+    else:
+        widths = column_widths(header, rows)
+    border = render_border(widths)
+    yield border
+    yield from render_row(header, widths, sample is not None)
+    yield border
+    for source in (head, rows):
+        for row in source:
+            yield from render_row(row, widths, sample is not None)
+    yield border
+
+
+@contextmanager
+def pager(lines: int, file: TextIO = None) -> Iterator[TextIO]:
+    """
+    Открывает постраничный просмотр, если вывод не помещается в терминал.
+
+    Используется команда из переменной окружения PAGER или
+    UtilityConstants.PAGER. Если вывод перенаправлен в файл
+    или команда недоступна, возвращается исходный поток.
+
+    :param lines: Количество выводимых строк.
+    :param file: Поток вывода, по умолчанию sys.stdout.
+
+    :returns: Iterator[TextIO]: Поток, в который нужно писать вывод.
+    """
+    file = file or sys.stdout
+    if (not file.isatty()
+            or lines < shutil.get_terminal_size().lines):
+        yield file
+        return
+    command = os.environ.get('PAGER') or UtilityConstants.PAGER
+    try:
+        process = subprocess.Popen(
+            shlex.split(command), stdin=subprocess.PIPE,
+            encoding=file.encoding or 'utf-8'
+        )
+    except OSError:
+        yield file
+        return
+    try:
+        yield process.stdin
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+
+
+def stream_table(
+        header: tuple,
+        rows: Iterable[tuple],
+        row_count: int,
+        sample: Optional[int] = None,
+        paging: bool = True,
+        file: TextIO = None
+) -> None:
+    """
+    Выводит таблицу построчно, при необходимости через pager.
+
+    :param header: Заголовок таблицы.
+    :param rows: Строки таблицы.
+    :param row_count: Количество строк, по которому решается,
+     нужен ли постраничный просмотр.
+    :param sample: Количество строк для вычисления ширины столбцов.
+    :param paging: Разрешить постраничный просмотр.
+    :param file: Поток вывода, по умолчанию sys.stdout.
+
+    :returns: None
+    """
+    file = file or sys.stdout
+    lines = row_count + 4 if paging else 0
+    with pager(lines, file) as output:
+        for line in render_table(header, rows, sample):
+            output.write(line + '\n')
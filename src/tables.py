@@ -0,0 +1,109 @@
+from itertools import islice
+from typing import Iterable, Iterator
+
+from constants import Literals
+
+
+class ResultTable(list):
+    """
+    Результаты работы режима парсера.
+
+    Для совместимости с прежним форматом таблица остаётся списком
+    кортежей, первый из которых — заголовок. Заголовок и признак
+    полноты результатов доступны отдельными атрибутами, а строки
+    выводятся через iter_rows без копирования списка.
+
+    Первые key_columns столбцов однозначно определяют строку; по ним
+    сравниваются результаты разных запусков.
+    """
+
+    __slots__ = ('complete', 'key_columns')
+
+    def __init__(
+            self, header: Iterable, rows: Iterable = (), key_columns: int = 1
+    ) -> None:
+        super().__init__([tuple(header)])
+        self.extend(rows)
+        self.complete = True
+        self.key_columns = key_columns
+
+    @classmethod
+    def coerce(cls, results: list) -> 'ResultTable':
+        """
+        Преобразует результаты в прежнем формате в ResultTable.
+
+        :param results: ResultTable или список кортежей с заголовком.
+
+        :returns: ResultTable: Таблица с теми же строками.
+        """
+        if isinstance(results, cls):
+            return results
+        table = cls(
+            results[0], islice(results, 1, None),
+            key_columns=getattr(results, 'key_columns', 1)
+        )
+        table.complete = getattr(results, 'complete', True)
+        return table
+
+    @property
+    def header(self) -> tuple:
+        """Заголовок таблицы."""
+        return self[0]
+
+    @property
+    def row_count(self) -> int:
+        """Количество строк без заголовка."""
+        return len(self) - 1
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """Итерирует по строкам таблицы без заголовка."""
+        return islice(self, 1, None)
+
+    def append(self, row: Iterable) -> None:
+        """Добавляет строку в таблицу."""
+        super().append(tuple(row))
+
+    def extend(self, rows: Iterable[Iterable]) -> None:
+        """Добавляет несколько строк в таблицу."""
+        super().extend(tuple(row) for row in rows)
+
+    def marker_row(self) -> tuple:
+        """Строка-маркер, выводимая после неполных результатов."""
+        return (Literals.INCOMPLETE_RESULTS, *[''] * (len(self.header) - 1))
+
+    def columns(self) -> list[tuple]:
+        """
+        Возвращает данные таблицы по столбцам.
+
+        :returns: list[tuple]: Значения каждого столбца.
+        """
+        return list(zip(*self.iter_rows())) or [() for _ in self.header]
+
+    def to_arrow(self):
+        """
+        Возвращает таблицу в формате Apache Arrow.
+
+        Требует установленного пакета pyarrow.
+
+        :returns: pyarrow.Table: Таблица со столбцами из заголовка.
+        :raises ImportError: Если pyarrow не установлен.
+        """
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise ImportError(Literals.PYARROW_REQUIRED) from error
+        return pyarrow.Table.from_arrays(
+            [pyarrow.array(column) for column in self.columns()],
+            names=[str(name) for name in self.header]
+        )
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        """
+        Реализует Arrow PyCapsule Interface, позволяя передавать таблицу
+        в pyarrow, polars, duckdb и другие инструменты без сериализации.
+        """
+        return self.to_arrow().__arrow_c_stream__(requested_schema)
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}(header={self.header!r}, '
+                f'rows={self.row_count}, complete={self.complete})')
@@ -1,16 +1,44 @@
 import logging
+import mmap
+import time
 from typing import Optional, Union
 
 from bs4 import BeautifulSoup, Tag
-from requests import RequestException
-from requests_cache import CachedSession, Response
+from requests import RequestException, Timeout
+from requests_cache import NEVER_EXPIRE, CachedSession, Response
+from requests_cache.policy.expiration import get_expiration_seconds
 
+from cache_control import CACHE_USAGE
 from constants import Literals
-from exceptions import ParserFindTagException
+from exceptions import DeadlineExceededException, ParserFindTagException
+from metrics import METRICS
+from tables import ResultTable
+
+
+def check_deadline(session: CachedSession, url: str) -> Optional[float]:
+    """
+    Проверяет бюджет времени на запуск (session.deadline).
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param url: URL веб-страницы.
+
+    :returns: Optional[float]: Оставшееся время в секундах или None,
+     если бюджет не задан.
+    :raises DeadlineExceededException: Если бюджет времени исчерпан.
+    """
+    deadline = getattr(session, 'deadline', None)
+    if deadline is None:
+        return None
+    if deadline.expired():
+        raise DeadlineExceededException(
+            Literals.DEADLINE_EXCEEDED.format(url)
+        )
+    return deadline.remaining()
 
 
 def get_response(
-        session: CachedSession, url: str, encoding: str = 'utf-8'
+        session: CachedSession, url: str, encoding: str = 'utf-8',
+        **kwargs
 ) -> Response:
     """
     Получить содержимое веб-страницы по указанному URL.
@@ -18,14 +46,34 @@ def get_response(
     :param session: CachedSession - сессия, используемая для запроса.
     :param url: URL веб-страницы.
     :param encoding: Кодировка веб-страницы, по умолчанию — utf-8.
+    :param kwargs: Дополнительные аргументы запроса, например headers.
+    Учитывает политики, привязанные к сессии: бюджет времени на запуск
+    (session.deadline) и дублирующие запросы (session.hedging).
+
     :returns: Объект ответа HTTP.
-    :raises ConnectionError: Если произошла ошибка подключения.
+    :raises ConnectionError: Если произошла ошибка подключения
+    или сервер вернул код ошибки.
+    :raises DeadlineExceededException: Если бюджет времени исчерпан,
+    в том числе во время запроса, таймаут которого ограничен
+    оставшимся бюджетом.
     """
+    timeout = check_deadline(session, url)
+    hedging = getattr(session, 'hedging', None)
+    started = time.perf_counter()
     try:
-        response = session.get(url)
+        if hedging is not None:
+            response = hedging.get(session, url, timeout, **kwargs)
+        else:
+            response = session.get(url, timeout=timeout, **kwargs)
+        METRICS.record_response(response, time.perf_counter() - started)
+        CACHE_USAGE.record(response)
+        response.raise_for_status()
         response.encoding = encoding
         return response
     except RequestException as error:
+        METRICS.inc('parser_request_errors_total')
+        if isinstance(error, Timeout):
+            check_deadline(session, url)
         raise ConnectionError(
             Literals.REQUEST_EXCEPTION.format(url, error)
         ) from error
@@ -48,6 +96,53 @@ def find_tag(soup: Union[BeautifulSoup, Tag], tag: str,
     return searched_tag
 
 
+def page_max_age(session: CachedSession) -> Optional[int]:
+    """
+    Возвращает срок актуальности страниц в хранилище по настройке
+    expire_after сессии.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+
+    :returns: Optional[int]: Срок в секундах или None, если страницы
+     не устаревают.
+    """
+    settings = getattr(session, 'settings', None)
+    seconds = get_expiration_seconds(getattr(settings, 'expire_after',
+                                             NEVER_EXPIRE))
+    return None if seconds == NEVER_EXPIRE else seconds
+
+
+def read_page(session: CachedSession, url: str) -> Union[str, mmap.mmap]:
+    """
+    Возвращает разметку веб-страницы.
+
+    Если к сессии подключено хранилище страниц (session.page_store),
+    страница читается из него, пока не истёк срок expire_after сессии,
+    а загруженная по сети — сохраняется только в нём, минуя кеш ответов,
+    чтобы тело страницы не хранилось на диске дважды. Бюджет времени
+    на запуск проверяется и для страниц из хранилища.
+
+    :param session: CachedSession - сессия, используемая для запроса.
+    :param url: URL веб-страницы.
+
+    :returns: Текст страницы или отображение файла из хранилища в память.
+    :raises DeadlineExceededException: Если бюджет времени исчерпан.
+    """
+    check_deadline(session, url)
+    store = getattr(session, 'page_store', None)
+    if store is None:
+        return get_response(session, url).text
+    page = store.get(url, page_max_age(session))
+    if page is not None:
+        METRICS.record_stored_page(len(page))
+        return page
+    response = get_response(
+        session, url, headers={'Cache-Control': 'no-store'}
+    )
+    store.put(url, response.content)
+    return response.text
+
+
 def get_soup(
         session: CachedSession,
         url: str,
@@ -62,7 +157,32 @@ def get_soup(
     для создания объекта BeautifulSoup.
     :return: Объект BeautifulSoup, представляющий HTML-документ.
     """
-    return BeautifulSoup(get_response(session, url).text, parser)
+    return parse_page(read_page(session, url), parser)
+
+
+def parse_page(
+        markup: Union[str, mmap.mmap], parser: str = 'lxml'
+) -> BeautifulSoup:
+    """
+    Разбирает разметку страницы, полученную функцией read_page.
+
+    Отображение файла в память закрывается после разбора.
+
+    :param markup: Текст страницы или отображение файла в память.
+    :param parser: Имя парсера, используемого
+    для создания объекта BeautifulSoup.
+    :return: Объект BeautifulSoup, представляющий HTML-документ.
+    """
+    started = time.perf_counter()
+    if isinstance(markup, str):
+        soup = BeautifulSoup(markup, parser)
+    else:
+        with markup:
+            soup = BeautifulSoup(markup, parser, from_encoding='utf-8')
+    METRICS.observe(
+        'parser_parse_duration_seconds', time.perf_counter() - started
+    )
+    return soup
 
 
 def manage_logging(stack: list[Exception]) -> list:
@@ -74,4 +194,32 @@ def manage_logging(stack: list[Exception]) -> list:
 
     :return: Список ошибок.
     """
+    for exception in stack:
+        METRICS.inc('parser_errors_total', type=type(exception).__name__)
     return list(map(lambda exception: logging.error(exception), stack))
+
+
+def mark_incomplete(results: ResultTable) -> ResultTable:
+    """
+    Помечает результаты как неполные.
+
+    При выводе после таких результатов добавляется строка-маркер.
+
+    :param results: ResultTable - результаты работы режима парсера.
+
+    :return: Та же таблица с флагом complete=False.
+    """
+    logging.warning(Literals.RESULTS_INCOMPLETE.format(results.row_count))
+    results.complete = False
+    return results
+
+
+def is_complete(results: Optional[ResultTable]) -> bool:
+    """
+    Проверяет, что результаты не помечены как неполные.
+
+    :param results: Результаты работы режима парсера.
+
+    :return: True, если результаты полные.
+    """
+    return results is None or getattr(results, 'complete', True)
@@ -72,6 +72,24 @@ def mock_session(tempfile_session) -> CachedSession:
     yield mount_mock_adapter(tempfile_session)
 
 
+@pytest.fixture
+def mock_site_session():
+    """
+    Фабрика сессий с кешем в памяти, запросы которых перенаправляются
+    на локальный сервер mock_server.
+    """
+    def _mock_site_session(server, adapter_class=None, **kwargs):
+        from src import mock_server
+        adapter = (adapter_class or mock_server.MockSiteAdapter)(
+            server.url, **kwargs
+        )
+        session = CachedSession(backend='memory')
+        session.mount('https://', adapter)
+        session.mock_adapter = adapter
+        return session
+    return _mock_site_session
+
+
 @pytest.fixture
 def response_page(mock_session):
     def _response_page(page):
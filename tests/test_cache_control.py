@@ -0,0 +1,76 @@
+import argparse
+from datetime import timedelta
+
+import pytest
+import requests_mock
+try:
+    from src import cache_control
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `cache_control.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `cache_control.py`'
+
+CACHED_URLS = (
+    'https://peps.python.org/',
+    'https://peps.python.org/pep-0008/',
+    'https://peps.python.org/pep-0020/',
+    'https://docs.python.org/3/whatsnew/3.12.html',
+)
+
+
+@pytest.fixture
+def filled_session(tempfile_session):
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(requests_mock.ANY, requests_mock.ANY, text='page')
+    tempfile_session.mount('https://', adapter)
+    for url in CACHED_URLS:
+        tempfile_session.get(url)
+    return tempfile_session
+
+
+def cached_urls(session):
+    return sorted(response.url for response in session.cache.filter())
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('45s', timedelta(seconds=45)),
+    ('30m', timedelta(minutes=30)),
+    ('6h', timedelta(hours=6)),
+    ('2d', timedelta(days=2)),
+])
+def test_parse_age(value, expected):
+    assert cache_control.parse_age(value) == expected
+
+
+def test_parse_age_invalid():
+    with pytest.raises(argparse.ArgumentTypeError):
+        cache_control.parse_age('six hours')
+
+
+@pytest.mark.parametrize('patterns, remaining', [
+    (['peps.python.org/pep-00*'], [CACHED_URLS[3], CACHED_URLS[0]]),
+    (['pep'], [CACHED_URLS[3]]),
+    (['re:whatsnew/3\\.\\d+'], sorted(CACHED_URLS[:3])),
+])
+def test_invalidate_by_pattern(filled_session, patterns, remaining):
+    cache_control.invalidate_cache(filled_session, patterns)
+    assert cached_urls(filled_session) == sorted(remaining), (
+        'Из кеша должны удаляться только записи, подходящие под шаблон'
+    )
+
+
+def test_invalidate_older_than(filled_session):
+    assert cache_control.invalidate_cache(
+        filled_session, older_than=timedelta(hours=1)
+    ) == 0
+    assert cache_control.invalidate_cache(
+        filled_session, ['pep'], older_than=timedelta(0)
+    ) == 3
+
+
+def test_collect_cache_stats(filled_session):
+    assert cache_control.collect_cache_stats(filled_session) == {
+        'docs.python.org/3/whatsnew/': [1, 4],
+        'peps.python.org/': [1, 4],
+        'peps.python.org/pep-*/': [2, 8],
+    }
@@ -0,0 +1,68 @@
+import pytest
+import requests_mock
+from requests_cache import CachedSession
+try:
+    from src import cache_serializer
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `cache_serializer.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `cache_serializer.py`'
+
+URL = 'https://peps.python.org/pep-0008/'
+PAGE = '<html><body>' + '<p>python syntax module</p>' * 500 + '</body></html>'
+CODECS = [
+    codec for codec in cache_serializer.COMPRESSION_CHOICES
+    if codec != 'zstd' or cache_serializer.zstandard is not None
+]
+
+
+def make_session(path, codec):
+    session = CachedSession(
+        str(path), serializer=cache_serializer.compressing_serializer(codec)
+    )
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('GET', URL, text=PAGE)
+    session.mount('https://', adapter)
+    return session
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_compressed_cache_roundtrip(tmp_path, codec):
+    session = make_session(tmp_path / 'cache', codec)
+    session.get(URL)
+    response = session.get(URL)
+    assert response.from_cache
+    assert response.text == PAGE, (
+        'Записи кеша должны прозрачно распаковываться при чтении'
+    )
+
+
+@pytest.mark.parametrize('written, read', [('none', 'zlib'), ('gzip', 'none')])
+def test_entries_readable_after_switching_compression(tmp_path, written, read):
+    make_session(tmp_path / 'cache', written).get(URL)
+    response = make_session(tmp_path / 'cache', read).get(URL)
+    assert response.from_cache, (
+        'Записи, сохранённые с другой настройкой сжатия, должны читаться'
+    )
+    assert response.text == PAGE
+
+
+def test_stored_sizes(tmp_path):
+    session = make_session(tmp_path / 'cache', 'zlib')
+    session.get(URL)
+    sizes = cache_serializer.stored_sizes(session)
+    assert sizes['entries'] == sizes['compressed'] == 1
+    assert sizes['raw'] > len(PAGE) > sizes['stored'], (
+        'Статистика должна учитывать объём записей до и после сжатия'
+    )
+
+
+def test_default_cache_entries_are_readable(tmp_path):
+    session = CachedSession(str(tmp_path / 'cache'))
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('GET', URL, text=PAGE)
+    session.mount('https://', adapter)
+    session.get(URL)
+    assert make_session(tmp_path / 'cache', 'zlib').get(URL).from_cache, (
+        'Записи кеша, сохранённые до включения сжатия, должны читаться'
+    )
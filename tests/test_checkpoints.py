@@ -0,0 +1,57 @@
+import requests_mock
+try:
+    from src import checkpoints, main
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `checkpoints.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `checkpoints.py`'
+
+PEP_INDEX = '''
+<section id="numerical-index">
+<table class="pep-zero-table docutils align-default"><tbody>
+<tr><td><abbr title="Active">PA</abbr></td>
+<td><a href="pep-0001/">1</a></td></tr>
+<tr><td><abbr title="Final">SF</abbr></td>
+<td><a href="pep-0008/">8</a></td></tr>
+</tbody></table>
+</section>
+'''
+PEP_PAGE = '<section id="pep-content"><dl><dd><abbr>{}</abbr></dd></dl>'
+
+
+def test_save_and_load_checkpoint(tmp_path):
+    path = tmp_path / 'nested' / 'pep.json'
+    state = {'processed': {'pep-0001/': 'Active'}, 'mismatches': []}
+    checkpoints.save_checkpoint(path, state)
+    assert checkpoints.load_checkpoint(path) == state, (
+        'Контрольная точка должна загружаться в том виде, '
+        'в котором была сохранена'
+    )
+    assert [file.name for file in path.parent.iterdir()] == ['pep.json'], (
+        'После атомарной записи не должно оставаться временных файлов'
+    )
+    checkpoints.remove_checkpoint(path)
+    assert checkpoints.load_checkpoint(path) is None
+
+
+def test_pep_resume_skips_processed(monkeypatch, tmp_path, mock_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    checkpoints.save_checkpoint(
+        checkpoints.get_checkpoint_path(tmp_path, 'pep'),
+        {
+            'processed': {'pep-0001/': 'Active'},
+            'status_codes': {'Active': 1},
+            'mismatches': []
+        }
+    )
+    with requests_mock.Mocker(session=mock_session) as mock:
+        mock.get(main.PEP_MAIN_URL, text=PEP_INDEX)
+        mock.get(main.PEP_MAIN_URL + 'pep-0008/',
+                 text=PEP_PAGE.format('Final'))
+        got = main.pep(mock_session, main.Namespace(resume=True))
+    assert [request.url for request in mock.request_history] == [
+        main.PEP_MAIN_URL, main.PEP_MAIN_URL + 'pep-0008/'
+    ], 'Обработанные PEP не должны загружаться повторно'
+    assert got == [
+        ('Статус', 'Количество'), ('Active', 1), ('Final', 1), ('Итого', '2')
+    ]
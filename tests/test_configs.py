@@ -1,5 +1,6 @@
 import pytest
 import argparse
+import logging
 try:
     from src import configs
 except ModuleNotFoundError:
@@ -64,3 +65,25 @@ def test_configure_argument_parser(
     assert got_action.help == help_str, (
         f'Укажите help-строку cli аргумента {got_action.dest}'
     )
+
+
+def make_record(message, level=logging.ERROR):
+    return logging.LogRecord('root', level, __file__, 1, message, None, None)
+
+
+def test_repeated_message_filter(caplog):
+    repeat_filter = configs.RepeatedMessageFilter(interval=60)
+    got = [
+        repeat_filter.filter(make_record(message))
+        for message in ('ошибка', 'ошибка', 'ошибка', 'другая ошибка')
+    ]
+    assert got == [True, False, False, True], (
+        'Повторы одинаковых ошибок должны подавляться'
+    )
+    assert repeat_filter.filter(make_record('справка', logging.INFO))
+    assert repeat_filter.filter(make_record('справка', logging.INFO))
+    with caplog.at_level(logging.ERROR):
+        repeat_filter.flush()
+    assert 'ошибка (повторилось ещё 2 раз)' in caplog.text, (
+        'При завершении работы должна выводиться сводка по повторам'
+    )
@@ -0,0 +1,66 @@
+from argparse import Namespace
+
+try:
+    from src import delta, main, mock_server, tables
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `delta.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `delta.py`'
+
+HEADER = ('Ссылка на документацию', 'Версия', 'Статус')
+
+
+def versions(*rows):
+    return tables.ResultTable(HEADER, rows)
+
+
+def test_apply_delta(tmp_path):
+    path = delta.get_snapshot_path(tmp_path, 'latest-versions')
+    first = delta.apply_delta(versions(
+        ('3.13/', '3.13', 'pre-release'), ('3.11/', '3.11', 'stable'),
+        ('2.7/', '2.7', 'EOL')
+    ), path)
+    assert [row[0] for row in first.iter_rows()] == [
+        delta.Literals.DELTA_ADDED
+    ] * 3, 'При первом запуске все строки считаются добавленными'
+    got = delta.apply_delta(versions(
+        ('3.14/', '3.14', 'in development'),
+        ('3.13/', '3.13', 'stable'), ('3.11/', '3.11', 'stable'),
+    ), path)
+    assert got.header == ('Изменение', *HEADER)
+    assert list(got.iter_rows()) == [
+        ('Добавлено', '3.14/', '3.14', 'in development'),
+        ('Изменено', '3.13/', '3.13', 'pre-release → stable'),
+        ('Удалено', '2.7/', '2.7', 'EOL'),
+    ], 'Вывод должен содержать только добавленные, изменённые и удалённые'
+    quiet = delta.apply_delta(versions(
+        ('3.14/', '3.14', 'in development'),
+        ('3.13/', '3.13', 'stable'), ('3.11/', '3.11', 'stable'),
+    ), path)
+    assert quiet.row_count == 0
+
+
+def test_incomplete_results_keep_snapshot(tmp_path):
+    path = delta.get_snapshot_path(tmp_path, 'latest-versions')
+    delta.apply_delta(versions(('3.13/', '3.13', 'stable'),
+                               ('3.12/', '3.12', 'stable')), path)
+    partial = versions(('3.13/', '3.13', 'stable'))
+    partial.complete = False
+    assert delta.apply_delta(partial, path).row_count == 0, (
+        'Строки, не собранные в неполном запуске, не считаются удалёнными'
+    )
+    assert delta.apply_delta(versions(('3.13/', '3.13', 'stable'),
+                                      ('3.12/', '3.12', 'stable')),
+                             path).row_count == 0
+
+
+def test_pep_delta_by_pep(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=5, page_size=200)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        got = main.pep(session, Namespace(resume=False, delta=True))
+    assert got.header == ('Ссылка на PEP', 'Статус')
+    assert got.row_count == config.peps, (
+        'С флагом --delta режим pep должен возвращать статус каждого PEP'
+    )
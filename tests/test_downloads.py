@@ -0,0 +1,56 @@
+import logging
+from argparse import Namespace
+
+import pytest
+try:
+    from src import downloads, main, mock_server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `downloads.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `downloads.py`'
+
+ARCHIVES = {
+    'pdf-a4.zip': 'python-3.12.1-docs-pdf-a4.zip',
+    'pdf-a4.tar.bz2': 'python-3.12.1-docs-pdf-a4.tar.bz2',
+    'html.zip': 'python-3.12.1-docs-html.zip',
+    'epub': 'python-3.12.1-docs.epub',
+}
+
+
+@pytest.mark.parametrize('formats, expected', [
+    (['all'], list(ARCHIVES)),
+    (['pdf-a4'], ['pdf-a4.zip', 'pdf-a4.tar.bz2']),
+    (['html.zip', 'epub'], ['html.zip', 'epub']),
+])
+def test_select_formats(formats, expected):
+    archives = {
+        downloads.archive_format(filename): filename
+        for filename in ARCHIVES.values()
+    }
+    assert list(downloads.select_formats(archives, formats)) == expected
+
+
+def test_download_all_formats(
+        monkeypatch, tmp_path, caplog, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(archive_size=50_000)
+    cli_args = Namespace(formats=['all'], max_connections=3)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        adapter = session.mock_adapter
+        main.download(session, cli_args)
+        first_run_bytes = adapter.bytes_received
+        with caplog.at_level(logging.INFO):
+            main.download(session, cli_args)
+    files = sorted(
+        path.name for path in (tmp_path / 'downloads').iterdir()
+        if not path.name.startswith('.')
+    )
+    assert len(files) == len(mock_server.ARCHIVE_SUFFIXES), (
+        'Режим download с --formats all должен скачать все архивы'
+    )
+    assert adapter.bytes_received == first_run_bytes, (
+        'Актуальные локальные копии архивов не должны загружаться повторно'
+    )
+    assert 'пропущено: 11' in caplog.text
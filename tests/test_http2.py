@@ -0,0 +1,86 @@
+import ssl
+from argparse import Namespace
+
+import pytest
+try:
+    from src import http2, main, mock_server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `http2.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `http2.py`'
+
+pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+PEP_URL = 'https://peps.python.org/pep-0001/'
+
+
+class MockHTTP2Adapter(mock_server.MockSiteAdapter, http2.HTTP2Adapter):
+    """Адаптер HTTP/2, перенаправляющий запросы на локальный сервер."""
+
+
+def test_pep_multiplexed(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=40, page_size=100_000,
+                                        latency=0.01)
+    with mock_server.MockH2Server(config) as server:
+        session = mock_site_session(server, MockHTTP2Adapter, http1=False)
+        got = main.pep(session, Namespace(resume=False, http2=True,
+                                          max_connections=16))
+    assert int(got[-1][1]) == config.peps
+    assert server.connections == 1, (
+        'Запросы к одному хосту должны мультиплексироваться '
+        'в одном соединении HTTP/2'
+    )
+
+
+def test_responses_are_cached(mock_site_session):
+    config = mock_server.MockSiteConfig(peps=3, page_size=500)
+    with mock_server.MockH2Server(config) as server:
+        session = mock_site_session(server, MockHTTP2Adapter, http1=False)
+        first = session.get(PEP_URL)
+        second = session.get(PEP_URL)
+    assert first.raw.version == 20
+    assert not first.from_cache and second.from_cache, (
+        'Ответы, полученные по HTTP/2, должны кешироваться CachedSession'
+    )
+    assert second.text == first.text and 'PEP 1' in second.text
+
+
+def test_http1_fallback(mock_site_session):
+    config = mock_server.MockSiteConfig(peps=3, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server, MockHTTP2Adapter, http1=False)
+        adapter = session.mock_adapter
+        response = session.get(PEP_URL)
+    assert response.status_code == 200 and 'PEP 1' in response.text, (
+        'Если сервер не поддерживает HTTP/2, запрос должен быть '
+        'выполнен по HTTP/1.1'
+    )
+    assert adapter.http1_hosts
+
+
+def test_stream_uses_http1(mock_site_session):
+    config = mock_server.MockSiteConfig(peps=3, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server, MockHTTP2Adapter, http1=False)
+        adapter = session.mock_adapter
+        with session.get(PEP_URL, stream=True) as response:
+            assert 'PEP 1' in response.text
+    assert response.raw.version == 11 and not adapter.http1_hosts, (
+        'Потоковые запросы должны выполняться транспортом по умолчанию, '
+        'не загружая тело ответа в память'
+    )
+
+
+def test_clients_follow_verify():
+    adapter = http2.HTTP2Adapter()
+    insecure = adapter.get_client(False, None)
+    assert insecure is adapter.get_client(False, None)
+    assert insecure is not adapter.get_client(True, None), (
+        'Запросы с разными verify и cert должны использовать разные клиенты'
+    )
+    assert http2.create_ssl_context(False, None).verify_mode == ssl.CERT_NONE
+    assert http2.create_ssl_context(True, None).check_hostname
+    adapter.close()
+    assert not adapter.clients
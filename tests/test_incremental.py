@@ -0,0 +1,60 @@
+from argparse import Namespace
+
+import pytest
+try:
+    from src import incremental, main, mock_server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `incremental.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `incremental.py`'
+
+VERSIONS = 6
+LATEST = incremental.UtilityConstants.REFRESH_LATEST_PAGES
+
+
+@pytest.fixture
+def run_whats_new(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+
+    def run(seed=0, **options):
+        config = mock_server.MockSiteConfig(versions=VERSIONS, page_size=500,
+                                            seed=seed)
+        with mock_server.MockSiteServer(config) as server:
+            session = mock_site_session(server)
+            got = main.whats_new(session, Namespace(**options))
+        return got, len(session.mock_adapter.latencies)
+
+    return run
+
+
+def test_stale_links():
+    links = ['3.13.html', '3.12.html', '3.11.html', '3.10.html']
+    pages = {link: {} for link in links[:3]}
+    assert incremental.stale_links(links, pages) == (
+        links[:LATEST] + ['3.10.html']
+    )
+
+
+def test_routine_run_fetches_latest_only(run_whats_new):
+    first, requests_made = run_whats_new()
+    assert requests_made == VERSIONS + 1
+    second, requests_made = run_whats_new()
+    assert requests_made == 1 + LATEST, (
+        'Повторный запуск должен загружать только оглавление '
+        'и новейшие статьи'
+    )
+    assert second == first, 'Сохранённые строки должны попадать в вывод'
+
+
+def test_changed_pages_are_reparsed(run_whats_new):
+    first, _ = run_whats_new()
+    second, _ = run_whats_new(seed=1)
+    assert second[1:1 + LATEST] != first[1:1 + LATEST], (
+        'Изменившиеся новейшие статьи должны разбираться заново'
+    )
+    assert second[1 + LATEST:] == first[1 + LATEST:]
+    full, requests_made = run_whats_new(seed=1, full_refresh=True)
+    assert requests_made == VERSIONS + 1
+    assert full[1 + LATEST:] != first[1 + LATEST:], (
+        'С флагом --full-refresh должны загружаться все статьи'
+    )
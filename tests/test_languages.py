@@ -0,0 +1,61 @@
+from argparse import Namespace
+
+import pytest
+import requests_mock
+from requests_cache import CachedSession
+try:
+    from src import languages, main, mock_server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `languages.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `languages.py`'
+
+LANGUAGES = ('en', 'fr', 'zh-cn')
+
+
+@pytest.fixture
+def site_session(mock_site_session):
+    config = mock_server.MockSiteConfig(versions=4, page_size=500,
+                                        languages=LANGUAGES)
+    with mock_server.MockSiteServer(config) as server:
+        yield mock_site_session(server)
+
+
+@pytest.mark.parametrize('language, expected', [
+    ('en', 'https://docs.python.org/3/'),
+    ('zh-cn', 'https://docs.python.org/zh-cn/3/'),
+])
+def test_edition_url(language, expected):
+    assert languages.edition_url(language) == expected
+
+
+def test_discover_languages_fallback():
+    session = CachedSession(backend='memory')
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(requests_mock.ANY, requests_mock.ANY,
+                         status_code=404)
+    session.mount('https://', adapter)
+    assert languages.discover_languages(session) == list(
+        languages.UtilityConstants.DOC_LANGUAGES
+    ), 'Если список языков недоступен, должен использоваться известный'
+
+
+def test_whats_new_by_language(site_session):
+    got = main.whats_new(
+        site_session, Namespace(languages=['all'], max_connections=4)
+    )
+    assert got.header[0] == 'Язык'
+    assert [row[0] for row in got.iter_rows()] == [
+        language for language in LANGUAGES for _ in range(4)
+    ], 'Результаты должны содержать статьи каждой языковой версии'
+    assert got[5][1] == 'https://docs.python.org/fr/3/whatsnew/3.3.html'
+
+
+def test_latest_versions_by_language(site_session):
+    got = main.latest_versions(
+        site_session, Namespace(languages=['ja', 'fr'], max_connections=2)
+    )
+    assert {row[0] for row in got.iter_rows()} == {'fr'}, (
+        'Недоступные языковые версии должны пропускаться'
+    )
+    assert got.row_count == 5
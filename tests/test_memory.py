@@ -0,0 +1,131 @@
+import argparse
+import logging
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+try:
+    from src import main, memory, mock_server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `memory.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `memory.py`'
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('1024', 1024),
+    ('512k', 512 * 1024),
+    ('256M', 256 * 1024 ** 2),
+    ('1.5GB', int(1.5 * 1024 ** 3)),
+])
+def test_parse_size(value, expected):
+    assert memory.parse_size(value) == expected
+
+
+def test_parse_size_invalid():
+    with pytest.raises(argparse.ArgumentTypeError):
+        memory.parse_size('много')
+
+
+class InFlight:
+    """Функция-загрузчик, запоминающая максимум одновременных вызовов."""
+
+    def __init__(self):
+        self.running = self.peak = 0
+        self.concurrency = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.concurrency[item] = self.running
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return item
+
+
+def test_fetch_ordered_respects_budget():
+    fetch = InFlight()
+    got = [
+        future.result() for _, future in main.fetch_ordered(
+            fetch, range(20), workers=8, budget=memory.MemoryBudget(1)
+        )
+    ]
+    assert got == list(range(20)), 'Порядок результатов должен сохраняться'
+    assert fetch.peak <= 2, (
+        'При превышении лимита памяти страницы должны загружаться по одной'
+    )
+
+
+def test_fetch_ordered_single_worker_does_not_prefetch():
+    calls = []
+
+    def fetch(item):
+        calls.append(item)
+        if item == 2:
+            raise ConnectionError(item)
+        return item
+
+    for item, future in main.fetch_ordered(fetch, range(5), workers=1):
+        assert calls == list(range(item + 1)), (
+            'С одним потоком страницы не должны загружаться заранее'
+        )
+        if item == 2:
+            with pytest.raises(ConnectionError):
+                future.result()
+        else:
+            assert future.result() == item
+
+
+class FlippingBudget:
+    """Лимит памяти, превышаемый начиная с заданной проверки."""
+
+    def __init__(self, checks):
+        self.checks = checks
+
+    def exceeded(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_fetch_ordered_drains_when_budget_crossed():
+    fetch = InFlight()
+    got = [
+        future.result() for _, future in main.fetch_ordered(
+            fetch, range(40), workers=8, budget=FlippingBudget(10)
+        )
+    ]
+    assert got == list(range(40))
+    assert fetch.peak > 2
+    assert max(fetch.concurrency[item] for item in range(20, 40)) == 1, (
+        'После превышения лимита памяти новые страницы должны загружаться '
+        'только после обработки уже запущенных'
+    )
+
+
+def test_pep_with_memory_budget(
+        monkeypatch, tmp_path, caplog, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=10, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        with caplog.at_level(logging.WARNING):
+            got = main.pep(session, Namespace(resume=False, http2=True,
+                                              max_memory=1))
+    assert int(got[-1][1]) == config.peps
+    assert caplog.text.count('страницы загружаются по одной') == 1
+
+
+def test_memory_report(caplog):
+    with caplog.at_level(logging.INFO):
+        with memory.memory_report(True, 'pep'):
+            data = [bytearray(1024) for _ in range(1000)]
+    assert data
+    assert 'Режим pep: пиковая резидентная память' in caplog.text
+    assert 'test_memory.py' in caplog.text, (
+        'Отчёт должен указывать места, выделившие больше всего памяти'
+    )
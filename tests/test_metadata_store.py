@@ -0,0 +1,70 @@
+from argparse import Namespace
+
+from bs4 import BeautifulSoup
+try:
+    from src import main, metadata_store, mock_server
+except ModuleNotFoundError:
+    assert False, (
+        'Убедитесь что в директории `src` есть файл `metadata_store.py`'
+    )
+except ImportError:
+    assert False, (
+        'Убедитесь что в директории `src` есть файл `metadata_store.py`'
+    )
+
+PEP_PAGE = '''
+<section id="pep-content"><h1>PEP 572 – Assignment Expressions</h1>
+<dl class="rfc2822 field-list simple">
+<dt class="field-odd">Author<span class="colon">:</span></dt>
+<dd class="field-odd">Chris Angelico, Tim Peters, Guido van Rossum</dd>
+<dt class="field-even">Status<span class="colon">:</span></dt>
+<dd class="field-even"><abbr title="Accepted">Final</abbr></dd>
+<dt class="field-odd">Python-Version<span class="colon">:</span></dt>
+<dd class="field-odd">3.8</dd>
+<dt class="field-even">Post-History<span class="colon">:</span></dt>
+<dd class="field-even">28-Feb-2018</dd>
+</dl></section>
+'''
+
+
+def test_parse_pep_metadata():
+    got = metadata_store.parse_pep_metadata(BeautifulSoup(PEP_PAGE, 'lxml'))
+    assert got == {
+        'author': 'Chris Angelico, Tim Peters, Guido van Rossum',
+        'status': 'Final',
+        'python_version': '3.8',
+        'post_history': '28-Feb-2018',
+    }
+
+
+def test_pep_fills_store_for_pep_query(
+        monkeypatch, tmp_path, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=30, page_size=200)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        statuses = dict(main.pep(session)[1:-1])
+    got = main.pep_query(None, Namespace(group_by=['status']))
+    assert got[0] == ('Статус', 'Количество')
+    assert {status: int(count) for status, count in got[1:-1]} == statuses, (
+        'Группировка по статусу должна совпадать с результатами режима pep'
+    )
+    got = main.pep_query(None, Namespace(group_by=['status', 'type']))
+    assert sum(int(row[-1]) for row in got[1:-1]) == 30
+    assert got[-1] == ('Итого', '', '30')
+
+
+def test_metadata_file_argument(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path / 'app')
+    metadata_file = tmp_path / 'mock.sqlite3'
+    config = mock_server.MockSiteConfig(peps=5, page_size=200)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        main.pep(session, Namespace(metadata_file=metadata_file))
+    assert not (tmp_path / 'app' / 'pep_metadata.sqlite3').exists(), (
+        'С аргументом --metadata-file хранилище в каталоге приложения '
+        'не должно изменяться'
+    )
+    got = main.pep_query(None, Namespace(metadata_file=metadata_file))
+    assert got[-1] == ('Итого', '5')
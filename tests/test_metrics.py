@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+import requests_mock
+from requests_cache import CachedSession
+try:
+    from src import metrics, utils
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `metrics.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `metrics.py`'
+
+URL = 'https://docs.python.org/3/'
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    registry.mode = 'whats-new'
+    monkeypatch.setattr(utils, 'METRICS', registry)
+    return registry
+
+
+def test_render_format():
+    registry = metrics.MetricsRegistry()
+    registry.mode = 'pep'
+    registry.inc('parser_requests_total', source='network')
+    registry.observe('parser_parse_duration_seconds', 0.02)
+    registry.observe('parser_parse_duration_seconds', 3)
+    lines = registry.render().splitlines()
+    assert '# TYPE parser_requests_total counter' in lines
+    assert (
+        'parser_requests_total{mode="pep",source="network"} 1.0' in lines
+    )
+    assert (
+        'parser_parse_duration_seconds_bucket{mode="pep",le="0.025"} 1'
+        in lines
+    ), 'Гистограмма должна содержать накопительные значения корзин'
+    assert (
+        'parser_parse_duration_seconds_bucket{mode="pep",le="+Inf"} 2'
+        in lines
+    )
+    assert 'parser_parse_duration_seconds_count{mode="pep"} 2' in lines
+
+
+def test_format_labels_escaping():
+    assert metrics.format_labels((('type', 'a"b\\c'),)) == (
+        '{type="a\\"b\\\\c"}'
+    )
+
+
+def test_get_response_counters(registry):
+    session = CachedSession(backend='memory')
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('GET', URL, text='<html></html>')
+    adapter.register_uri('GET', URL + 'missing', status_code=404)
+    session.mount('https://', adapter)
+    utils.get_response(session, URL)
+    utils.get_response(session, URL)
+    with pytest.raises(ConnectionError):
+        utils.get_response(session, URL + 'missing')
+    assert registry.value('parser_requests_total', source='network') == 2
+    assert registry.value('parser_requests_total', source='cache') == 1, (
+        'Ответы из кеша должны учитываться отдельно'
+    )
+    assert registry.value('parser_request_errors_total') == 1
+    registry.finish_run(rows=3, duration=1.5, success=True)
+    assert registry.value('parser_cache_hit_ratio') == pytest.approx(1 / 3)
+    assert registry.value('parser_result_rows') == 3
+
+
+def test_write_textfile(registry, tmp_path):
+    registry.finish_run(rows=None, duration=0.5, success=False)
+    path = registry.write_textfile(tmp_path)
+    assert path.name == 'bs4_parser_pep_whats-new.prom'
+    text = path.read_text(encoding='utf-8')
+    assert 'parser_run_success{mode="whats-new"} 0' in text
+    assert 'parser_result_rows' not in text
+
+
+def test_push(registry):
+    with requests_mock.Mocker() as mock:
+        mock.put(requests_mock.ANY)
+        registry.push('http://127.0.0.1:9091/')
+        assert mock.last_request.url == (
+            'http://127.0.0.1:9091/metrics/job/bs4_parser_pep/mode/whats-new'
+        )
+
+
+def test_progress_logs_without_tty(monkeypatch, caplog):
+    monkeypatch.setattr(metrics.sys.stdout, 'isatty', lambda: False)
+    with caplog.at_level(logging.INFO):
+        got = list(metrics.progress(range(3), 'Парсинг'))
+    assert got == [0, 1, 2]
+    assert 'Парсинг: обработано 3 из 3' in caplog.text, (
+        'Без терминала ход обработки должен выводиться в лог'
+    )
@@ -0,0 +1,68 @@
+import pytest
+try:
+    from src import load_test, main, mock_server, utils
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `mock_server.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `mock_server.py`'
+
+
+def test_pep_against_mock_site(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=25, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        got = main.pep(mock_site_session(server))
+    assert got[-1] == ('Итого', '25'), (
+        'Парсер должен обработать все PEP, сгенерированные сервером'
+    )
+
+
+def test_whats_new_against_mock_site(
+        monkeypatch, tmp_path, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(versions=3, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        got = main.whats_new(mock_site_session(server))
+    assert [row[1] for row in got[1:]] == [
+        'What’s New In Python 3.2',
+        'What’s New In Python 3.1',
+        'What’s New In Python 3.0',
+    ]
+
+
+def test_server_errors_raise_connection_error(mock_site_session):
+    config = mock_server.MockSiteConfig(error_rate=1.0)
+    with mock_server.MockSiteServer(config) as server:
+        with pytest.raises(ConnectionError):
+            utils.get_response(
+                mock_site_session(server), main.PEP_MAIN_URL
+            )
+
+
+@pytest.mark.parametrize('mode', load_test.LOAD_TEST_MODES)
+def test_load_test_keeps_base_dir(monkeypatch, tmp_path, mode):
+    monkeypatch.setattr(load_test.parser_main, 'BASE_DIR', tmp_path)
+    checkpoint = tmp_path / 'checkpoints' / 'pep.json'
+    checkpoint.parent.mkdir()
+    checkpoint.write_text('{}')
+    config = mock_server.MockSiteConfig(peps=5, versions=3, page_size=500)
+    with mock_server.MockSiteServer(config) as server:
+        load_test.run_load_test(server, mode)
+    assert load_test.parser_main.BASE_DIR == tmp_path
+    assert list(tmp_path.rglob('*')) == [checkpoint.parent, checkpoint], (
+        'Нагрузочный тест не должен менять данные в каталоге приложения'
+    )
+    assert checkpoint.read_text() == '{}'
+
+
+def test_load_test_survives_failed_mode(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(load_test.parser_main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(error_rate=1.0)
+    with mock_server.MockSiteServer(config) as server:
+        row = load_test.run_load_test(server, 'whats-new')
+    assert row[:2] == ('whats-new', 'Прерван'), (
+        'Ошибка режима не должна прерывать нагрузочный тест'
+    )
+    assert row[3] == 1
+    assert 'Нагрузочный тест режима whats-new прерван' in caplog.text
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+import pytest
+import requests_mock
+from requests_cache import CachedSession
+try:
+    from src import page_store, policies, utils
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `page_store.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `page_store.py`'
+
+PEP_URL = 'https://peps.python.org/pep-0008/'
+PAGE = '<html><body><h1>PEP 8 – Style Guide</h1></body></html>'
+
+
+@pytest.fixture
+def store(tmp_path):
+    with page_store.PageStore(tmp_path / 'pages') as store:
+        yield store
+
+
+def test_put_deduplicates(store):
+    body = PAGE.encode('utf-8')
+    digest = store.put(PEP_URL, body)
+    assert store.put(PEP_URL + '?copy=1', body) == digest
+    assert store.stats() == {'urls': 2, 'objects': 1, 'bytes': len(body)}, (
+        'Одинаковые страницы по разным адресам должны храниться один раз'
+    )
+    with store.get(PEP_URL + '?copy=1') as page:
+        assert page[:] == body
+    assert store.get('https://peps.python.org/pep-0009/') is None
+
+
+def test_invalidate_prunes_unreferenced(store):
+    store.put(PEP_URL, b'first')
+    store.put(PEP_URL + '?copy=1', b'first')
+    store.put('https://docs.python.org/3/', b'second')
+    assert store.invalidate(['peps.python.org/*']) == 2
+    assert store.stats()['objects'] == 1
+    assert store.get('https://docs.python.org/3/') is not None
+    assert store.invalidate(older_than=timedelta(hours=1)) == 0
+    store.clear()
+    assert store.stats() == {'urls': 0, 'objects': 0, 'bytes': 0}
+
+
+def test_get_soup_reads_store(store):
+    session = CachedSession(backend='memory')
+    session.page_store = store
+    adapter = requests_mock.Adapter()
+    session.mount('https://', adapter)
+    adapter.register_uri('GET', PEP_URL, text=PAGE)
+    first = utils.get_soup(session, PEP_URL)
+    assert not list(session.cache.responses.keys()), (
+        'Страница из хранилища не должна дублироваться в кеше ответов'
+    )
+    adapter.register_uri('GET', PEP_URL, status_code=500)
+    second = utils.get_soup(session, PEP_URL)
+    assert adapter.call_count == 1, (
+        'Страница из хранилища не должна загружаться повторно'
+    )
+    assert second.h1.text == first.h1.text == 'PEP 8 – Style Guide'
+
+
+def test_store_respects_expire_after_and_deadline(store):
+    session = CachedSession(backend='memory', expire_after=60)
+    session.page_store = store
+    store.put(PEP_URL, PAGE.encode('utf-8'))
+    assert utils.read_page(session, PEP_URL) is not None
+    store.connection.execute('UPDATE pages SET stored_at = stored_at - 120')
+    with requests_mock.Mocker(session=session) as mock:
+        mock.get(PEP_URL, text=PAGE.replace('8', '9'))
+        assert 'PEP 9' in utils.get_soup(session, PEP_URL).h1.text, (
+            'Страница старше expire_after сессии должна загружаться заново'
+        )
+    session.deadline = policies.Deadline(0)
+    with pytest.raises(utils.DeadlineExceededException):
+        utils.read_page(session, PEP_URL)
@@ -0,0 +1,82 @@
+import time
+
+import pytest
+try:
+    from src import main, mock_server, policies, utils
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `policies.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `policies.py`'
+
+
+class SlowFirstSession:
+    """Сессия, у которой первый запрос к странице `slow` зависает."""
+
+    def __init__(self):
+        self.calls = []
+        self.timeouts = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        self.timeouts.append(timeout)
+        if url == 'slow' and self.calls.count(url) == 1:
+            time.sleep(1)
+            return 'stalled response'
+        return f'{url} response'
+
+
+def test_percentile():
+    assert policies.percentile([], 0.95) == 0.0
+    assert policies.percentile(list(range(1, 101)), 0.95) == 96
+
+
+def test_hedging_takes_first_response():
+    session = SlowFirstSession()
+    policy = policies.HedgingPolicy(min_samples=3)
+    for url in ('a', 'b', 'c'):
+        policy.get(session, url, None)
+    started = time.monotonic()
+    got = policy.get(session, 'slow', None)
+    assert got == 'slow response' and policy.hedged == 1, (
+        'Медленный запрос должен быть продублирован'
+    )
+    assert time.monotonic() - started < 0.5
+    assert session.calls.count('slow') == 2
+
+
+def test_hedged_requests_are_bounded():
+    session = SlowFirstSession()
+    policy = policies.HedgingPolicy(min_samples=1, timeout=5)
+    policy.get(session, 'a', None)
+    policy.get(session, 'b', 2)
+    assert session.timeouts == [5, 2], (
+        'Запросы без таймаута должны ограничиваться таймаутом политики'
+    )
+    policy.close()
+    with pytest.raises(RuntimeError):
+        policy.get(session, 'c', None)
+
+
+def test_pep_deadline_marks_results_incomplete(
+        monkeypatch, tmp_path, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=50, page_size=500, latency=0.02)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        session.deadline = policies.Deadline(0.3)
+        got = main.pep(session)
+    assert not got.complete, (
+        'Результаты, собранные после исчерпания бюджета времени, '
+        'должны быть помечены как неполные'
+    )
+    assert int(got[-1][1]) < config.peps
+
+
+def test_deadline_timeout_is_not_connection_error(mock_site_session):
+    config = mock_server.MockSiteConfig(latency=1)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        session.deadline = policies.Deadline(0.2)
+        with pytest.raises(utils.DeadlineExceededException):
+            utils.get_response(session, main.PEP_MAIN_URL)
@@ -0,0 +1,64 @@
+from argparse import Namespace
+
+import pytest
+try:
+    from src import main, mock_server, search_index
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `search_index.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `search_index.py`'
+
+DOCUMENTS = {
+    'pep-0634': ('Structural Pattern Matching', 'the match statement and '
+                 'pattern matching with a match case'),
+    'pep-0572': ('Assignment Expressions', 'assignment expressions use '
+                 'the walrus operator in a statement'),
+    'pep-0008': ('Style Guide', 'statement style and match guide'),
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    with search_index.SearchIndex(tmp_path / 'index.sqlite3') as index:
+        for url, (title, text) in DOCUMENTS.items():
+            index.add_document(url, title, text)
+        yield index
+
+
+def test_search_ranks_by_relevance(index):
+    got = [url for url, _, _ in index.search('match')]
+    assert got == ['pep-0634', 'pep-0008'], (
+        'Документы с большим числом вхождений слова должны быть выше'
+    )
+
+
+def test_search_phrase(index):
+    got = [url for url, _, _ in index.search('"match statement"')]
+    assert got == ['pep-0634'], 'Фраза в кавычках должна искаться целиком'
+
+
+def test_unchanged_documents_are_not_reindexed(index):
+    index.add_document('pep-0008', *DOCUMENTS['pep-0008'])
+    index.add_document('pep-0008', 'Style Guide', 'updated walrus text')
+    assert (index.indexed, index.unchanged) == (4, 1)
+    assert [url for url, _, _ in index.search('walrus')] == [
+        'pep-0008', 'pep-0572'
+    ]
+    assert index.search('guide') == [], (
+        'Слова из прежней версии документа должны удаляться из индекса'
+    )
+
+
+def test_pep_index_and_search(monkeypatch, tmp_path, mock_site_session):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    config = mock_server.MockSiteConfig(peps=10, page_size=300)
+    with mock_server.MockSiteServer(config) as server:
+        session = mock_site_session(server)
+        got = main.pep_index(session, Namespace(resume=False))
+        assert got[1] == ('10', '10', '0')
+        got = main.pep_index(session, Namespace(resume=False))
+        assert got[1] == ('10', '0', '10')
+    got = main.pep_search(None, Namespace(query='"Proposal 7"', limit=5))
+    assert [row[0] for row in got[1:]] == [
+        main.PEP_MAIN_URL + 'pep-0007/'
+    ]
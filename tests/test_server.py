@@ -0,0 +1,93 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from argparse import Namespace
+
+import pytest
+try:
+    from src import main, mock_server, server
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `server.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `server.py`'
+
+
+def broken_mode(session, cli_args=None):
+    raise RuntimeError('Сломанный режим')
+
+
+@pytest.fixture
+def results_server(mock_site_session):
+    store = server.ResultsStore()
+    config = mock_server.MockSiteConfig(versions=3)
+    with mock_server.MockSiteServer(config) as site:
+        session = mock_site_session(site)
+        server.refresh_results(
+            session, store,
+            {'latest-versions': main.latest_versions, 'broken': broken_mode},
+            Namespace()
+        )
+    results_server = server.ResultsServer(store, '127.0.0.1', 0)
+    threading.Thread(target=results_server.serve_forever, daemon=True).start()
+    host, port = results_server.server_address[:2]
+    yield f'http://{host}:{port}/'
+    results_server.shutdown()
+    results_server.server_close()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode('utf-8')
+
+
+def test_serve_json(results_server):
+    got = json.loads(fetch(results_server + 'latest-versions.json'))
+    assert got['header'] == ['Ссылка на документацию', 'Версия', 'Статус']
+    assert got['rows'][0] == ['https://docs.python.org/3.2/', '3.2', 'stable']
+    assert list(json.loads(fetch(results_server))) == ['latest-versions']
+
+
+def test_serve_csv(results_server):
+    got = fetch(results_server + 'latest-versions.csv').splitlines()
+    assert got[0] == 'Ссылка на документацию,Версия,Статус'
+    assert len(got) == 5
+
+
+def test_failed_mode_is_not_served(results_server):
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        fetch(results_server + 'broken.json')
+    assert excinfo.value.code == 404
+
+
+def test_serve_expires_cached_pages(monkeypatch, mock_site_session):
+    monkeypatch.setattr(main, 'serve_results', lambda *args: None)
+    config = mock_server.MockSiteConfig(versions=3)
+    with mock_server.MockSiteServer(config) as site:
+        session = mock_site_session(site)
+        main.latest_versions(session)
+    main.serve(session, Namespace(refresh_interval=60))
+    assert session.settings.expire_after == 60
+    responses = list(session.cache.responses.values())
+    assert responses and all(
+        response.is_expired for response in responses
+    ), 'Записи, сохранённые до запуска сервиса, должны перепроверяться'
+
+
+def test_served_pep_removes_checkpoint(
+        monkeypatch, tmp_path, mock_site_session
+):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    served = {}
+    monkeypatch.setattr(main, 'serve_results',
+                        lambda session, modes, cli_args: served.update(modes))
+    config = mock_server.MockSiteConfig(peps=5, versions=3, page_size=500)
+    with mock_server.MockSiteServer(config) as site:
+        session = mock_site_session(site)
+        main.serve(session, Namespace(refresh_interval=60))
+        store = server.ResultsStore()
+        server.refresh_results(session, store, served, Namespace())
+    assert json.loads(store.get('pep', 'json'))['rows'][-1] == ['Итого', '5']
+    assert not list(tmp_path.glob('checkpoints/*')), (
+        'Обновление в режиме сервиса не должно оставлять контрольных точек'
+    )
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+from prettytable import PrettyTable
+try:
+    from src import outputs, table_renderer, tables
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `table_renderer.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `table_renderer.py`'
+
+HEADER = ('Ссылка на статью', 'Заголовок', 'Редактор, Автор')
+
+
+def pretty(header, rows):
+    table = PrettyTable()
+    table.field_names = header
+    table.align = 'l'
+    table.add_rows(rows)
+    return table.get_string()
+
+
+@pytest.mark.parametrize('rows', [
+    [],
+    [('https://docs.python.org/3/whatsnew/3.12.html', 'What’s New', 'A')],
+    [('a', 'Многострочная\nячейка', ''), ('b', 'c', 'Editor:\tJane')],
+    [('中文字', 'ширина', 3), ('x', None, 1.5)],
+])
+def test_render_table_matches_prettytable(rows):
+    got = '\n'.join(table_renderer.render_table(HEADER, rows))
+    assert got == pretty(HEADER, rows), (
+        'Вывод table_renderer должен совпадать с PrettyTable'
+    )
+
+
+def test_render_table_sample_truncates():
+    rows = [('a', 'b', 'c')] * 3 + [('long value', 'b', 'c')]
+    got = list(
+        table_renderer.render_table(('x', 'y', 'z'), iter(rows), sample=3)
+    )
+    widths = {len(line) for line in got}
+    assert len(widths) == 1, (
+        'При вычислении ширины по выборке значения должны обрезаться'
+    )
+    assert got[-2].startswith('| … |')
+
+
+def test_pretty_output_streams_incomplete_marker(capsys):
+    table = tables.ResultTable(('Статус', 'Количество'), [('Active', '3')])
+    table.complete = False
+    outputs.pretty_output(table)
+    got = capsys.readouterr().out
+    assert tables.Literals.INCOMPLETE_RESULTS in got
+    assert got.rstrip('\n') == pretty(
+        table.header, [*table.iter_rows(), table.marker_row()]
+    )
+
+
+def test_pager_is_not_used_for_files():
+    buffer = io.StringIO()
+    with table_renderer.pager(10_000, buffer) as output:
+        assert output is buffer
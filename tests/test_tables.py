@@ -0,0 +1,51 @@
+import io
+
+import pytest
+try:
+    from src import outputs, tables
+except ModuleNotFoundError:
+    assert False, 'Убедитесь что в директории `src` есть файл `tables.py`'
+except ImportError:
+    assert False, 'Убедитесь что в директории `src` есть файл `tables.py`'
+
+HEADER = ('Статус', 'Количество')
+ROWS = [('Active', '3'), ('Final', '5')]
+
+
+def test_result_table_keeps_list_format():
+    table = tables.ResultTable(HEADER, ROWS)
+    assert table == [HEADER, *ROWS], (
+        'ResultTable должна оставаться списком кортежей с заголовком'
+    )
+    assert table.header == HEADER
+    assert table.row_count == len(ROWS)
+    assert list(table.iter_rows()) == ROWS
+    assert table.columns() == [('Active', 'Final'), ('3', '5')]
+
+
+def test_coerce_legacy_results():
+    table = tables.ResultTable.coerce([HEADER, *ROWS])
+    assert isinstance(table, tables.ResultTable)
+    assert table.complete
+    assert tables.ResultTable.coerce(table) is table
+
+
+def test_incomplete_results_marker():
+    table = tables.ResultTable(HEADER, ROWS)
+    table.complete = False
+    buffer = io.StringIO()
+    outputs.write_csv(buffer, table)
+    lines = buffer.getvalue().splitlines()
+    assert lines[-1].startswith(tables.Literals.INCOMPLETE_RESULTS), (
+        'После неполных результатов должна выводиться строка-маркер'
+    )
+    assert table.row_count == len(ROWS), (
+        'Строка-маркер не должна добавляться в сами результаты'
+    )
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip('pyarrow')
+    got = pyarrow.table(tables.ResultTable(HEADER, ROWS))
+    assert got.column_names == list(HEADER)
+    assert got.num_rows == len(ROWS)